@@ -0,0 +1,213 @@
+import argparse
+import json
+import platform
+import statistics
+import time
+import traceback
+from datetime import datetime
+
+import pandas as pd
+
+from data_loader import LOW_MEMORY, prepare_tables
+from headless_st import PAGES, HeadlessSt, import_pages, load_tables, render_page
+from league_facts import add_fact_tables, add_partitions, rows
+from perf import collect_sections, memory_report
+from synthetic_league import generate_league
+
+# -----------------------------
+# Per-tab benchmark: every page, every selectable season/owner, several data sizes
+# -----------------------------
+#   python bench_tabs.py --out bench.json                     # default sizes
+#   python bench_tabs.py --size medium=12x9 --page season     # one size, one page
+#   python bench_tabs.py --data /tmp/league --out real.json   # a CSV dir or snapshot
+#   python bench_tabs.py --compare before.json after.json
+#
+# Pages report their own sections through perf.section_marks (season: rank_heatmap,
+# loo_diffs, drafted_vs_non, top_performances, outcome_cards, ...; team:
+# weekly_stack, treemap, matchup_table; draft: board_html, ...). Every page also
+# reports "build view" (the compute side, view_model.build_view) and "render view".
+
+# name -> (owners, seasons)
+DEFAULT_SIZES = {"small": (8, 3), "medium": (12, 9), "large": (20, 30)}
+
+
+def synthetic_tables(owners, seasons, seed=0):
+    """A generated league, prepared the way data_loader prepares the sheets."""
+    tables = prepare_tables(generate_league(n_owners=owners, n_seasons=seasons, seed=seed))
+    return add_partitions(add_fact_tables(tables), lazy=LOW_MEMORY)
+
+
+def scenarios(tables, pages=None):
+    """(page, selections) for every season/owner a user can pick on each page."""
+    teams = tables["teams"]
+    seasons = sorted(int(y) for y in teams["year"].dropna().unique())
+    owners = sorted(teams["owner_name"].dropna().astype(str).unique())
+    draft_seasons = sorted((y for y in tables["season_index"]["draft_roster"] if y is not None), reverse=True)
+
+    out = {
+        "season": [{"season_insights_year": y} for y in seasons],
+        "team": [
+            {"owner_select": o, f"year_for_{o}": int(y)}
+            for o in owners
+            for y in sorted(rows(tables["owner_index"], "teams", o)["year"].dropna().unique(), reverse=True)
+            if int(y) != 2017
+        ],
+        "owner": [{"owner_history_select": o} for o in owners],
+        "league": [{"league_current_owners": flag} for flag in (True, False)],
+        "hall_of_fame": [{}],
+        "draft": [{"draft_board_year": str(y)} for y in draft_seasons],
+    }
+    return [(page, sel) for page in (pages or PAGES) for sel in out[page]]
+
+
+def _summary(values):
+    return {
+        "n": len(values),
+        "total": round(sum(values), 6),
+        "mean": round(statistics.fmean(values), 6),
+        "median": round(statistics.median(values), 6),
+        "max": round(max(values), 6),
+    }
+
+
+def run_size(tables, pages=None, repeat=1):
+    """Render every scenario `repeat` times; per-run records plus per-page/section summaries."""
+    runs = []
+    for page, selections in scenarios(tables, pages):
+        for _ in range(repeat):
+            st = HeadlessSt(selections)
+            error = None
+            with collect_sections() as sections:
+                try:
+                    seconds = render_page(page, st, tables)
+                except Exception:
+                    seconds = None
+                    error = traceback.format_exc().splitlines()[-1]
+            runs.append({
+                "page": page,
+                "selection": dict(selections),
+                "seconds": seconds,
+                "sections": {s["section"]: s["seconds"] for s in sections if s["page"] == page},
+                "error": error,
+            })
+
+    pages_out = {}
+    for page in dict.fromkeys(r["page"] for r in runs):
+        ok = [r for r in runs if r["page"] == page and r["error"] is None]
+        entry = {"errors": sum(1 for r in runs if r["page"] == page and r["error"])}
+        if ok:
+            entry.update(_summary([r["seconds"] for r in ok]))
+            names = dict.fromkeys(name for r in ok for name in r["sections"])
+            entry["sections"] = {
+                name: _summary([r["sections"][name] for r in ok if name in r["sections"]]) for name in names
+            }
+        pages_out[page] = entry
+    return {"pages": pages_out, "runs": runs}
+
+
+def _table_rows(tables):
+    return {name: len(tables[name]) for name in ("teams", "matchups", "players", "draft_roster")}
+
+
+def run_bench(sizes, data_dirs=(), pages=None, repeat=1, seed=0, log=print):
+    result = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "repeat": repeat,
+        "sizes": {},
+    }
+    datasets = [(name, lambda o=o, s=s: synthetic_tables(o, s, seed), {"owners": o, "seasons": s})
+                for name, (o, s) in sizes.items()]
+    datasets += [(str(d), lambda d=d: load_tables(d), {"data": str(d)}) for d in data_dirs]
+    import_pages()
+
+    for name, build, params in datasets:
+        start = time.perf_counter()
+        tables = build()
+        load_seconds = time.perf_counter() - start
+        # Sizes every derived table too, so a table memory_report can't walk fails here
+        data_mb = memory_report(tables)["bytes"].sum() / 1e6
+        log(f"{name}: {_table_rows(tables)}  load {load_seconds:.2f}s  {data_mb:.1f} MB")
+        out = run_size(tables, pages, repeat)
+        result["sizes"][name] = {**params, "rows": _table_rows(tables), "load_seconds": round(load_seconds, 6),
+                                 "data_mb": round(data_mb, 3), **out}
+        for line in format_pages(out["pages"]):
+            log("  " + line)
+    return result
+
+
+# -----------------------------
+# Reporting
+# -----------------------------
+def format_pages(pages):
+    lines = []
+    for page, entry in pages.items():
+        if "mean" not in entry:
+            lines.append(f"{page:<24} all {entry['errors']} renders failed")
+            continue
+        errors = f"  ({entry['errors']} failed)" if entry["errors"] else ""
+        lines.append(f"{page:<24} n={entry['n']:<4} mean {entry['mean'] * 1000:8.1f}ms  max {entry['max'] * 1000:8.1f}ms{errors}")
+        for section, s in entry.get("sections", {}).items():
+            lines.append(f"  {section:<22}        mean {s['mean'] * 1000:8.1f}ms  max {s['max'] * 1000:8.1f}ms")
+    return lines
+
+
+def compare(before, after):
+    """Lines of page/section mean times, before -> after, for the sizes both runs have."""
+    lines = []
+    for size in [s for s in after["sizes"] if s in before["sizes"]]:
+        lines.append(f"{size}")
+        b_pages, a_pages = before["sizes"][size]["pages"], after["sizes"][size]["pages"]
+        for page in a_pages:
+            if "mean" not in a_pages[page] or "mean" not in b_pages.get(page, {}):
+                continue
+            entries = [(page, b_pages[page]["mean"], a_pages[page]["mean"])]
+            b_sec = b_pages[page].get("sections", {})
+            for section, s in a_pages[page].get("sections", {}).items():
+                if section in b_sec:
+                    entries.append(("  " + section, b_sec[section]["mean"], s["mean"]))
+            for label, b, a in entries:
+                ratio = f"{a / b:6.2f}x" if b else "     -"
+                lines.append(f"  {label:<24} {b * 1000:8.1f}ms -> {a * 1000:8.1f}ms  {ratio}")
+    return lines
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+def _parse_size(text):
+    name, _, dims = text.partition("=")
+    owners, _, seasons = dims.lower().partition("x")
+    return name, (int(owners), int(seasons))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard tabs headlessly.")
+    parser.add_argument("--size", action="append", type=_parse_size, metavar="NAME=OWNERSxSEASONS",
+                        help="synthetic league size (repeatable; default: "
+                             + ", ".join(f"{k}={o}x{s}" for k, (o, s) in DEFAULT_SIZES.items()) + ")")
+    parser.add_argument("--data", action="append", default=[], help="also bench a CSV dir or snapshot")
+    parser.add_argument("--page", action="append", choices=list(PAGES), help="page(s) to bench (default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="renders per selection")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write results as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two result files and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        before, after = (json.loads(open(p).read()) for p in args.compare)
+        print("\n".join(compare(before, after)))
+        return 0
+
+    sizes = dict(args.size) if args.size else ({} if args.data else DEFAULT_SIZES)
+    result = run_bench(sizes, args.data, args.page, args.repeat, args.seed)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(result, f, indent=1)
+        print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# -----------------------------
+# Cold-start timing: every run is a fresh interpreter running main.py once per page
+# -----------------------------
+#   python synthetic_league.py generate --format parquet --out /tmp/league-snap
+#   python cold_start.py --data /tmp/league-snap
+#   python cold_start.py --data /tmp/league-snap --page Rulebook --runs 5
+#
+# Reports, per page: the first script run (imports, data load, render), a second
+# run (a rerun in the same process) and which heavy modules that page pulled in.
+# Runs against a snapshot dir so no network is involved.
+
+MAIN = Path(__file__).parent / "main.py"
+PAGES = ["Season Summary", "Team Summary", "Owner History", "League History",
+         "Hall of Fame/ Shame", "Draft Boards", "Rulebook"]
+# streamlit itself already imports plotly.graph_objects and components.v1
+HEAVY_MODULES = ("plotly.express",)
+
+
+def _child(page):
+    # Runs inside the fresh interpreter; prints one JSON line
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    framework = time.perf_counter() - start
+
+    at = AppTest.from_file(str(MAIN), default_timeout=300)
+    at.session_state["page_select"] = page
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    at.run()
+    rerun = time.perf_counter() - start
+
+    print(json.dumps({
+        "page": page,
+        "framework": framework,
+        "first_run": first,
+        "rerun": rerun,
+        "errors": [str(e.value) for e in at.exception],
+        "tab_modules": sorted(m for m in sys.modules if m.startswith("tab_")),
+        "heavy_modules": [m for m in HEAVY_MODULES if m in sys.modules],
+    }))
+
+
+def measure(page, data, runs):
+    env = {**os.environ, "LEAGUE_SNAPSHOT_DIR": str(data)}
+    env.setdefault("LEAGUE_DATA_TTL", str(10 ** 9))  # the snapshot counts as fresh: no refetch
+    results = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", page],
+            env=env, capture_output=True, text=True, check=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        result["process"] = time.perf_counter() - start
+        results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time cold starts of the dashboard, page by page.")
+    parser.add_argument("--data", help="snapshot directory to boot from (e.g. synthetic_league.py --format parquet)")
+    parser.add_argument("--page", action="append", choices=PAGES, help="page(s) to time (default: all)")
+    parser.add_argument("--runs", type=int, default=3, help="fresh processes per page (medians are reported)")
+    parser.add_argument("--out", help="write the raw runs as JSON")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.child)
+        return 0
+    if not args.data:
+        parser.error("--data is required")
+
+    all_runs = []
+    print(f"{'page':<20} {'process':>9} {'first run':>10} {'rerun':>9}  modules")
+    for page in args.page or PAGES:
+        runs = measure(page, args.data, args.runs)
+        all_runs += runs
+        med = {k: statistics.median(r[k] for r in runs) for k in ("process", "first_run", "rerun")}
+        mods = ", ".join(runs[-1]["tab_modules"] + runs[-1]["heavy_modules"]) or "-"
+        errors = "  ERROR: " + runs[-1]["errors"][0][:60] if runs[-1]["errors"] else ""
+        print(f"{page:<20} {med['process']:8.2f}s {med['first_run']:9.2f}s {med['rerun']:8.2f}s  {mods}{errors}")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(all_runs, f, indent=1)
+        print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,343 @@
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from types import MappingProxyType
+
+import pandas as pd
+import streamlit as st
+
+from data_schema import TABLE_SCHEMAS, apply_schema, canonicalize, slim_table
+from data_snapshot import read_snapshot, snapshot_age_seconds, write_snapshot
+from league_facts import add_fact_tables, add_partitions
+
+log = logging.getLogger(__name__)
+
+# One in-memory copy of the league data serves every session, so tabs must treat
+# the frames as read-only. Copy-on-write makes slices/derived frames safe to modify
+# without touching the shared data (it is always on from pandas 3).
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# -----------------------------
+# Google Sheets CSV export links
+# -----------------------------
+SHEET_BASE_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQvhSWRerxihgW73Bicic4j1wY052Cda0oES-97_oafR6WWueA5P6QN3Vsrv0pknHGwrw4pJ8EBawu2/pub"
+
+SHEET_URLS = {
+    "teams":        f"{SHEET_BASE_URL}?output=csv",
+    "matchups":     f"{SHEET_BASE_URL}?gid=625049670&single=true&output=csv",
+    "players":      f"{SHEET_BASE_URL}?gid=1947173700&single=true&output=csv",
+    "draft_roster": f"{SHEET_BASE_URL}?gid=1611857667&single=true&output=csv",
+    "final_roster": f"{SHEET_BASE_URL}?gid=148379330&single=true&output=csv",
+}
+
+# Point the loader at another server that serves <name>.csv instead
+# (e.g. `python synthetic_league.py serve DIR` for load testing).
+if os.environ.get("LEAGUE_SHEETS_URL"):
+    _base = os.environ["LEAGUE_SHEETS_URL"].rstrip("/")
+    SHEET_URLS = {name: f"{_base}/{name}.csv" for name in SHEET_URLS}
+
+# How long (seconds) a fetched copy of the sheets is reused before going back to Google.
+# Override with the LEAGUE_DATA_TTL env var (e.g. LEAGUE_DATA_TTL=60 on game day).
+DATA_TTL_SECONDS = int(os.environ.get("LEAGUE_DATA_TTL", "900"))
+
+# Low-memory mode for small hosts: drop columns no page reads, store long repeated
+# text as categories and keep season/owner partitions as row positions instead of copies.
+LOW_MEMORY = os.environ.get("LEAGUE_LOW_MEMORY", "").lower() in ("1", "true", "yes", "on")
+
+# Per-table fetch limits. players is by far the largest export, so it gets more time.
+FETCH_TIMEOUT_SECONDS = 15
+FETCH_TIMEOUTS = {"players": 45}
+FETCH_RETRIES = 2
+
+
+# -----------------------------
+# Parallel fetch (all sheets at once, parsed as each one arrives)
+# -----------------------------
+# Last fetch per sheet: content hash, HTTP validators and the parsed frame.
+# A sheet whose bytes hash the same as last time is not re-parsed.
+_fetch_state = {}
+
+
+def _fetch_csv_bytes(url, timeout, retries, validators=None):
+    """Return (raw bytes, validators); raw is None when the server answers 304 Not Modified."""
+    headers = {"User-Agent": "dayton-boyz-dashboard"}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    last_err = None
+    for attempt in range(retries + 1):
+        try:
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                return resp.read(), {
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None, validators
+            last_err = e
+        except OSError as e:  # URLError and socket timeouts are OSErrors
+            last_err = e
+        if attempt < retries:
+            time.sleep(0.5 * 2 ** attempt)
+    raise last_err
+
+
+def content_hash(raw):
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def parse_csv(raw):
+    return pd.read_csv(io.BytesIO(raw))
+
+
+def prepare_table(name, df):
+    """Canonical column names, clean keys and declared dtypes; tabs rely on all three."""
+    df = apply_schema(name, canonicalize(name, df))
+    return slim_table(name, df) if LOW_MEMORY else df
+
+
+def prepare_tables(tables):
+    for name in TABLE_SCHEMAS:
+        if name in tables:
+            tables[name] = prepare_table(name, tables[name])
+    return tables
+
+
+def _fetch_table(name, url, timeout, retries):
+    prev = _fetch_state.get(url)
+    start = time.perf_counter()
+    raw, validators = _fetch_csv_bytes(url, timeout, retries, prev)
+    fetched = time.perf_counter()
+    if raw is None and prev is not None:
+        return {**prev, "timings": {"fetch": fetched - start}}  # 304: nothing to download or parse
+
+    digest = content_hash(raw)
+    if prev is not None and prev["hash"] == digest:
+        state = {**prev, **validators}
+    else:
+        state = {"hash": digest, **validators, "df": prepare_table(name, parse_csv(raw))}
+    state["timings"] = {"fetch": fetched - start, "normalize": time.perf_counter() - fetched}
+    _fetch_state[url] = state
+    return state
+
+
+def seed_fetch_state(tables, urls=None):
+    """Prime the unchanged-sheet check from an already loaded copy (e.g. the snapshot)."""
+    urls = SHEET_URLS if urls is None else urls
+    versions = tables.get("versions") or {}
+    validators = tables.get("validators") or {}
+    for name, url in urls.items():
+        if name in tables and versions.get(name) and url not in _fetch_state:
+            _fetch_state[url] = {"hash": versions[name], **validators.get(name, {}), "df": tables[name]}
+
+
+def data_version(tables, *names):
+    """Short version string for the given tables (all of them if none given); use it as a cache key."""
+    versions = tables.get("versions") or {}
+    names = names or sorted(versions)
+    return "-".join(f"{versions.get(n, 'na')[:8]}" for n in names)
+
+
+def fetch_tables(urls=None, retries=FETCH_RETRIES):
+    """Fetch every sheet concurrently; cold start costs the slowest sheet, not the sum.
+
+    Returns {name: DataFrame} plus "versions" ({name: content hash}),
+    "validators" ({name: ETag/Last-Modified}) and "load_timings" (seconds per
+    fetch/normalize step). Unchanged sheets come back as the same frame as last time.
+    """
+    urls = SHEET_URLS if urls is None else urls
+    tables, versions, validators, timings = {}, {}, {}, {}
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        futures = {
+            pool.submit(_fetch_table, name, url, FETCH_TIMEOUTS.get(name, FETCH_TIMEOUT_SECONDS), retries): name
+            for name, url in urls.items()
+        }
+        for fut in as_completed(futures):
+            name = futures[fut]
+            try:
+                state = fut.result()
+            except Exception as e:
+                raise RuntimeError(f"Failed to load the '{name}' sheet: {e}") from e
+            tables[name] = state["df"]
+            versions[name] = state["hash"]
+            validators[name] = {"etag": state.get("etag"), "last_modified": state.get("last_modified")}
+            timings.update({f"{step} {name}": sec for step, sec in state.get("timings", {}).items()})
+    tables["versions"] = versions
+    tables["validators"] = validators
+    tables["load_timings"] = timings
+    return tables
+
+
+# -----------------------------
+# Snapshot-backed refresh
+# -----------------------------
+_refresh_lock = threading.Lock()
+
+
+def sync_from_sheets():
+    """Fetch every sheet, write changed tables to the snapshot and return (tables, changed names)."""
+    tables = fetch_tables()
+    try:
+        tables["loaded_at"], changed = write_snapshot(tables)
+    except Exception:
+        # A read-only disk shouldn't stop the dashboard; we just lose offline startup
+        log.exception("Could not write league data snapshot")
+        tables["loaded_at"], changed = datetime.now(), list(tables["versions"])
+    return tables, changed
+
+
+# -----------------------------
+# Shared league data (stale-while-revalidate)
+# -----------------------------
+# Every session reads the current view; the refresher thread builds the next one
+# (fetch, parse, derived tables) off the request path and swaps it in with a single
+# assignment. A rerun that already holds the old view finishes with it.
+_view = None
+_view_lock = threading.Lock()
+_refresh_now = threading.Event()
+_refresher = None
+# Called with each new view right after it is swapped in (e.g. precompute.py's cache warm-up)
+_view_listeners = []
+
+
+def on_new_view(fn):
+    """Call fn(view) every time a new view of the league data is swapped in."""
+    if fn not in _view_listeners:
+        _view_listeners.append(fn)
+
+
+def _shared_view(tables):
+    # Derived tables are built here, once per load, then everything is frozen
+    timings = tables.setdefault("load_timings", {})
+    start = time.perf_counter()
+    add_fact_tables(tables)
+    timings["fact tables"] = time.perf_counter() - start
+    start = time.perf_counter()
+    add_partitions(tables, lazy=LOW_MEMORY)
+    timings["partitions"] = time.perf_counter() - start
+    return MappingProxyType(tables)
+
+
+def _swap_view(view):
+    global _view
+    _view = view
+    for fn in _view_listeners:
+        try:
+            fn(view)
+        except Exception:
+            log.exception("New league data listener failed")
+
+
+def refresh_once(blocking=True):
+    """Refetch the sheets; when anything changed, build the new view and swap it in.
+
+    Returns the changed table names ([] when nothing changed, None when another
+    refresh was already running and blocking=False).
+    """
+    if not _refresh_lock.acquire(blocking=blocking):
+        return None
+    try:
+        tables, changed = sync_from_sheets()
+        if changed or _view is None:
+            _swap_view(_shared_view(tables))
+        return changed
+    finally:
+        _refresh_lock.release()
+
+
+def _refresh_loop():
+    while True:
+        # Wake every DATA_TTL_SECONDS, or early when request_refresh() is called
+        _refresh_now.wait(DATA_TTL_SECONDS)
+        _refresh_now.clear()
+        try:
+            refresh_once(blocking=False)
+        except Exception:
+            log.exception("Background refresh from Google Sheets failed; still serving the last data")
+
+
+def start_refresher():
+    """Start the background refresher thread (once per process)."""
+    global _refresher
+    with _view_lock:
+        if _refresher is None or not _refresher.is_alive():
+            _refresher = threading.Thread(target=_refresh_loop, name="league-data-refresh", daemon=True)
+            _refresher.start()
+
+
+def request_refresh():
+    """Ask the refresher to reload now without waiting for it."""
+    start_refresher()
+    _refresh_now.set()
+
+
+def _initial_view():
+    # Boot from the local snapshot when we have one; only block on Google when we don't
+    start = time.perf_counter()
+    tables = read_snapshot()
+    if tables is None:
+        return _shared_view(sync_from_sheets()[0]), False
+    prepare_tables(tables)  # cheap: snapshots are stored already canonical
+    tables["load_timings"] = {"read snapshot": time.perf_counter() - start}
+    seed_fetch_state(tables)
+    age = snapshot_age_seconds()
+    return _shared_view(tables), age is None or age > DATA_TTL_SECONDS
+
+
+def load_league_data():
+    """The shared, read-only league tables plus the derived tables from league_facts.py
+    (player_weeks/team_weeks, standings, positional_edge/position_ranks and the
+    season_index/owner_index partitions).
+
+    Every session gets the same objects, so nothing downstream may add columns to
+    or write into these frames; build a new frame with .assign()/.merge() instead.
+    Only the first request in a process waits for a load; after that the view is
+    replaced in the background (see refresh_once).
+    """
+    view = _view
+    if view is not None:
+        return view
+    with _view_lock:
+        if _view is None:
+            with st.spinner("Loading league data..."):
+                view, stale = _initial_view()
+            _swap_view(view)
+        else:
+            view, stale = _view, False
+    if stale:
+        request_refresh()
+    else:
+        start_refresher()
+    return view
+
+
+def refresh_league_data():
+    """Refetch the sheets now (blocking) and swap in the new data if it changed."""
+    refresh_once(blocking=True)
+
+
+def show_refresh_control(st, loaded_at):
+    # Small "refresh now" control; lives in the sidebar so it stays out of the page layout
+    with st.sidebar:
+        st.caption(f"League data loaded {loaded_at:%b %d, %I:%M %p}")
+        if st.button("🔄 Refresh data now", key="refresh_league_data"):
+            try:
+                with st.spinner("Refreshing from Google Sheets..."):
+                    refresh_league_data()
+            except Exception as e:
+                st.error(f"❌ Refresh failed; still showing the last snapshot.\n\nError: {e}")
+            else:
+                st.rerun()
@@ -0,0 +1,198 @@
+import pandas as pd
+
+# -----------------------------
+# Column aliases -> canonical names (one place instead of per-tab renames/probing)
+# -----------------------------
+COLUMN_ALIASES = {
+    "teams": {
+        "teamkey": "team_key",
+        "season": "year",
+        "owner": "owner_name",
+        "manager": "owner_name",
+        "team": "team_name",
+        "league_result_final": "league_result",
+        "final_result": "league_result",
+        "regular_season_rank": "regular_season_ranking",
+        "regular_season_wins": "wins",
+        "reg_wins": "wins",
+        "regular_season_losses": "losses",
+        "reg_losses": "losses",
+        "points_for_total": "points_for",
+        "regular_season_points_for": "points_for",
+        "pf_total": "points_for",
+        "total_pf": "points_for",
+        "points_against_total": "points_against",
+        "regular_season_points_against": "points_against",
+        "pa_total": "points_against",
+        "total_pa": "points_against",
+        "waiver_moves": "number_of_waiver_moves",
+        "trades": "number_of_trades",
+        "url": "team_url",
+        "draft_report_card": "draft_grade",
+        "isfinished": "is_finished",
+        "finished": "is_finished",
+        "season_finished": "is_finished",
+    },
+    "matchups": {
+        "teamkey": "team_key",
+        "opponentteamkey": "opponent_team_key",
+        "season": "year",
+        "url": "matchup_url",
+    },
+    "players": {
+        "teamkey": "team_key",
+        "player_id": "player_key",
+        "name": "player_name",
+        "full_name": "player_name",
+        "player_full_name": "player_name",
+    },
+    "draft_roster": {
+        "teamkey": "team_key",
+        "player_id": "player_key",
+        "name": "player_name",
+        "full_name": "player_name",
+        "player_full_name": "player_name",
+    },
+    "final_roster": {
+        "teamkey": "team_key",
+        "player_id": "player_key",
+    },
+}
+
+# Join keys and labels that get compared as text
+TEXT_COLUMNS = ("team_key", "opponent_team_key", "player_key", "owner_name", "opponent_owner")
+
+# -----------------------------
+# Declared column types, applied once when a sheet is loaded
+# -----------------------------
+# "int8"/"int16": small integers (weeks, years, 0/1 flags, counts). A column with
+#                 blanks falls back to float32 so NaN comparisons behave as before.
+# "float64":      points. Kept full width: float32 shows 156.6 as 156.60000610351562
+#                 and rounds some .x5 values the other way.
+# "category":     low-cardinality labels repeated on every row
+TABLE_SCHEMAS = {
+    "teams": {
+        "year": "int16",
+        "owner_name": "category",
+        "regular_season_ranking": "int8",
+        "wins": "int8",
+        "losses": "int8",
+        "points_for": "float64",
+        "points_against": "float64",
+        "number_of_waiver_moves": "int16",
+        "number_of_trades": "int16",
+        "is_finished": "int8",
+    },
+    "matchups": {
+        "week": "int8",
+        "is_playoffs": "int8",
+        "points_for": "float64",
+        "points_against": "float64",
+        "points_difference": "float64",
+        "high_score_flag": "int8",
+        "low_score_flag": "int8",
+    },
+    "players": {
+        "week": "int8",
+        "player_week_points": "float64",
+        "selected_position": "category",
+        "player_position": "category",
+    },
+    "draft_roster": {
+        "pick_num": "int16",
+        "round_num": "int8",
+        "player_position": "category",
+    },
+    "final_roster": {},
+}
+
+
+def _cast(s, dtype):
+    if str(s.dtype) == dtype:
+        return s
+    if dtype == "category":
+        return s.astype("category")
+
+    if dtype == "float64" and str(s.dtype) == "float32":
+        # Snapshots written with float32 points: widen through the shortest decimal
+        # text so 156.6 comes back as 156.6, not 156.60000610351562
+        return pd.to_numeric(s.astype(str), errors="coerce")
+    num = pd.to_numeric(s, errors="coerce")
+    if dtype == "float64":
+        return num.astype("float64")
+    if num.isna().any():
+        return num.astype("float32")
+    return num.astype(dtype)
+
+
+def _strip_text(s):
+    return s.where(s.isna(), s.astype(str).str.strip())
+
+
+def canonicalize(name, df):
+    """Lower-case/strip headers, resolve aliases and strip the text key columns."""
+    cols = [str(c).strip().lower() for c in df.columns]
+    aliases = COLUMN_ALIASES.get(name, {})
+    for i, c in enumerate(cols):
+        canon = aliases.get(c)
+        if canon and canon not in cols:
+            cols[i] = canon
+    if cols != list(df.columns):
+        df = df.set_axis(cols, axis=1)
+    texts = {
+        c: _strip_text(df[c]) for c in TEXT_COLUMNS
+        if c in df.columns and not isinstance(df[c].dtype, pd.CategoricalDtype)
+    }
+    return df.assign(**texts) if texts else df
+
+
+def apply_schema(name, df):
+    """Cast the columns declared for table `name`; columns the sheet doesn't have are skipped."""
+    schema = TABLE_SCHEMAS.get(name, {})
+    casts = {col: _cast(df[col], dtype) for col, dtype in schema.items() if col in df.columns}
+    if not casts:
+        return df
+    return df.assign(**casts)
+
+
+# -----------------------------
+# Low-memory mode (LEAGUE_LOW_MEMORY=1, see data_loader.py)
+# -----------------------------
+# Only the columns some page reads are kept, and the long repeated text columns
+# of the big tables become categories.
+USED_COLUMNS = {
+    "teams": (
+        "team_key", "year", "owner_name", "team_name", "league_result", "regular_season_ranking",
+        "wins", "losses", "points_for", "points_against", "number_of_waiver_moves", "number_of_trades",
+        "faab_balance_used", "draft_grade", "team_url", "logo_url", "team_logo_url", "team_logo", "is_finished",
+    ),
+    "matchups": (
+        "team_key", "opponent_team_key", "year", "week", "is_playoffs", "points_for", "points_against",
+        "points_difference", "week_result", "opponent_owner", "matchup_recap_url", "matchup_url",
+        "high_score_flag", "low_score_flag",
+    ),
+    "players": (
+        "team_key", "week", "player_key", "player_name", "player_position", "selected_position",
+        "player_week_points",
+    ),
+    "draft_roster": (
+        "team_key", "player_key", "player_name", "player_position", "pick_num", "round_num", "is_keeper",
+    ),
+    "final_roster": ("team_key", "player_key"),
+}
+
+LOW_MEMORY_SCHEMAS = {
+    "matchups": {"team_key": "category", "opponent_team_key": "category", "week_result": "category"},
+    "players": {"team_key": "category", "player_key": "category"},
+    "draft_roster": {"team_key": "category"},
+    "final_roster": {"team_key": "category"},
+}
+
+
+def slim_table(name, df):
+    """Low-memory copy of an already prepared table: unused columns dropped, repeated text as categories."""
+    used = USED_COLUMNS.get(name)
+    if used is not None:
+        df = df[[c for c in df.columns if c in used]]
+    casts = {col: _cast(df[col], dtype) for col, dtype in LOW_MEMORY_SCHEMAS.get(name, {}).items() if col in df.columns}
+    return df.assign(**casts) if casts else df
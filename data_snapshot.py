@@ -0,0 +1,130 @@
+import argparse
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+# Local columnar copy of the league sheets. main.py boots from here and
+# refreshes from Google Sheets in the background (see data_loader.py).
+SNAPSHOT_DIR = Path(os.environ.get("LEAGUE_SNAPSHOT_DIR", Path(__file__).parent / "data_snapshots"))
+MANIFEST_NAME = "manifest.json"
+TABLE_NAMES = ("teams", "matchups", "players", "draft_roster", "final_roster")
+
+
+def _table_path(snapshot_dir, name):
+    return Path(snapshot_dir) / f"{name}.parquet"
+
+
+def write_snapshot(tables, snapshot_dir=SNAPSHOT_DIR):
+    """Write changed tables to <dir>/<name>.parquet, then the manifest.
+
+    A table is rewritten only when its content hash (tables["versions"]) differs
+    from the one in the manifest. Returns (saved_at, changed table names).
+    """
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    manifest = read_manifest(snapshot_dir) or {}
+    old_versions = manifest.get("versions", {})
+    versions = tables.get("versions") or {}
+
+    changed = [
+        name for name in TABLE_NAMES
+        if not versions.get(name)
+        or versions[name] != old_versions.get(name)
+        or not _table_path(snapshot_dir, name).exists()
+    ]
+    if not changed and manifest.get("saved_at"):
+        return datetime.fromisoformat(manifest["saved_at"]), []
+
+    # Write to temp files and swap in, so a reader never sees a half-written table
+    for name in changed:
+        path = _table_path(snapshot_dir, name)
+        tmp = path.with_suffix(".parquet.tmp")
+        tables[name].to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+
+    saved_at = datetime.now()
+    manifest = {
+        "saved_at": saved_at.isoformat(timespec="seconds"),
+        "tables": list(TABLE_NAMES),
+        "versions": {name: versions.get(name) for name in TABLE_NAMES},
+        "validators": tables.get("validators") or manifest.get("validators", {}),
+    }
+    tmp = snapshot_dir / (MANIFEST_NAME + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, snapshot_dir / MANIFEST_NAME)
+    return saved_at, changed
+
+
+def read_manifest(snapshot_dir=SNAPSHOT_DIR):
+    path = Path(snapshot_dir) / MANIFEST_NAME
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def read_snapshot(snapshot_dir=SNAPSHOT_DIR):
+    """Load all tables from the snapshot, or None if there is no complete snapshot."""
+    manifest = read_manifest(snapshot_dir)
+    if manifest is None:
+        return None
+    tables = {}
+    for name in TABLE_NAMES:
+        path = _table_path(snapshot_dir, name)
+        if not path.exists():
+            return None
+        tables[name] = pd.read_parquet(path)
+    tables["loaded_at"] = datetime.fromisoformat(manifest["saved_at"])
+    tables["versions"] = manifest.get("versions", {})
+    tables["validators"] = manifest.get("validators", {})
+    return tables
+
+
+def snapshot_age_seconds(snapshot_dir=SNAPSHOT_DIR):
+    manifest = read_manifest(snapshot_dir)
+    if manifest is None:
+        return None
+    return (datetime.now() - datetime.fromisoformat(manifest["saved_at"])).total_seconds()
+
+
+def sync_snapshot(snapshot_dir=SNAPSHOT_DIR):
+    """Fetch every sheet from Google and write the tables that changed."""
+    from data_loader import fetch_tables
+    return write_snapshot(fetch_tables(), snapshot_dir)
+
+
+# -----------------------------
+# CLI: python data_snapshot.py sync   (e.g. from cron before game day)
+# -----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the local league data snapshot.")
+    parser.add_argument("command", choices=["sync", "info"], help="sync: refetch from Google Sheets; info: show snapshot contents")
+    parser.add_argument("--dir", default=str(SNAPSHOT_DIR), help="snapshot directory (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.command == "sync":
+        saved_at, changed = sync_snapshot(args.dir)
+        if changed:
+            print(f"Snapshot written to {args.dir} at {saved_at:%Y-%m-%d %H:%M:%S} (updated: {', '.join(changed)})")
+        else:
+            print(f"Snapshot in {args.dir} already up to date (saved {saved_at:%Y-%m-%d %H:%M:%S})")
+    else:
+        tables = read_snapshot(args.dir)
+        if tables is None:
+            print(f"No snapshot found in {args.dir}")
+            return 1
+        print(f"Snapshot saved {tables['loaded_at']:%Y-%m-%d %H:%M:%S}")
+        for name in TABLE_NAMES:
+            df = tables[name]
+            version = tables["versions"].get(name) or "-"
+            print(f"  {name:<13} {len(df):>7} rows  {df.shape[1]:>3} cols  {version}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
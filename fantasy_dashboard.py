@@ -1,5 +1,6 @@
 import streamlit as st
-import pandas as pd
+from data_loader import SHEET_URLS, fetch_tables
+from league_facts import build_player_weeks, build_team_weeks
 
 # Page config and styling
 st.set_page_config(page_title="Dayton Boyz Fantasy Football", layout="wide")
@@ -16,39 +17,21 @@ st.markdown("""
 
 st.title("🏈 Dayton Boyz Fantasy Football")
 
-# CSV export links
-teams_csv_url = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQvhSWRerxihgW73Bicic4j1wY052Cda0oES-97_oafR6WWueA5P6QN3Vsrv0pknHGwrw4pJ8EBawu2/pub?output=csv"
-matchups_csv_url = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQvhSWRerxihgW73Bicic4j1wY052Cda0oES-97_oafR6WWueA5P6QN3Vsrv0pknHGwrw4pJ8EBawu2/pub?gid=625049670&single=true&output=csv"
-players_csv = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQvhSWRerxihgW73Bicic4j1wY052Cda0oES-97_oafR6WWueA5P6QN3Vsrv0pknHGwrw4pJ8EBawu2/pub?gid=1947173700&single=true&output=csv"
-
 try:
-    # Load data
-    teams_df = pd.read_csv(teams_csv_url)
-    matchups_df = pd.read_csv(matchups_csv_url)
-    players_df = pd.read_csv(players_csv)
-    teams_df.columns = teams_df.columns.str.strip().str.lower()
-    matchups_df.columns = matchups_df.columns.str.strip().str.lower()
-    players_df.columns = players_df.columns.str.strip().str.lower()
-
-    # Merge to get owner_name and year
-    df = matchups_df.merge(
-        teams_df[['team_key', 'owner_name', 'year']],
-        on='team_key', how='left'
-    )
+    # Load data (all three sheets fetched in parallel)
+    tables = fetch_tables({k: SHEET_URLS[k] for k in ("teams", "matchups", "players")})
+    teams_df = tables["teams"]
+    matchups_df = tables["matchups"]
+    players_df = tables["players"]
+
+    # Matchups/players with owner_name, year and is_playoffs already joined
+    df = build_team_weeks(teams_df, matchups_df)
     regular_df = df[df['is_playoffs'] == 0]
 
-# Merge matchup info into players_df (only bring in is_playoffs)
-    # Create join key in both dataframes
-    matchups_df['team_week_key'] = matchups_df['team_key'].astype(str) + '_' + matchups_df['week'].astype(str)
-    players_df['team_week_key'] = players_df['team_key'].astype(str) + '_' + players_df['week'].astype(str)
-    players_df = players_df.merge(
-        matchups_df[['team_week_key', 'is_playoffs']],
-        on='team_week_key', how='left')
-
-    # Merge team owner/year info into players_df using players' team_key
-    players_df = players_df.merge(
-        teams_df[['team_key', 'owner_name', 'year']],
-        on='team_key', how='left')
+    # Player weeks without a matchup row are kept with a blank is_playoffs (as the old
+    # left join left them), so the is_playoffs == 0 filters below leave them out
+    players_df = build_player_weeks(teams_df, matchups_df, players_df)
+    players_df = players_df.assign(is_playoffs=players_df['is_playoffs'].where(players_df['has_matchup']))
     
     # Single-tab layout
     tab1, tab2 = st.tabs(["Hall of Fame/ Shame", "League Rules"])
@@ -99,7 +82,7 @@ try:
             (teams_df['regular_season_ranking'].notnull())
         ]
 
-        avg_rankings = ranking_df.groupby('owner_name').agg(
+        avg_rankings = ranking_df.groupby('owner_name', observed=True).agg(
             avg_rank=('regular_season_ranking', 'mean'),
             seasons=('year', 'nunique')
         )
@@ -121,7 +104,7 @@ try:
         win_df = win_df[win_df['total_games'] > 0]
         win_df['win_pct'] = win_df['wins'] / win_df['total_games']
 
-        owner_stats = win_df.groupby('owner_name').agg(
+        owner_stats = win_df.groupby('owner_name', observed=True).agg(
             wins=('wins', 'sum'),
             losses=('losses', 'sum'),
             seasons=('year', 'nunique') 
@@ -142,7 +125,7 @@ try:
 
             
         # Most Weekly High Scores
-        high_counts = regular_df[regular_df['high_score_flag'] == 1].groupby('owner_name').size()
+        high_counts = regular_df[regular_df['high_score_flag'] == 1].groupby('owner_name', observed=True).size()
         if not high_counts.empty:
             mh = high_counts.max()
             owners_hi = high_counts[high_counts == mh].index.tolist()
@@ -226,7 +209,7 @@ try:
             (teams_df['regular_season_ranking'].notnull())
         ]
 
-        avg_rankings = ranking_df.groupby('owner_name').agg(
+        avg_rankings = ranking_df.groupby('owner_name', observed=True).agg(
             avg_rank=('regular_season_ranking', 'mean'),
             seasons=('year', 'nunique')
         )
@@ -256,7 +239,7 @@ try:
         win_df = win_df[win_df['total_games'] > 0]
         win_df['win_pct'] = win_df['wins'] / win_df['total_games']
 
-        owner_stats = win_df.groupby('owner_name').agg(
+        owner_stats = win_df.groupby('owner_name', observed=True).agg(
             wins=('wins', 'sum'),
             losses=('losses', 'sum'),
             seasons=('year', 'nunique')
@@ -284,7 +267,7 @@ try:
 
         
         # Most Weekly Low Scores
-        low_counts = regular_df[regular_df['low_score_flag'] == 1].groupby('owner_name').size()
+        low_counts = regular_df[regular_df['low_score_flag'] == 1].groupby('owner_name', observed=True).size()
         if not low_counts.empty:
             ml = low_counts.max()
             owners_lo = low_counts[low_counts == ml].index.tolist()
@@ -326,7 +309,7 @@ try:
             (players_df['player_week_points'] <= 0)
         ]
 
-        zero_counts = bad_starts.groupby('owner_name').size()
+        zero_counts = bad_starts.groupby('owner_name', observed=True).size()
 
         if not zero_counts.empty:
             max_count = zero_counts.max()
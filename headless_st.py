@@ -0,0 +1,272 @@
+import argparse
+import importlib
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import streamlit
+
+import data_loader
+from data_snapshot import TABLE_NAMES, read_snapshot
+from league_facts import add_fact_tables, add_partitions
+from view_model import PAGES, build_view, show_page
+
+PAGE_MODULES = (
+    "tab_season_insights", "tab_team_insights", "tab_owner_insights",
+    "tab_league_insights", "tab_hall_of_fame", "tab_draft_board",
+)
+
+# -----------------------------
+# Headless render harness: run the show_* tabs from plain Python
+# -----------------------------
+# Pages are built with view_model.build_view and rendered onto a stand-in for st,
+# so no Streamlit server is needed. HeadlessSt answers widgets from scripted
+# selections (by key, then label; otherwise the widget default, skipping
+# "Select ..." placeholders) and records what the page emits:
+#
+#   st = HeadlessSt({"season_insights_year": 2024})
+#   seconds = render_page("season", st, load_tables("/tmp/league"))
+#   st.calls  ->  [("selectbox", ("tab:Teams",), "Season", 2024), ("plotly_chart", (), <Figure>), ...]
+#
+# Each call is (kind, container path, payload...). Payloads are the objects the
+# tab passed in (figures, DataFrames, HTML strings), not serialized copies.
+
+
+class StopRender(Exception):
+    """Raised by st.stop(); render_page treats it as a normal end of the page."""
+
+
+class RerunRender(Exception):
+    """Raised by st.rerun(); render_page runs the page again (widget state kept), as Streamlit does."""
+
+
+class HeadlessSt:
+    column_config = streamlit.column_config
+
+    def __init__(self, selections=None, skip_placeholders=True):
+        self.selections = dict(selections or {})
+        self.skip_placeholders = skip_placeholders
+        self.calls = []
+        self.session_state = dict(self.selections)  # like widget state kept from an earlier rerun
+        self._path = ()
+
+    def _rec(self, kind, *payload):
+        self.calls.append((kind, self._path, *payload))
+
+    def _pick(self, kind, label, key, default):
+        for k in (key, label):
+            if k is not None and k in self.selections:
+                value = self.selections[k]
+                break
+        else:
+            value = default
+        self._rec(kind, label, value)
+        if key is not None:
+            self.session_state[key] = value
+        return value
+
+    # Widgets
+    def selectbox(self, label, options, index=0, key=None, **kwargs):
+        options = list(options)
+        default = options[index] if options and index is not None else None
+        # "Select an owner..." style first entries: go on to the first real option
+        if self.skip_placeholders and isinstance(default, str) and default.startswith("Select") and len(options) > 1:
+            default = options[index + 1]
+        return self._pick("selectbox", label, key, default)
+
+    def radio(self, label, options, index=0, key=None, **kwargs):
+        return self.selectbox(label, options, index, key)
+
+    def multiselect(self, label, options, default=None, key=None, **kwargs):
+        return self._pick("multiselect", label, key, list(default or []))
+
+    def toggle(self, label, value=False, key=None, **kwargs):
+        return self._pick("toggle", label, key, value)
+
+    def checkbox(self, label, value=False, key=None, **kwargs):
+        return self._pick("checkbox", label, key, value)
+
+    def slider(self, label, min_value=None, max_value=None, value=None, key=None, **kwargs):
+        return self._pick("slider", label, key, min_value if value is None else value)
+
+    def number_input(self, label, min_value=None, max_value=None, value="min", key=None, **kwargs):
+        default = (0.0 if min_value is None else min_value) if value == "min" else value
+        return self._pick("number_input", label, key, default)
+
+    def button(self, label, key=None, **kwargs):
+        return self._pick("button", label, key, False)
+
+    # Output
+    def plotly_chart(self, fig, **kwargs):
+        self._rec("plotly_chart", fig)
+
+    def dataframe(self, data, **kwargs):
+        self._rec("dataframe", data)
+
+    def table(self, data, **kwargs):
+        self._rec("table", data)
+
+    def markdown(self, body, **kwargs):
+        self._rec("markdown", body)
+
+    def html(self, body, **kwargs):
+        self._rec("html", body)
+
+    def components_html(self, body, **kwargs):
+        self._rec("html", body)
+
+    def write(self, *args, **kwargs):
+        self._rec("write", args)
+
+    def metric(self, label, value, delta=None, **kwargs):
+        self._rec("metric", label, value, delta)
+
+    def _text(kind):
+        def emit(self, body, **kwargs):
+            self._rec(kind, body)
+        return emit
+
+    title = _text("title")
+    header = _text("header")
+    subheader = _text("subheader")
+    caption = _text("caption")
+    info = _text("info")
+    success = _text("success")
+    warning = _text("warning")
+    error = _text("error")
+    del _text
+
+    def stop(self):
+        raise StopRender()
+
+    def rerun(self):
+        raise RerunRender()
+
+    # Layout: containers record their path and otherwise behave like st itself
+    def tabs(self, labels):
+        labels = list(labels)
+        self._rec("tabs", labels)
+        return [_Container(self, f"tab:{label}") for label in labels]
+
+    def columns(self, spec, **kwargs):
+        n = spec if isinstance(spec, int) else len(spec)
+        self._rec("columns", n)
+        return [_Container(self, f"col{i}") for i in range(n)]
+
+    def expander(self, label, **kwargs):
+        return _Container(self, f"expander:{label}")
+
+    def container(self, **kwargs):
+        return _Container(self, "container")
+
+    @contextmanager
+    def spinner(self, text="", **kwargs):
+        yield
+
+    @property
+    def sidebar(self):
+        return _Container(self, "sidebar")
+
+    def count(self, kind):
+        return sum(1 for c in self.calls if c[0] == kind)
+
+
+class _Container:
+    def __init__(self, st, name):
+        self._st = st
+        self._name = name
+        self._outer = None
+
+    def __enter__(self):
+        self._outer = self._st._path
+        self._st._path = self._outer + (self._name,)
+        return self
+
+    def __exit__(self, *exc):
+        self._st._path = self._outer
+
+    def __getattr__(self, attr):
+        # `col.markdown(...)` outside a `with` still lands in this container
+        target = getattr(self._st, attr)
+        if not callable(target) or self._st._path[-1:] == (self._name,):
+            return target
+
+        def call(*args, **kwargs):
+            with self:
+                return target(*args, **kwargs)
+        return call
+
+
+# -----------------------------
+# Data and pages
+# -----------------------------
+def load_tables(directory):
+    """Tables as main.py sees them, from a dir of sheet CSVs or a snapshot (manifest.json)."""
+    directory = Path(directory)
+    if (directory / "manifest.json").exists():
+        tables = data_loader.prepare_tables(read_snapshot(directory))
+    else:
+        raw = {name: (directory / f"{name}.csv").read_bytes() for name in TABLE_NAMES}
+        tables = data_loader.prepare_tables({name: data_loader.parse_csv(b) for name, b in raw.items()})
+    return add_partitions(add_fact_tables(tables), lazy=data_loader.LOW_MEMORY)
+
+
+def import_pages():
+    """Import the page modules up front, so the first timed render doesn't pay for them."""
+    for name in PAGE_MODULES:
+        importlib.import_module(name)
+
+
+def render_page(page, st, tables, build=build_view, max_runs=5):
+    """Run one page against st; returns wall-clock seconds. st.stop() ends the page quietly;
+    st.rerun() starts it over, dropping what the interrupted run recorded."""
+    start = time.perf_counter()
+    for _ in range(max_runs):
+        first = len(st.calls)
+        try:
+            show_page(st, page, tables, build=build)
+        except StopRender:
+            st._rec("stop")
+        except RerunRender:
+            del st.calls[first:]
+            continue
+        return time.perf_counter() - start
+    raise RuntimeError(f"{page} still asked for a rerun after {max_runs} runs")
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+def _parse_selection(text):
+    key, _, value = text.partition("=")
+    return key, int(value) if value.lstrip("-").isdigit() else value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the dashboard tabs headlessly and time them.")
+    parser.add_argument("data", help="directory of sheet CSVs or a snapshot")
+    parser.add_argument("--page", action="append", choices=list(PAGES),
+                        help="page(s) to render (default: all)")
+    parser.add_argument("--select", action="append", default=[], metavar="KEY=VALUE",
+                        help="widget answer by key or label, e.g. season_insights_year=2024")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    tables = load_tables(args.data)
+    print(f"load {time.perf_counter() - start:8.3f}s")
+    import_pages()
+
+    selections = dict(_parse_selection(s) for s in args.select)
+    for page in args.page or PAGES:
+        st = HeadlessSt(selections)
+        seconds = render_page(page, st, tables)
+        kinds = {}
+        for call in st.calls:
+            kinds[call[0]] = kinds.get(call[0], 0) + 1
+        summary = ", ".join(f"{k} {n}" for k, n in sorted(kinds.items()))
+        print(f"{page:<13} {seconds:8.3f}s  {summary}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
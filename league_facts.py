@@ -0,0 +1,406 @@
+import numpy as np
+import pandas as pd
+
+# -----------------------------
+# Fact tables: the joins every tab needs, built once per data load
+# -----------------------------
+# player_weeks: one row per player per team-week, with the team's year/owner,
+#               the week's is_playoffs flag, starter/position helpers and
+#               whether the team drafted the player.
+# team_weeks:   one row per team per matchup week, with both owners/team names,
+#               margin and result.
+# standings:    (team_key, year) -> regular-season W/L/T/PF/PA; standings_weeks
+#               has the same totals after every week, with the week's rank.
+# positional_edge: (year, owner, started slot) -> avg weekly points vs the rest
+#               of the league that week.
+# position_ranks: (year, owner, started slot) -> avg weekly points and the
+#               owner's rank at that slot in the season.
+# records_index: the top/bottom k games per record, per season, per owner
+#               and all time.
+# Like the sheet tables they are shared between sessions: read-only.
+
+BENCH_SLOTS = ("BN", "IR")
+BASE_POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
+DEF_ALIASES = {"DST": "DEF", "D/ST": "DEF", "DEFENSE": "DEF"}
+
+
+def _upper(s):
+    return s.astype(str).str.strip().str.upper()
+
+
+def _team_info(teams):
+    cols = [c for c in ("team_key", "year", "owner_name", "team_name") if c in teams.columns]
+    return teams[cols].dropna(subset=["team_key"]).drop_duplicates(subset=["team_key"])
+
+
+def _key_like(info, df, key):
+    # Match a categorical join key (low-memory mode) so the merge keeps it categorical
+    if isinstance(df[key].dtype, pd.CategoricalDtype) and key in info.columns:
+        return info.astype({key: df[key].dtype})
+    return info
+
+
+def build_team_weeks(teams, matchups):
+    """matchups + year/owner/team name for both sides, margin and result (win/loss/tie by margin).
+
+    A blank is_playoffs is 0 (regular season), here once for every is_playoffs == 0 filter.
+    """
+    info = _key_like(_team_info(teams), matchups, "team_key")
+    m = matchups.drop(columns=[c for c in info.columns if c != "team_key" and c in matchups.columns])
+    tw = m.merge(info, on="team_key", how="left")
+    if "is_playoffs" in tw.columns:
+        tw = tw.assign(is_playoffs=tw["is_playoffs"].fillna(0).astype("int8"))
+
+    if "opponent_team_key" in tw.columns:
+        opp = _key_like(info.drop(columns=["year"], errors="ignore").rename(columns={
+            "team_key": "opponent_team_key",
+            "owner_name": "opponent_owner_name",
+            "team_name": "opponent_team_name",
+        }), tw, "opponent_team_key")
+        tw = tw.merge(opp, on="opponent_team_key", how="left")
+
+    if {"points_for", "points_against"}.issubset(tw.columns):
+        margin = tw["points_for"] - tw["points_against"]
+        tw = tw.assign(
+            margin=margin,
+            result=np.where(margin > 0, "win", np.where(margin < 0, "loss", "tie")),
+        )
+    return tw
+
+
+def build_player_weeks(teams, matchups, players, draft_roster=None):
+    """players + team year/owner, the week's is_playoffs and starter/position helpers.
+
+    Rows whose team_key isn't in teams are dropped (they can't be placed in a season).
+    has_matchup marks weeks the team was on the schedule; is_playoffs is 0 otherwise.
+    player_week_points blanks stay blank (a starter with no score isn't a 0-point
+    start); means and ranks fill them with 0. Added columns:
+      is_started  selected_position not BN/IR
+      position    player_position with DST/D/ST -> DEF
+      slot        started slot grouped to QB/RB/WR/TE/K/DEF/FLEX (BN/IR kept as is)
+      is_drafted  the player is on this team's draft roster (only when draft_roster is given)
+    """
+    p = players.drop(columns=[c for c in ("year", "owner_name", "is_playoffs") if c in players.columns])
+    info = _key_like(_team_info(teams).drop(columns=["team_name"], errors="ignore"), p, "team_key")
+    pw = p.merge(info, on="team_key", how="inner")
+
+    if {"team_key", "week", "is_playoffs"}.issubset(matchups.columns):
+        sched = _key_like(
+            matchups[["team_key", "week", "is_playoffs"]]
+            .drop_duplicates(subset=["team_key", "week"])
+            .assign(has_matchup=True),
+            pw, "team_key",
+        )
+        pw = pw.merge(sched, on=["team_key", "week"], how="left")
+        pw = pw.assign(
+            has_matchup=pw["has_matchup"].notna(),
+            is_playoffs=pw["is_playoffs"].fillna(0).astype("int8"),
+        )
+
+    extra = {}
+    if "selected_position" in pw.columns:
+        sel = _upper(pw["selected_position"])
+        started = ~sel.isin(BENCH_SLOTS)
+        sel = sel.replace("DST", "DEF")
+        extra["is_started"] = started
+        extra["slot"] = pd.Categorical(np.where(sel.isin(BASE_POSITIONS) | ~started, sel, "FLEX"))
+    if "player_position" in pw.columns:
+        pos = _upper(pw["player_position"])
+        extra["position"] = pos.where(pw["player_position"].notna()).replace(DEF_ALIASES).astype("category")
+    if draft_roster is not None and {"team_key", "player_key"}.issubset(draft_roster.columns) and "player_key" in pw.columns:
+        # One hashed (team_key, player_key) membership test for every season at once
+        keys = ["team_key", "player_key"]
+        drafted = pd.MultiIndex.from_frame(draft_roster[keys].dropna().astype(str))
+        extra["is_drafted"] = pd.MultiIndex.from_frame(pw[keys].astype(str)).isin(drafted)
+    return pw.assign(**extra)
+
+
+# -----------------------------
+# Regular-season standings, repaired once per load
+# -----------------------------
+STANDING_COLUMNS = ("wins", "losses", "ties", "points_for", "points_against")
+
+
+def build_standings_weeks(team_weeks):
+    """Regular-season standings after every week: (team_key, year, week) -> cumulative
+    wins/losses/ties/points_for/points_against and rank (wins, then points for; 1 = first).
+
+    Results come from week_result when the sheet has it, else from the score.
+    """
+    cols = ["team_key", "year", "owner_name", "week", *STANDING_COLUMNS, "rank"]
+    if not {"team_key", "year", "week", "points_for", "points_against"}.issubset(team_weeks.columns):
+        return pd.DataFrame(columns=cols)
+    tw = team_weeks
+    if "is_playoffs" in tw.columns:
+        tw = tw[tw["is_playoffs"] == 0]
+    pf, pa = tw["points_for"].fillna(0.0), tw["points_against"].fillna(0.0)
+    if "week_result" in tw.columns:
+        res = tw["week_result"].astype(str).str.strip().str.lower()
+        win, loss, tie = res.eq("win"), res.eq("loss"), res.eq("tie")
+    else:
+        played = tw["points_for"].notna() & tw["points_against"].notna()
+        win, loss, tie = pf > pa, pf < pa, played & (pf == pa)
+
+    wk = pd.DataFrame({
+        "team_key": tw["team_key"], "year": tw["year"],
+        "owner_name": tw["owner_name"] if "owner_name" in tw.columns else None, "week": tw["week"],
+        "wins": win.astype(int), "losses": loss.astype(int), "ties": tie.astype(int),
+        "points_for": pf, "points_against": pa,
+    }).sort_values(["year", "team_key", "week"], kind="stable")
+    totals = list(STANDING_COLUMNS)
+    wk[totals] = wk.groupby(["team_key", "year"], dropna=False, observed=True)[totals].cumsum()
+
+    order = wk.sort_values(["year", "week", "wins", "points_for"], ascending=[True, True, False, False], kind="stable")
+    wk["rank"] = order.groupby(["year", "week"], observed=True).cumcount().add(1).reindex(wk.index)
+    return wk.reset_index(drop=True)[cols]
+
+
+def build_standings(teams, standings_weeks):
+    """(team_key, year) -> regular-season wins, losses, ties, points_for, points_against.
+
+    The sheet's own W/L/PF/PA are kept where it has them; matchups fill the rest
+    (ties only ever come from matchups).
+    """
+    final = (
+        standings_weeks.groupby(["team_key", "year"], dropna=False, observed=True)[list(STANDING_COLUMNS)]
+                       .last()
+                       .reset_index()
+    )
+    sheet = [c for c in STANDING_COLUMNS if c in teams.columns]
+    base = teams[["team_key", "year", *sheet]].dropna(subset=["team_key"])
+    out = base.merge(_key_like(final, base, "team_key"), on=["team_key", "year"], how="left", suffixes=("", "_calc"))
+    for c in sheet:
+        out[c] = out[c].fillna(out.pop(f"{c}_calc"))
+    return out[["team_key", "year", *STANDING_COLUMNS]].reset_index(drop=True)
+
+
+def with_standings(teams, standings):
+    """teams with blank or missing W/L/PF/PA (and ties) filled from the standings table."""
+    calc = _key_like(standings.drop(columns=["year"]).drop_duplicates(subset=["team_key"]), teams, "team_key")
+    calc = teams[["team_key"]].merge(calc, on="team_key", how="left")
+    fill = {}
+    for c in STANDING_COLUMNS:
+        if c not in teams.columns:
+            fill[c] = calc[c].to_numpy()
+        elif teams[c].isna().any():
+            fill[c] = teams[c].fillna(pd.Series(calc[c].to_numpy(), index=teams.index))
+    return teams.assign(**fill) if fill else teams
+
+
+# -----------------------------
+# Positional summaries over every season at once
+# -----------------------------
+def starter_slot_weeks(player_weeks):
+    """Regular-season starters averaged per team x week x started slot (two RBs -> their mean).
+
+    Columns: year, team_key, owner_name, week, pos (the slot), weekly_avg.
+    """
+    pm = player_weeks[(player_weeks["is_playoffs"] == 0) & player_weeks["has_matchup"] & player_weeks["is_started"]]
+    pm = pm.assign(player_week_points=pm["player_week_points"].fillna(0.0))
+    return (
+        pm.groupby(["year", "team_key", "owner_name", "week", "slot"], as_index=False, dropna=False, observed=True)
+          ["player_week_points"].mean()
+          .rename(columns={"player_week_points": "weekly_avg", "slot": "pos"})
+    )
+
+
+def build_positional_edge(player_weeks, slot_weeks=None):
+    """(year, owner_name, pos) -> edge: an owner's average weekly points per started slot
+    minus the rest of the league's that week, i.e. against the leave-one-out mean
+    (week sum - own) / (teams - 1). Regular season; one pass over every season."""
+    tw = starter_slot_weeks(player_weeks) if slot_weeks is None else slot_weeks
+    grp = tw.groupby(["year", "week", "pos"], observed=True)["weekly_avg"]
+    total, n = grp.transform("sum"), grp.transform("count")
+    loo = np.where(n > 1, (total - tw["weekly_avg"]) / (n - 1).replace(0, np.nan), tw["weekly_avg"])
+    return (
+        tw.assign(edge=tw["weekly_avg"] - loo)
+          .groupby(["year", "owner_name", "pos"], dropna=False, observed=True)["edge"].mean()
+          .reset_index()
+    )
+
+
+def build_position_ranks(player_weeks, slot_weeks=None):
+    """(year, owner_name, pos) -> avg (mean weekly starter points per slot, regular season)
+    and rank: dense within the season and slot, 1 = best."""
+    tw = starter_slot_weeks(player_weeks) if slot_weeks is None else slot_weeks
+    ranks = (
+        tw.groupby(["year", "owner_name", "pos"], dropna=False, observed=True)["weekly_avg"]
+          .mean().round(4)
+          .rename("avg")
+          .reset_index()
+    )
+    ranks["rank"] = ranks.groupby(["year", "pos"], observed=True)["avg"].rank(method="dense", ascending=False)
+    return ranks
+
+
+# -----------------------------
+# Game records: top/bottom k regular-season games per season, per owner and all time
+# -----------------------------
+# metric -> (team-week result the game must have, or None for any; column ranked)
+RECORD_METRICS = {
+    "score": (None, "points_for"),
+    "win_margin": ("win", "margin"),
+    "win_score": ("win", "points_for"),
+    "loss_score": ("loss", "points_for"),
+}
+# The superlatives the tabs show: label -> (metric, end)
+GAME_RECORDS = {
+    "Highest Team Score": ("score", "top"),
+    "Lowest Team Score": ("score", "bottom"),
+    "Biggest Win": ("win_margin", "top"),
+    "Closest Win": ("win_margin", "bottom"),
+    "Luckiest Win": ("win_score", "bottom"),
+    "Unluckiest Loss": ("loss_score", "top"),
+}
+# Kept per list; more than the longest list shown (25) so pages can drop unfinished seasons
+RECORDS_K = 50
+RECORD_COLUMNS = ("team_key", "year", "week", "owner_name", "team_name", "opponent_owner_name",
+                  "points_for", "points_against", "margin", "result")
+
+
+def _extreme_positions(values, k, largest):
+    """Positions of the k largest/smallest values, best first; the earlier row wins a tie
+    (as idxmax/idxmin would). A partial selection, not a full sort."""
+    v = -values if largest else values
+    if len(v) > k:
+        kth = np.partition(v, k - 1)[k - 1]
+        cand = np.flatnonzero(v <= kth)  # everything tied with the k-th stays in
+    else:
+        cand = np.arange(len(v))
+    return cand[np.lexsort((cand, v[cand]))[:k]]
+
+
+def _top_bottom(games, k):
+    """{(metric, end): the k best/worst games} for one scope's games."""
+    out = {}
+    result = games["result"].to_numpy() if "result" in games.columns else None
+    for metric, (need, col) in RECORD_METRICS.items():
+        if col not in games.columns or (need is not None and result is None):
+            continue
+        values = games[col].to_numpy(dtype=float)
+        keep = ~np.isnan(values)
+        if need is not None:
+            keep &= result == need
+        pos = np.flatnonzero(keep)
+        for end in ("top", "bottom"):
+            out[(metric, end)] = games.iloc[pos[_extreme_positions(values[pos], k, end == "top")]]
+    return out
+
+
+def build_records_index(team_weeks, k=RECORDS_K):
+    """Regular-season game records, one selection pass per scope:
+    {"all": {(metric, end): games}, "season": {year: {...}}, "owner": {owner_name: {...}}}.
+
+    Each entry holds up to k games, best first (end "top" = largest). See RECORD_METRICS.
+    """
+    games = team_weeks
+    if "is_playoffs" in games.columns:
+        games = games[games["is_playoffs"] == 0]
+    games = games[[c for c in RECORD_COLUMNS if c in games.columns]].reset_index(drop=True)
+    index = {"all": _top_bottom(games, k), "season": {}, "owner": {}}
+    for scope, by in (("season", "year"), ("owner", "owner_name")):
+        if by in games.columns:
+            for key, part in games.groupby(by, observed=True, sort=False):
+                index[scope][key] = _top_bottom(part, k)
+    return index
+
+
+def record_games(index, metric, end, season=None, owner=None, k=None):
+    """The top/bottom games for one metric (all time, or one season/owner); empty if none."""
+    if season is not None:
+        scope = index["season"].get(season, {})
+    elif owner is not None:
+        scope = index["owner"].get(owner, {})
+    else:
+        scope = index["all"]
+    games = scope.get((metric, end))
+    if games is None:
+        games = pd.DataFrame(columns=list(RECORD_COLUMNS))
+    return games if k is None else games.head(k)
+
+
+def add_fact_tables(tables):
+    """Attach player_weeks/team_weeks (and the standings, records and positional
+    summaries built from them) to a loaded tables dict (in place) and return it.
+
+    teams is replaced by a copy with its W/L/PF/PA gaps filled from the standings.
+    """
+    tables["team_weeks"] = build_team_weeks(tables["teams"], tables["matchups"])
+    tables["standings_weeks"] = build_standings_weeks(tables["team_weeks"])
+    tables["standings"] = build_standings(tables["teams"], tables["standings_weeks"])
+    tables["teams"] = with_standings(tables["teams"], tables["standings"])
+    tables["records_index"] = build_records_index(tables["team_weeks"])
+    tables["player_weeks"] = build_player_weeks(
+        tables["teams"], tables["matchups"], tables["players"], tables.get("draft_roster")
+    )
+    slot_weeks = starter_slot_weeks(tables["player_weeks"])
+    tables["positional_edge"] = build_positional_edge(tables["player_weeks"], slot_weeks)
+    tables["position_ranks"] = build_position_ranks(tables["player_weeks"], slot_weeks)
+    return tables
+
+
+# -----------------------------
+# Season / owner partitions: each table split once, so a selection is a dict lookup
+# -----------------------------
+class RowPositions(dict):
+    """{key: row positions} into one frame (a lazy partition); rows() takes the rows on access."""
+
+    def __init__(self, frame, positions):
+        super().__init__(positions)
+        self.frame = frame
+
+
+def partition(df, by, lazy=False):
+    """{key: rows} from one groupby pass (row order kept); key None -> empty frame with df's columns.
+
+    lazy=True keeps only each key's row positions (RowPositions) instead of a copy of the rows.
+    """
+    groups = df.groupby(by, observed=True, sort=False)
+    if lazy:
+        parts = RowPositions(df, {key: pos.astype(np.int32) for key, pos in groups.indices.items()})
+        parts[None] = np.empty(0, dtype=np.int32)
+        return parts
+    parts = {key: rows for key, rows in groups}
+    parts[None] = df.iloc[:0]
+    return parts
+
+
+def build_season_index(teams, team_weeks=None, player_weeks=None, draft_roster=None, lazy=False,
+                       standings=None, positional_edge=None, position_ranks=None):
+    """{table: {year: rows}} for the tables given; draft_roster is placed in a season through its team_key."""
+    index = {"teams": partition(teams, "year", lazy)}
+    for name, df in (("team_weeks", team_weeks), ("player_weeks", player_weeks), ("standings", standings),
+                     ("positional_edge", positional_edge), ("position_ranks", position_ranks)):
+        if df is not None:
+            index[name] = partition(df, "year", lazy)
+    if draft_roster is not None:
+        team_year = _team_info(teams).set_index("team_key")["year"]
+        index["draft_roster"] = partition(draft_roster, draft_roster["team_key"].map(team_year).rename("year"), lazy)
+    return index
+
+
+def build_owner_index(teams, team_weeks, player_weeks, lazy=False):
+    """{table: {owner_name: rows}}."""
+    return {
+        "teams": partition(teams, "owner_name", lazy),
+        "team_weeks": partition(team_weeks, "owner_name", lazy),
+        "player_weeks": partition(player_weeks, "owner_name", lazy),
+    }
+
+
+def rows(index, name, key):
+    """Rows of table `name` for one season/owner; an empty frame (same columns) if there are none."""
+    parts = index[name]
+    part = parts.get(key, parts[None])
+    return parts.frame.iloc[part] if isinstance(parts, RowPositions) else part
+
+
+def add_partitions(tables, lazy=False):
+    """Attach season_index/owner_index (built from the fact tables) to a loaded tables dict."""
+    tables["season_index"] = build_season_index(
+        tables["teams"], tables["team_weeks"], tables["player_weeks"], tables.get("draft_roster"), lazy,
+        standings=tables.get("standings"), positional_edge=tables.get("positional_edge"),
+        position_ranks=tables.get("position_ranks"),
+    )
+    tables["owner_index"] = build_owner_index(tables["teams"], tables["team_weeks"], tables["player_weeks"], lazy)
+    return tables
@@ -0,0 +1,163 @@
+import argparse
+import json
+import os
+import random
+import resource
+import threading
+import time
+
+import pandas as pd
+
+from bench_tabs import scenarios, synthetic_tables
+from headless_st import PAGES, HeadlessSt, load_tables, render_page
+from view_cache import ViewCache
+from view_model import build_view
+
+# -----------------------------
+# Load test: N concurrent sessions in one process
+# -----------------------------
+#   python load_test.py --size 12x9 --sessions 1 5 10 20 --duration 30
+#   python load_test.py --data /tmp/league-snap --sessions 12 --think 5 --warm
+#   python load_test.py --size 12x9 --no-cache --out before.json
+#
+# Each session is a thread running the headless harness like a Streamlit script
+# thread: pick a page and a selection (draft night and the Sunday recap weigh the
+# draft and season pages up), render it, think, repeat. Sessions share one view
+# cache, as the server's sessions do. For every N the run reports render latency
+# percentiles, the process' CPU use (1.0 = one core busy) and its memory. The
+# cache carries over from level to level, as it would in a long-running server.
+
+# Relative chance of a session going to each page next
+PAGE_WEIGHTS = {"season": 4, "team": 3, "owner": 1, "league": 1, "hall_of_fame": 1, "draft": 2}
+
+
+def _rss_mb():
+    # Current resident set size (Linux); falls back to the peak elsewhere
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def _percentile(values, q):
+    if not values:
+        return None
+    return float(pd.Series(values).quantile(q))
+
+
+def run_level(tables, n, duration, think, cache=None, seed=0):
+    """Run n sessions for `duration` seconds; returns latency/CPU/memory stats for the level."""
+    by_page = {}
+    for page, sel in scenarios(tables):
+        by_page.setdefault(page, []).append(sel)
+    pages = [p for p in PAGE_WEIGHTS if p in by_page]
+    weights = [PAGE_WEIGHTS[p] for p in pages]
+    build = cache.get if cache is not None else build_view
+
+    latencies, errors = [], []
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def session(i):
+        rng = random.Random(seed * 1000 + i)
+        time.sleep(rng.uniform(0, think))  # don't all arrive at once
+        while time.perf_counter() < stop_at:
+            page = rng.choices(pages, weights)[0]
+            st = HeadlessSt(rng.choice(by_page[page]))
+            start = time.perf_counter()
+            try:
+                render_page(page, st, tables, build=build)
+            except Exception as e:
+                with lock:
+                    errors.append(f"{page}: {e}")
+            else:
+                with lock:
+                    latencies.append(time.perf_counter() - start)
+            time.sleep(rng.expovariate(1 / think) if think > 0 else 0)
+
+    rss_before = _rss_mb()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    threads = [threading.Thread(target=session, args=(i,), daemon=True) for i in range(n)]
+    for t in threads:
+        t.start()
+    rss_peak = rss_before
+    while any(t.is_alive() for t in threads):
+        rss_peak = max(rss_peak, _rss_mb())
+        time.sleep(0.2)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    return {
+        "sessions": n,
+        "renders": len(latencies),
+        "errors": len(errors),
+        "first_errors": errors[:3],
+        "throughput": len(latencies) / wall,
+        "p50": _percentile(latencies, 0.50),
+        "p95": _percentile(latencies, 0.95),
+        "p99": _percentile(latencies, 0.99),
+        "max": max(latencies) if latencies else None,
+        "cpu": cpu / wall,
+        "rss_mb": rss_peak,
+        "rss_growth_mb": rss_peak - rss_before,
+        "cache": cache.stats() if cache is not None else None,
+    }
+
+
+def format_level(r):
+    ms = lambda v: f"{v * 1000:8.0f}" if v is not None else "       -"
+    hit = r["cache"]["hit_rate"] if r["cache"] else None
+    return (f"{r['sessions']:>5} {r['renders']:>8} {r['throughput']:7.1f}/s {ms(r['p50'])} {ms(r['p95'])} "
+            f"{ms(r['p99'])} {r['cpu']:6.2f} {r['rss_mb']:8.0f} "
+            + (f"{hit:7.0%}" if hit is not None else "      -")
+            + (f"  {r['errors']} errors" if r["errors"] else ""))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent dashboard sessions and report latency, CPU and memory.")
+    parser.add_argument("--data", help="directory of sheet CSVs or a snapshot")
+    parser.add_argument("--size", default="12x9", help="synthetic league OWNERSxSEASONS when --data isn't given")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 20], help="concurrent sessions per level")
+    parser.add_argument("--duration", type=float, default=30, help="seconds per level")
+    parser.add_argument("--think", type=float, default=3, help="mean think time between clicks (seconds)")
+    parser.add_argument("--no-cache", action="store_true", help="render without the view cache")
+    parser.add_argument("--cache-size", type=int, default=512)
+    parser.add_argument("--warm", action="store_true", help="precompute every view before the first level")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the levels as JSON")
+    args = parser.parse_args(argv)
+
+    if args.data:
+        tables = load_tables(args.data)
+    else:
+        owners, _, seasons = args.size.lower().partition("x")
+        tables = synthetic_tables(int(owners), int(seasons))
+
+    cache = None if args.no_cache else ViewCache(args.cache_size)
+    if args.warm and cache is not None:
+        from precompute import PRECOMPUTE_WORKERS, precompute_views
+        start = time.perf_counter()
+        views = precompute_views(tables, cache, max(1, PRECOMPUTE_WORKERS))
+        print(f"warmed {views} views in {time.perf_counter() - start:.1f}s")
+    else:
+        # Pay for imports and first-call setup outside the measurement
+        for page in PAGES:
+            render_page(page, HeadlessSt(), tables)
+
+    print(f"{'N':>5} {'renders':>8} {'thruput':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'cpu':>6} {'rss MB':>8} {'hits':>7}")
+    levels = []
+    for n in args.sessions:
+        result = run_level(tables, n, args.duration, args.think, cache, args.seed)
+        levels.append(result)
+        print(format_level(result))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"args": vars(args), "pandas": pd.__version__, "levels": levels}, f, indent=1)
+        print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
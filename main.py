@@ -1,19 +1,40 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-from tab_hall_of_fame import show_hall_of_fame
-from tab_league_rules import show_league_rules
-from tab_league_insights import show_league_insights
-from tab_draft_board import show_draft_board
-from tab_owner_insights import show_owner_insights
-from tab_team_insights import show_team_insights
-from tab_season_insights import show_season_insights
+from data_loader import load_league_data, show_refresh_control
+from perf import add_section, collect_sections, perf_enabled, show_perf_overlay, timed_st
+from view_cache import VIEW_CACHE
+import precompute  # noqa: F401  (warms VIEW_CACHE in the background after each data load)
+from view_model import show_page
 import base64
+import io
+import time
 from pathlib import Path
 
-# Read and embed the logos
+# Page modules are imported by view_model.build_view, only for the page being shown
+
+run_start = time.perf_counter()
+
+
+# Logo embedded in the banner: resized to the displayed height (x2 for retina) and
+# base64-encoded once per process instead of on every rerun
+@st.cache_resource
+def logo_base64(path, height=140):
+    raw = Path(path).read_bytes()
+    try:
+        from PIL import Image
+
+        img = Image.open(io.BytesIO(raw))
+        if img.height > height:
+            img.thumbnail((img.width * height // img.height, height))
+            buf = io.BytesIO()
+            img.save(buf, format="PNG", optimize=True)
+            raw = buf.getvalue()
+    except Exception:
+        pass  # fall back to the original file
+    return base64.b64encode(raw).decode()
+
+
 logo_path = Path(__file__).parent / "assets" / "logo.png"  # robust relative path
-logo_b64 = base64.b64encode(logo_path.read_bytes()).decode()
+logo_b64 = logo_base64(str(logo_path))
 
 # Page config and styling
 st.set_page_config(page_title="Dayton Boyz Fantasy Football", layout="wide")
@@ -89,21 +110,12 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-# Load data
-teams_csv_url = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQvhSWRerxihgW73Bicic4j1wY052Cda0oES-97_oafR6WWueA5P6QN3Vsrv0pknHGwrw4pJ8EBawu2/pub?output=csv"
-matchups_csv_url = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQvhSWRerxihgW73Bicic4j1wY052Cda0oES-97_oafR6WWueA5P6QN3Vsrv0pknHGwrw4pJ8EBawu2/pub?gid=625049670&single=true&output=csv"
-players_csv = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQvhSWRerxihgW73Bicic4j1wY052Cda0oES-97_oafR6WWueA5P6QN3Vsrv0pknHGwrw4pJ8EBawu2/pub?gid=1947173700&single=true&output=csv"
-draft_roster_csv = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQvhSWRerxihgW73Bicic4j1wY052Cda0oES-97_oafR6WWueA5P6QN3Vsrv0pknHGwrw4pJ8EBawu2/pub?gid=1611857667&single=true&output=csv"
-final_roster_csv = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQvhSWRerxihgW73Bicic4j1wY052Cda0oES-97_oafR6WWueA5P6QN3Vsrv0pknHGwrw4pJ8EBawu2/pub?gid=148379330&single=true&output=csv"
-
-teams_df = pd.read_csv(teams_csv_url)
-matchups_df = pd.read_csv(matchups_csv_url)
-players_df = pd.read_csv(players_csv)
-draft_roster_df = pd.read_csv(draft_roster_csv)
-final_roster_df = pd.read_csv(final_roster_csv)
-
-for df in [teams_df, matchups_df, players_df, draft_roster_df, final_roster_df]:
-    df.columns = df.columns.str.strip().str.lower()
+# Load data (cached across reruns and sessions; see data_loader.DATA_TTL_SECONDS); the
+# fact tables and season/owner partitions (league_facts.py) come built with it
+load_start = time.perf_counter()
+league_data = load_league_data()
+load_seconds = time.perf_counter() - load_start
+show_refresh_control(st, league_data["loaded_at"])
 
 # Dropdown with label text in a separate column
 # --- Force *all* selectboxes to render label + control inline (mobile-safe) ---
@@ -152,23 +164,34 @@ page = st.selectbox(
     key="page_select"
 )
 
-if page == "Season Summary":
-    show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster_df)
-
-elif page == "Team Summary":
-    show_team_insights(st, go, teams_df, matchups_df, players_df)
 
-elif page == "Owner History":
-    show_owner_insights(st, go, teams_df, matchups_df, players_df)
-
-if page == "League History":
-    show_league_insights(st, go, teams_df, matchups_df)
-
-elif page == "Hall of Fame/ Shame":
-    show_hall_of_fame(st, teams_df, matchups_df, players_df)
+# Select Page label -> view_model page
+PAGE_VIEWS = {
+    "Season Summary": "season",
+    "Team Summary": "team",
+    "Owner History": "owner",
+    "League History": "league",
+    "Hall of Fame/ Shame": "hall_of_fame",
+    "Draft Boards": "draft",
+}
 
-elif page == "Draft Boards":
-    show_draft_board(st, teams_df, draft_roster_df, players_df, matchups_df)
 
-elif page == "Rulebook":
-    show_league_rules(st)
\ No newline at end of file
+def render_page(st, page):
+    if page == "Rulebook":
+        from tab_league_rules import show_league_rules
+        show_league_rules(st)
+        return
+    # Computed into a view model (view_model.py) or taken from the cross-session cache, then rendered
+    show_page(st, PAGE_VIEWS[page], league_data, build=VIEW_CACHE.get)
+
+
+# Debug: ?perf=1 (or LEAGUE_PERF=1) adds a timing waterfall at the bottom of the page
+if perf_enabled(st):
+    with collect_sections(origin=run_start) as sections:
+        add_section("data", "load_league_data", load_start, load_seconds)
+        page_start = time.perf_counter()
+        render_page(timed_st(st, page), page)
+        add_section(page, "page total", page_start, time.perf_counter() - page_start)
+    show_perf_overlay(st, sections, league_data.get("load_timings"), league_data, VIEW_CACHE.stats())
+else:
+    render_page(st, page)
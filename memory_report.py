@@ -0,0 +1,64 @@
+import argparse
+
+import pandas as pd
+
+from bench_tabs import synthetic_tables
+from data_loader import LOW_MEMORY
+from headless_st import PAGES, HeadlessSt, load_tables, render_page
+from perf import memory_by_table, memory_report, render_peak
+
+# -----------------------------
+# Memory footprint of the loaded data and of rendering each page
+# -----------------------------
+#   python memory_report.py --data /tmp/league
+#   python memory_report.py --size 20x30 --columns 15
+#   LEAGUE_LOW_MEMORY=1 python memory_report.py --size 20x30     # compare with budget mode
+
+
+def _mb(n):
+    return f"{n / 1e6:8.2f} MB"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report memory use of the league tables and of each page render.")
+    parser.add_argument("--data", help="directory of sheet CSVs or a snapshot")
+    parser.add_argument("--size", default="12x9", help="synthetic league OWNERSxSEASONS when --data isn't given")
+    parser.add_argument("--page", action="append", choices=list(PAGES), help="page(s) to render (default: all)")
+    parser.add_argument("--columns", type=int, default=10, help="largest columns to list")
+    parser.add_argument("--sites", type=int, default=5, help="top allocation sites per page")
+    args = parser.parse_args(argv)
+
+    if args.data:
+        tables = load_tables(args.data)
+    else:
+        owners, _, seasons = args.size.lower().partition("x")
+        tables = synthetic_tables(int(owners), int(seasons))
+    print(f"low-memory mode: {'on' if LOW_MEMORY else 'off'}  (pandas {pd.__version__})")
+
+    report = memory_report(tables)
+    print("\nTables")
+    for row in memory_by_table(report).itertuples():
+        print(f"  {row.table:<28} {row.rows:>9} rows {row.columns:>3} cols {_mb(row.bytes)}")
+    print(f"  {'total':<28} {'':>23} {_mb(report['bytes'].sum())}")
+
+    print("\nLargest columns")
+    for row in report.nlargest(args.columns, "bytes").itertuples():
+        print(f"  {row.table + '.' + row.column:<44} {row.dtype:<10} {_mb(row.bytes)}")
+
+    print("\nPeak allocation while rendering (default selections; after one warm-up render)")
+    for page in args.page or PAGES:
+        try:
+            render_page(page, HeadlessSt(), tables)  # first render pays for lazy imports
+            st = HeadlessSt()
+            peak, sites = render_peak(lambda: render_page(page, st, tables), top=args.sites)
+        except Exception as e:
+            print(f"  {page:<13} failed: {e}")
+            continue
+        print(f"  {page:<13} {_mb(peak)}")
+        for site, size in sites:
+            print(f"      {site:<36} {_mb(size)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,309 @@
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import pandas as pd
+
+from league_facts import RowPositions
+
+# -----------------------------
+# Section timings inside a page render
+# -----------------------------
+# A tab calls mark = section_marks("season") once at the top and mark("heatmap")
+# at the end of each section; every mark records the time since the previous one.
+# Nothing is recorded (and marks are nearly free) unless a caller is collecting:
+#
+#   with collect_sections() as sections:
+#       show_season_insights(st, ...)
+#   sections  ->  [{"page": "season", "section": "setup", "start": 0.0, "seconds": 0.012}, ...]
+#
+# The collector is a ContextVar, so concurrent Streamlit sessions (one script
+# thread each) never see each other's timings.
+
+_collector = ContextVar("perf_sections", default=None)
+
+
+@contextmanager
+def collect_sections(origin=None):
+    """Collect section timings of everything rendered inside the block into a list.
+
+    Starts are seconds since `origin` (a time.perf_counter() value; default: now).
+    """
+    sections = []
+    token = _collector.set((time.perf_counter() if origin is None else origin, sections))
+    try:
+        yield sections
+    finally:
+        _collector.reset(token)
+
+
+def section_marks(page):
+    """Return mark(name), which records the time since the previous mark as section `name` of `page`."""
+    collector = _collector.get()
+    if collector is None:
+        return _no_mark
+
+    last = [time.perf_counter()]
+
+    def mark(name):
+        now = time.perf_counter()
+        add_section(page, name, last[0], now - last[0])
+        last[0] = now
+
+    return mark
+
+
+def _no_mark(name):
+    pass
+
+
+def add_section(page, name, start, seconds, **extra):
+    """Record one timing (start is a time.perf_counter() value) if a caller is collecting."""
+    collector = _collector.get()
+    if collector is None:
+        return
+    origin, sections = collector
+    sections.append({"page": page, "section": name, "start": start - origin, "seconds": seconds, **extra})
+
+
+# -----------------------------
+# Opt-in performance overlay (?perf=1 or LEAGUE_PERF=1)
+# -----------------------------
+# main.py renders the page through timed_st() while collecting sections, then
+# show_perf_overlay() draws a collapsible waterfall of the data load, the page's
+# sections and every chart/table call with the bytes it sent to the browser.
+
+PERF_ENV = "LEAGUE_PERF"
+_ON = ("1", "true", "yes", "on")
+
+# Markdown/HTML bodies smaller than this are left out of the overlay (CSS snippets, labels)
+MIN_HTML_BYTES = 2048
+
+
+def perf_enabled(st):
+    if os.environ.get(PERF_ENV, "").lower() in _ON:
+        return True
+    try:
+        return str(st.query_params.get("perf", "")).lower() in _ON
+    except Exception:
+        return False
+
+
+def payload_bytes(kind, obj):
+    """Approximate bytes Streamlit sends for one element (figure JSON, Arrow table, HTML)."""
+    try:
+        if kind == "plotly_chart":
+            return len(obj.to_json())
+        if kind == "dataframe":
+            from pandas.io.formats.style import Styler
+            import pyarrow as pa
+
+            df = obj.data if isinstance(obj, Styler) else pd.DataFrame(obj)
+            table = pa.Table.from_pandas(df)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return sink.getvalue().size
+        return len(str(obj).encode())
+    except Exception:
+        return None
+
+
+class _TimedSt:
+    """Wraps st (or a column/tab container): element calls are timed and sized, the rest passes through."""
+
+    TIMED = ("plotly_chart", "dataframe", "markdown", "html")
+    CONTAINERS = ("columns", "tabs")
+
+    def __init__(self, target, page, counter):
+        self._target = target
+        self._page = page
+        self._counter = counter
+
+    def __getattr__(self, attr):
+        value = getattr(self._target, attr)
+        if attr in self.TIMED:
+            return self._timed(attr, value)
+        if attr in self.CONTAINERS:
+            return lambda *a, **k: [_TimedSt(c, self._page, self._counter) for c in value(*a, **k)]
+        if attr in ("expander", "container"):
+            return lambda *a, **k: _TimedSt(value(*a, **k), self._page, self._counter)
+        if attr == "sidebar":
+            return _TimedSt(value, self._page, self._counter)
+        return value
+
+    def _timed(self, kind, fn):
+        def call(body, *args, **kwargs):
+            start = time.perf_counter()
+            result = fn(body, *args, **kwargs)
+            seconds = time.perf_counter() - start
+            size = payload_bytes(kind, body)
+            if kind in ("markdown", "html") and (size or 0) < MIN_HTML_BYTES:
+                return result
+            self._counter[kind] = self._counter.get(kind, 0) + 1
+            add_section(self._page, f"{kind} #{self._counter[kind]}", start, seconds, bytes=size)
+            return result
+        return call
+
+    def __enter__(self):
+        self._target.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._target.__exit__(*exc)
+
+
+def timed_st(st, page):
+    return _TimedSt(st, page, {})
+
+
+def show_perf_overlay(st, sections, load_timings=None, tables=None, view_cache=None):
+    """Collapsible waterfall of this rerun (sections + element calls), the last data load
+    and, given the loaded tables, their memory footprint (and view cache counters)."""
+    import plotly.graph_objects as go
+
+    with st.expander("⏱ Performance (this rerun)", expanded=False):
+        if sections:
+            df = pd.DataFrame(sections).sort_values("start", kind="stable")
+            if "bytes" not in df.columns:
+                df["bytes"] = None
+            df["label"] = df["page"] + " · " + df["section"]
+            total = (df["start"] + df["seconds"]).max()
+            st.caption(f"{total * 1000:.0f} ms from the start of the script; "
+                       f"{df['bytes'].fillna(0).sum() / 1024:.0f} KB of chart/table/HTML payload")
+
+            fig = go.Figure(go.Bar(
+                y=df["label"], x=df["seconds"] * 1000, base=df["start"] * 1000, orientation="h",
+                marker_color=["#E63946" if pd.notna(b) else "#457B9D" for b in df["bytes"]],
+                hovertemplate="%{y}<br>%{base:.0f} → +%{x:.1f} ms<extra></extra>",
+            ))
+            fig.update_layout(
+                height=max(240, 22 * len(df) + 60), margin=dict(l=10, r=10, t=10, b=30),
+                xaxis_title="ms", yaxis=dict(autorange="reversed"), showlegend=False,
+            )
+            st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+
+            table = df[["page", "section", "start", "seconds", "bytes"]].assign(
+                start=(df["start"] * 1000).round(1), seconds=(df["seconds"] * 1000).round(1),
+            ).rename(columns={"start": "start (ms)", "seconds": "time (ms)"})
+            st.dataframe(table, hide_index=True, use_container_width=True)
+
+        if load_timings:
+            st.caption("Last data load (background refresh or startup)")
+            st.dataframe(
+                pd.DataFrame({"step": list(load_timings), "time (ms)": [round(v * 1000, 1) for v in load_timings.values()]}),
+                hide_index=True, use_container_width=True,
+            )
+
+        if tables is not None:
+            mem = memory_by_table(memory_report(tables))
+            st.caption(f"Loaded data in memory: {mem['bytes'].sum() / 1e6:.1f} MB")
+            st.dataframe(
+                mem.assign(MB=(mem["bytes"] / 1e6).round(2)).drop(columns=["bytes"]),
+                hide_index=True, use_container_width=True,
+            )
+
+        if view_cache:
+            rate = view_cache["hit_rate"]
+            st.caption(
+                f"View cache: {view_cache['entries']}/{view_cache['max_entries']} views, "
+                f"{view_cache['hits']} hits, {view_cache['misses']} misses, {view_cache['evictions']} evictions"
+                + (f" ({rate:.0%} hit rate)" if rate is not None else "")
+            )
+
+
+# -----------------------------
+# Memory footprint
+# -----------------------------
+# Deep (Python objects included) bytes per column of the loaded and derived
+# tables, and the peak Python allocation while rendering a page.
+
+def frame_memory(name, df):
+    """One row per column of df: table, column, dtype, rows, bytes."""
+    usage = df.memory_usage(deep=True, index=False)
+    return pd.DataFrame({
+        "table": name,
+        "column": usage.index.astype(str),
+        "dtype": [str(df[c].dtype) for c in usage.index],
+        "rows": len(df),
+        "bytes": usage.to_numpy(),
+    })
+
+
+def _frames(groups):
+    # The frames of a partition ({key: rows}), or of a nested index like records_index
+    for key, value in groups.items():
+        if isinstance(value, pd.DataFrame):
+            if key is not None:
+                yield value
+        elif isinstance(value, dict):
+            yield from _frames(value)
+
+
+def memory_report(tables):
+    """Per-column memory of every frame in a loaded tables dict (the frames of each
+    *_index, e.g. season/owner partitions or the records index, summed per table)."""
+    parts = []
+    for name, value in tables.items():
+        if isinstance(value, pd.DataFrame):
+            parts.append(frame_memory(name, value))
+        elif name.endswith("_index") and isinstance(value, dict):
+            for table, groups in value.items():
+                if isinstance(groups, RowPositions):
+                    pos = [p for key, p in groups.items() if key is not None]
+                    parts.append(pd.DataFrame({
+                        "table": [f"{name}.{table}"], "column": ["(row positions)"], "dtype": ["int32"],
+                        "rows": [sum(len(p) for p in pos)], "bytes": [sum(p.nbytes for p in pos)],
+                    }))
+                    continue
+                frames = list(_frames(groups)) if isinstance(groups, dict) else []
+                if frames:
+                    cols = pd.concat([frame_memory(f"{name}.{table}", df) for df in frames], ignore_index=True)
+                    parts.append(
+                        cols.groupby(["table", "column"], sort=False, as_index=False)
+                            .agg(dtype=("dtype", "first"), rows=("rows", "sum"), bytes=("bytes", "sum"))
+                    )
+    return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+
+def memory_by_table(report):
+    return (
+        report.groupby("table", sort=False)
+        .agg(rows=("rows", "max"), columns=("column", "size"), bytes=("bytes", "sum"))
+        .reset_index()
+    )
+
+
+def render_peak(fn, top=10):
+    """Run fn() under tracemalloc.
+
+    Returns (peak bytes above the start, [(file:line, bytes)]): the peak, and the
+    lines of this repo holding the most memory still allocated when fn returns
+    (e.g. frames and figures handed to st), by the innermost repo frame.
+    """
+    import tracemalloc
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(25)
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1] - base
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    sites = {}
+    for trace in snapshot.traces:
+        frame = next((f for f in reversed(trace.traceback) if f.filename.startswith(_REPO_DIR)), None)
+        if frame is not None:
+            site = f"{os.path.basename(frame.filename)}:{frame.lineno}"
+            sites[site] = sites.get(site, 0) + trace.size
+    return peak, sorted(sites.items(), key=lambda kv: kv[1], reverse=True)[:top]
+
+
+_REPO_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
@@ -0,0 +1,171 @@
+import argparse
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import data_loader
+from league_facts import rows
+from view_cache import VIEW_CACHE
+from view_model import PAGES, build_view
+
+log = logging.getLogger(__name__)
+
+# -----------------------------
+# Cache warm-up: build every view right after new data lands
+# -----------------------------
+# The pages a user can reach are finite (each page x season x owner), so after a
+# load the views are built in a process pool and stored in VIEW_CACHE; first clicks
+# then hit a warm cache. What a first visit shows (every page's default view, i.e.
+# the latest season) goes first, then the rest newest season first.
+#
+#   python precompute.py --data /tmp/league-snap --workers 2    # time a warm-up
+#
+# LEAGUE_PRECOMPUTE_WORKERS sets the pool size (0 turns the warm-up off). Every
+# worker holds its own copy of the tables, so low-memory mode defaults to off.
+
+_cpus = os.cpu_count() or 1
+PRECOMPUTE_WORKERS = int(os.environ.get(
+    "LEAGUE_PRECOMPUTE_WORKERS", "0" if data_loader.LOW_MEMORY else str(max(1, min(4, _cpus - 1)))))
+
+
+def view_plan(tables):
+    """Batches of (page, selections): each page's default view, the team page's default
+    for each owner (owner picked, year not yet), then every other view, newest season first."""
+    teams = tables["teams"]
+    seasons = sorted((int(y) for y in teams["year"].dropna().unique()), reverse=True)
+    owners = sorted(teams["owner_name"].dropna().astype(str).unique())
+    # The team page leaves out 2017; the draft page only lists seasons with a draft
+    owner_years = {o: set(rows(tables["owner_index"], "teams", o)["year"].dropna().astype(int)) - {2017}
+                   for o in owners}
+    draft_seasons = {int(y) for y in tables["season_index"]["draft_roster"] if y is not None}
+
+    plan = []
+    for i, year in enumerate(seasons):
+        plan.append(("season", {"season_insights_year": year}))
+        plan += [("team", {"owner_select": o, f"year_for_{o}": year}) for o in owners if year in owner_years[o]]
+        if year in draft_seasons:
+            plan.append(("draft", {"draft_board_year": str(year)}))
+        if i == 0:
+            plan += [("owner", {"owner_history_select": o}) for o in owners]
+            plan += [("league", {"league_current_owners": flag}) for flag in (True, False)]
+    return [
+        [(page, {}) for page in PAGES],
+        [("team", {"owner_select": o}) for o in owners],
+        plan,
+    ]
+
+
+# Worker side: the tables arrive once per process, then each task is one view
+_worker_tables = None
+
+
+def _init_worker(tables):
+    global _worker_tables
+    _worker_tables = tables
+
+
+def _build(page, selections):
+    return build_view(page, _worker_tables, selections)
+
+
+def precompute_views(tables, cache=VIEW_CACHE, workers=PRECOMPUTE_WORKERS, current=None):
+    """Build the views of `tables` that `cache` doesn't have yet, in a process pool.
+
+    Stops early (pending views cancelled) once current() no longer returns these
+    tables, i.e. newer data has landed. Returns the number of views stored.
+    """
+    stored = 0
+    # Leave room for the views sessions ask for themselves
+    budget = cache.max_entries // 2
+    ctx = multiprocessing.get_context("spawn")  # no fork of a threaded server
+    with ProcessPoolExecutor(workers, mp_context=ctx, initializer=_init_worker,
+                             initargs=(dict(tables),)) as pool:
+        # Batch by batch: once the defaults are in, the cache knows which explicit selections they cover
+        for batch in view_plan(tables):
+            todo = [(p, s) for p, s in batch if cache.key(p, tables, s) not in cache][:max(0, budget - stored)]
+            futures = [pool.submit(_build, p, s) for p, s in todo]
+            for (page, selections), fut in zip(todo, futures):
+                if current is not None and current() is not tables:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    return stored
+                try:
+                    view = fut.result()
+                except Exception:
+                    log.exception("Precomputing the %s view for %s failed", page, selections)
+                    continue
+                cache.put(page, tables, selections, view)
+                stored += 1
+    return stored
+
+
+# -----------------------------
+# Background warm-up after every data swap
+# -----------------------------
+_latest = None
+_status = {"running": False, "views": 0, "seconds": None}
+_status_lock = threading.Lock()
+
+
+def warmup_status():
+    return dict(_status)
+
+
+def _warmup(tables):
+    start = time.perf_counter()
+    try:
+        views = precompute_views(tables, current=lambda: _latest)
+    except Exception:
+        log.exception("View cache warm-up failed")
+        views = 0
+    with _status_lock:
+        if _latest is tables:
+            _status.update(running=False, views=views, seconds=time.perf_counter() - start)
+
+
+def schedule_warmup(tables):
+    """Start warming VIEW_CACHE for new tables in a background thread (data_loader.on_new_view hook)."""
+    global _latest
+    if PRECOMPUTE_WORKERS <= 0 or VIEW_CACHE.max_entries <= 0:
+        return
+    with _status_lock:
+        _latest = tables
+        _status.update(running=True, views=0, seconds=None)
+    threading.Thread(target=_warmup, args=(tables,), name="view-cache-warmup", daemon=True).start()
+
+
+data_loader.on_new_view(schedule_warmup)
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+def main(argv=None):
+    from bench_tabs import synthetic_tables
+    from headless_st import load_tables
+    from view_cache import ViewCache
+
+    parser = argparse.ArgumentParser(description="Time a full view-cache warm-up.")
+    parser.add_argument("--data", help="directory of sheet CSVs or a snapshot")
+    parser.add_argument("--size", default="12x9", help="synthetic league OWNERSxSEASONS when --data isn't given")
+    parser.add_argument("--workers", type=int, default=max(1, PRECOMPUTE_WORKERS))
+    parser.add_argument("--cache-size", type=int, default=VIEW_CACHE.max_entries)
+    args = parser.parse_args(argv)
+
+    if args.data:
+        tables = load_tables(args.data)
+    else:
+        owners, _, seasons = args.size.lower().partition("x")
+        tables = synthetic_tables(int(owners), int(seasons))
+    cache = ViewCache(args.cache_size)
+    print(f"{sum(len(b) for b in view_plan(tables))} views planned, {args.workers} worker(s)")
+    start = time.perf_counter()
+    views = precompute_views(tables, cache, args.workers)
+    print(f"built {views} views in {time.perf_counter() - start:.2f}s  cache {cache.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
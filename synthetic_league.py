@@ -0,0 +1,274 @@
+import argparse
+import functools
+import os
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Fake league data in the same shape as the Google Sheets exports, for load and
+# scale testing. Generate files, then either serve them over HTTP:
+#
+#   python synthetic_league.py generate --owners 20 --seasons 30 --out /tmp/league
+#   python synthetic_league.py serve /tmp/league
+#   LEAGUE_SHEETS_URL=http://127.0.0.1:8765 LEAGUE_SNAPSHOT_DIR=/tmp/league-snap streamlit run main.py
+#
+# or write them as a ready-made snapshot (--format parquet) and boot from it with
+# LEAGUE_SNAPSHOT_DIR=/tmp/league.
+
+TABLE_NAMES = ("teams", "matchups", "players", "draft_roster", "final_roster")
+
+# Yahoo game codes (the prefix of team/player keys); other years get a made-up code
+GAME_CODES = {2017: 371, 2018: 380, 2019: 390, 2020: 399, 2021: 406, 2022: 414, 2023: 423, 2024: 449, 2025: 461}
+OWNER_NAMES = ["Adam", "Ben", "Chris", "Dan", "Eric", "Frank", "Greg", "Hank", "Ian", "Jake", "Kyle", "Luke", "Matt", "Nate"]
+
+# Starting lineup; anything past it on the roster sits on the bench
+STARTER_SLOTS = ["QB", "WR", "WR", "RB", "RB", "TE", "W/R/T", "K", "DEF"]
+FLEX_POSITIONS = ["WR", "RB", "TE"]
+DRAFT_ELIGIBLE = {"W/R/T": FLEX_POSITIONS, "BN": ["QB", "WR", "RB", "TE"], "IR": ["WR", "RB"]}
+POINTS_MEAN = {"QB": 17, "WR": 10, "RB": 10, "TE": 7, "K": 8, "DEF": 7}
+RESULTS = ["Winner", "Runner-up", "Playoffs", "Playoffs", "Playoffs", "Playoffs"]
+
+
+def _game_code(year):
+    return GAME_CODES.get(year, 300 + year - 2000)
+
+
+def _owners(n):
+    if n <= len(OWNER_NAMES):
+        return OWNER_NAMES[:n]
+    return OWNER_NAMES + [f"Owner{i + 1}" for i in range(len(OWNER_NAMES), n)]
+
+
+def generate_league(n_owners=12, n_seasons=9, last_season=2025, weeks=17, playoff_weeks=3,
+                    roster_size=16, seed=0, unfinished_last=True):
+    """Return {table name: DataFrame} for a league of n_owners over n_seasons ending at last_season.
+
+    The last season is left in progress (half the weeks played, no results)
+    unless unfinished_last=False. roster_size counts starters + bench; one more
+    player per team sits on IR.
+    """
+    rng = np.random.default_rng(seed)
+    owners = _owners(n_owners)
+    seasons = list(range(last_season - n_seasons + 1, last_season + 1))
+    reg_weeks = weeks - playoff_weeks
+    slots = (STARTER_SLOTS + ["BN"] * max(0, roster_size - len(STARTER_SLOTS)))[:roster_size] + ["IR"]
+    teams, matchups, players, draft, final = [], [], [], [], []
+
+    for y in seasons:
+        gc = _game_code(y)
+        finished = not (unfinished_last and y == seasons[-1])
+        # A couple of owners join after the first season
+        active = owners if y != seasons[0] else owners[:max(2, n_owners - 2)]
+        tk = {o: f"{gc}.l.{1000 + y}.t.{i + 1}" for i, o in enumerate(active)}
+        next_id = {}
+
+        def new_player(pos):
+            next_id[pos] = next_id.get(pos, 0) + 1
+            return f"{gc}.p.{pos}{next_id[pos]}", pos
+
+        # Snake draft, one pick per roster slot (IR included)
+        order = list(active)
+        rng.shuffle(order)
+        rosters = {o: [] for o in active}
+        moves = {o: 0 for o in active}
+        pick = 1
+        for rnd in range(1, len(slots) + 1):
+            for o in (order if rnd % 2 else order[::-1]):
+                slot = slots[rnd - 1]
+                pos = rng.choice(DRAFT_ELIGIBLE.get(slot, [slot]))
+                pk, pos = new_player(pos)
+                rosters[o].append((pk, pos))
+                draft.append(dict(
+                    team_key=tk[o], player_key=pk, player_name=f"Player {pk.split('.')[-1]}",
+                    player_position=pos, pick_num=pick, round_num=rnd,
+                    is_keeper=int(rnd == len(slots) and rng.random() < 0.5),
+                ))
+                pick += 1
+
+        played = weeks if finished else max(1, reg_weeks // 2)
+        standings = None
+        for w in range(1, played + 1):
+            is_po = int(w > reg_weeks)
+            if is_po:
+                # Playoffs: the top six by record, seeded 1v6, 2v5, 3v4
+                seeds = list(standings.index[:6])
+                pairs = [(seeds[i], seeds[len(seeds) - 1 - i]) for i in range(len(seeds) // 2)]
+            else:
+                perm = list(active)
+                rng.shuffle(perm)
+                pairs = [(perm[i], perm[i + 1]) for i in range(0, len(perm) - 1, 2)]  # odd count: one bye
+
+            week_rows = []
+            for a, b in pairs:
+                for o, opp in ((a, b), (b, a)):
+                    # Waiver move now and then: drop a skill player, pick up a new one
+                    if rng.random() < 0.3:
+                        droppable = [i for i, (_, p) in enumerate(rosters[o]) if p in FLEX_POSITIONS]
+                        rosters[o].pop(int(rng.choice(droppable)))
+                        rosters[o].append(new_player(rng.choice(FLEX_POSITIONS)))
+                        moves[o] += 1
+                    total = 0.0
+                    for pk, pos, slot in _lineup(rosters[o]):
+                        pts = float(np.round(max(-2.0, rng.normal(POINTS_MEAN[pos], 6)), 2))
+                        if slot not in ("BN", "IR"):
+                            total += pts
+                        players.append(dict(
+                            team_key=tk[o], week=w, player_key=pk, player_name=f"Player {pk.split('.')[-1]}",
+                            player_position=pos, selected_position=slot, player_week_points=pts,
+                        ))
+                    week_rows.append(dict(
+                        team_key=tk[o], opponent_team_key=tk[opp], week=w, is_playoffs=is_po,
+                        points_for=round(total, 2), opponent_owner=opp,
+                        matchup_recap_url=f"https://example.com/{y}/{w}/{tk[o]}",
+                    ))
+
+            pf = {r["team_key"]: r["points_for"] for r in week_rows}
+            hi = max(week_rows, key=lambda r: r["points_for"])["team_key"] if not is_po else None
+            lo = min(week_rows, key=lambda r: r["points_for"])["team_key"] if not is_po else None
+            for r in week_rows:
+                r["points_against"] = pf[r["opponent_team_key"]]
+                r["points_difference"] = round(r["points_for"] - r["points_against"], 2)
+                r["week_result"] = "win" if r["points_difference"] > 0 else ("loss" if r["points_difference"] < 0 else "tie")
+                r["high_score_flag"] = int(r["team_key"] == hi)
+                r["low_score_flag"] = int(r["team_key"] == lo)
+            matchups.extend(week_rows)
+
+            if w == min(played, reg_weeks):
+                standings = _standings(matchups, tk)
+
+        standings = _standings(matchups, tk) if standings is None else standings
+        results = {}
+        if finished:
+            ranked = list(standings.index)
+            results = dict(zip(ranked, RESULTS))
+            results[ranked[-1]] = "Loser"
+        for o in active:
+            k = tk[o]
+            row = standings.loc[o]
+            teams.append(dict(
+                team_key=k, year=y, owner_name=o, team_name=f"{o}'s Team {y}",
+                league_result=results.get(o, "Missed Playoffs") if finished else None,
+                regular_season_ranking=int(row["rank"]), wins=int(row["w"]), losses=int(row["l"]),
+                points_for=round(float(row["pf"]), 2), points_against=round(float(row["pa"]), 2),
+                number_of_waiver_moves=moves[o],
+                number_of_trades=int(rng.integers(0, 5)), faab_balance_used=int(rng.integers(0, 100)),
+                draft_grade=rng.choice(["A", "B", "C", "D"]), team_url=f"https://example.com/team/{k}",
+                is_finished=int(finished),
+            ))
+            final.extend(dict(team_key=k, player_key=pk) for pk, _ in rosters[o])
+
+    return {
+        "teams": pd.DataFrame(teams),
+        "matchups": pd.DataFrame(matchups),
+        "players": pd.DataFrame(players),
+        "draft_roster": pd.DataFrame(draft),
+        "final_roster": pd.DataFrame(final),
+    }
+
+
+def _lineup(roster):
+    # Fill the starting slots in roster order; the rest is bench, the last player on IR
+    left = list(roster)
+    out = []
+    for slot in STARTER_SLOTS:
+        eligible = FLEX_POSITIONS if slot == "W/R/T" else [slot]
+        i = next((i for i, (_, pos) in enumerate(left) if pos in eligible), None)
+        if i is not None:
+            pk, pos = left.pop(i)
+            out.append((pk, pos, slot))
+    out += [(pk, pos, "BN") for pk, pos in left[:-1]]
+    out += [(pk, pos, "IR") for pk, pos in left[-1:]]
+    return out
+
+
+def _standings(matchups, tk):
+    # Regular-season record per owner of this season, best first (wins, then points for)
+    owner_by_key = {k: o for o, k in tk.items()}
+    reg = pd.DataFrame([r for r in matchups if r["team_key"] in owner_by_key and not r["is_playoffs"]])
+    st = (
+        reg.assign(owner=reg["team_key"].map(owner_by_key),
+                   win=reg["week_result"].eq("win"), loss=reg["week_result"].eq("loss"))
+           .groupby("owner")
+           .agg(w=("win", "sum"), l=("loss", "sum"), pf=("points_for", "sum"), pa=("points_against", "sum"))
+           .reindex(list(tk), fill_value=0)
+           .sort_values(["w", "pf"], ascending=False)
+    )
+    st["rank"] = range(1, len(st) + 1)
+    return st
+
+
+def write_league(tables, out_dir, fmt="csv"):
+    """Write the tables to out_dir: <name>.csv files, or a loader snapshot (Parquet + manifest)."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if fmt == "csv":
+        for name in TABLE_NAMES:
+            tables[name].to_csv(out_dir / f"{name}.csv", index=False)
+        return
+    # Same path the loader takes for a real sheet, so the snapshot is canonical and typed
+    from data_loader import content_hash, prepare_tables
+    from data_snapshot import write_snapshot
+    versions = {name: content_hash(tables[name].to_csv(index=False).encode()) for name in TABLE_NAMES}
+    prepared = prepare_tables({name: tables[name] for name in TABLE_NAMES})
+    write_snapshot({**prepared, "versions": versions}, out_dir)
+
+
+def serve(directory, host="127.0.0.1", port=8765):
+    """Serve <directory>/<name>.csv over HTTP (with Last-Modified/304) until interrupted."""
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(directory))
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Serving {directory} at http://{host}:{server.server_port}")
+    print(f"  LEAGUE_SHEETS_URL=http://{host}:{server.server_port} streamlit run main.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate and serve synthetic league data.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="write a synthetic league to a directory")
+    gen.add_argument("--out", required=True, help="output directory")
+    gen.add_argument("--owners", type=int, default=12)
+    gen.add_argument("--seasons", type=int, default=9)
+    gen.add_argument("--last-season", type=int, default=2025)
+    gen.add_argument("--weeks", type=int, default=17, help="weeks per season, playoffs included")
+    gen.add_argument("--playoff-weeks", type=int, default=3)
+    gen.add_argument("--roster-size", type=int, default=16, help="starters + bench")
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument("--all-finished", action="store_true", help="don't leave the last season in progress")
+    gen.add_argument("--format", choices=["csv", "parquet"], default="csv",
+                     help="csv: sheet exports to serve; parquet: a loader snapshot (default: %(default)s)")
+
+    srv = sub.add_parser("serve", help="serve generated CSVs as a local stand-in for Google Sheets")
+    srv.add_argument("directory")
+    srv.add_argument("--host", default="127.0.0.1")
+    srv.add_argument("--port", type=int, default=int(os.environ.get("LEAGUE_SHEETS_PORT", "8765")))
+
+    args = parser.parse_args(argv)
+    if args.command == "generate":
+        tables = generate_league(
+            n_owners=args.owners, n_seasons=args.seasons, last_season=args.last_season,
+            weeks=args.weeks, playoff_weeks=args.playoff_weeks, roster_size=args.roster_size,
+            seed=args.seed, unfinished_last=not args.all_finished,
+        )
+        write_league(tables, args.out, args.format)
+        for name in TABLE_NAMES:
+            print(f"  {name:<13} {len(tables[name]):>8} rows")
+        print(f"Wrote {args.format} to {args.out}")
+    else:
+        serve(args.directory, args.host, args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
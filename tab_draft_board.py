@@ -1,41 +1,46 @@
 import streamlit as st
 import pandas as pd
 
-def show_draft_board(st, teams_df, draft_roster_df, players_df, matchups_df):
-    # --- Normalize ---
-    for df in (teams_df, draft_roster_df, players_df, matchups_df):
-        df.columns = df.columns.str.strip().str.lower()
-
-    # --- Force key cols to string early (avoids merge misses) ---
-    for df in (draft_roster_df, players_df, matchups_df):
-        for col in ("player_key", "team_key"):
-            if col in df.columns:
-                df[col] = df[col].astype(str)
-
-    # Weeks should be numeric for joins/comparisons
-    if "week" in players_df.columns:
-        players_df["week"] = pd.to_numeric(players_df["week"], errors="coerce").astype("Int64")
-    if "week" in matchups_df.columns:
-        matchups_df["week"] = pd.to_numeric(matchups_df["week"], errors="coerce").astype("Int64")
+from league_facts import build_player_weeks, build_season_index, rows
+from perf import section_marks
+
+def show_draft_board(st, teams_df, draft_roster_df, players_df, matchups_df, player_weeks=None, season_index=None):
+    mark = section_marks("draft")
+    # Frames arrive canonical (names, string keys, dtypes) from data_schema.py
+    # Pre-joined player-week facts and per-season partitions (league_facts.py);
+    # built here only when the caller has none
+    if season_index is None:
+        if player_weeks is None:
+            player_weeks = build_player_weeks(teams_df, matchups_df, players_df)
+        season_index = build_season_index(teams_df, player_weeks=player_weeks, draft_roster=draft_roster_df)
+
+    # --- Season selector with placeholder (only seasons that have a draft) ---
+    seasons = sorted((y for y in season_index["draft_roster"] if y is not None), reverse=True)
+    season_options = ["Select a season..."] + [str(s) for s in seasons]
+    selected = st.selectbox("Select Year:", season_options, index=0, key="draft_board_year")
+    if selected == "Select a season...":
+        st.info("Please select a season to view the draft board")
+        return
+
+    selected_season = int(selected)
+    season_teams = rows(season_index, "teams", selected_season)
+
+    mark("setup")
 
     # --- Robust keys (year_code + player_key_clean) ---
-    def split_keys(s):
-        s = str(s)
-        parts = s.split(".")
-        year_code = parts[0] if parts else ""
-        tail = s.split("p.")[-1]  # after 'p.'
-        return year_code, tail
-
-    draft_roster_df[["year_code", "player_key_clean"]] = draft_roster_df["player_key"].apply(
-        lambda k: pd.Series(split_keys(k))
-    )
-    players_df[["year_code", "player_key_clean"]] = players_df["player_key"].apply(
-        lambda k: pd.Series(split_keys(k))
-    )
+    # Inputs are shared and read-only: derive new frames rather than adding columns
+    def with_split_keys(df):
+        k = df["player_key"].astype(str)
+        return df.assign(
+            year_code=k.str.split(".").str[0],
+            player_key_clean=k.str.split("p.", regex=False).str[-1],  # after 'p.'
+        )
+
+    draft_roster_df = with_split_keys(rows(season_index, "draft_roster", selected_season))
 
     # --- Merge Draft Roster with Teams (owner/year) ---
     roster_full = draft_roster_df.merge(
-        teams_df[["team_key", "owner_name", "year"]],
+        season_teams[["team_key", "owner_name", "year"]],
         on="team_key",
         how="left"
     )
@@ -47,39 +52,34 @@ def show_draft_board(st, teams_df, draft_roster_df, players_df, matchups_df):
     # --- Position Draft Rank (within season & position by pick_num) ---
     roster_full["position_draft_rank"] = (
         roster_full.sort_values("pick_num")
-        .groupby(["year", "player_position"])
+        .groupby(["year", "player_position"], observed=True)
         .cumcount() + 1
     )
 
-    # ---------- REGULAR-SEASON FINISH RANK (players_df + matchups_df) ----------
-    reg_players = players_df.merge(
-        matchups_df[["team_key", "week", "is_playoffs"]],
-        on=["team_key", "week"],
-        how="left"
-    )
-    reg_players["is_playoffs"] = reg_players["is_playoffs"].fillna(0)
-    reg_players = reg_players[reg_players["is_playoffs"] == 0]
+    # ---------- REGULAR-SEASON FINISH RANK (player-weeks; unscheduled weeks count as regular) ----------
+    season_pw = rows(season_index, "player_weeks", selected_season)
+    reg_players = with_split_keys(season_pw[season_pw["is_playoffs"] == 0])
 
     # Rank table keyed by CLEAN key
     pts_clean = (
-        reg_players.groupby(["year_code", "player_key_clean", "player_position"])["player_week_points"]
-        .sum()
+        reg_players.groupby(["year_code", "player_key_clean", "player_position"], observed=True)["player_week_points"]
+        .sum().round(2)
         .reset_index(name="total_points")
     )
     pts_clean["position_finish_rank"] = (
-        pts_clean.groupby(["year_code", "player_position"])["total_points"]
+        pts_clean.groupby(["year_code", "player_position"], observed=True)["total_points"]
         .rank(ascending=False, method="min")
         .astype(int)
     )
 
     # Fallback rank table keyed by FULL key
     pts_full = (
-        reg_players.groupby(["year_code", "player_key", "player_position"])["player_week_points"]
-        .sum()
+        reg_players.groupby(["year_code", "player_key", "player_position"], observed=True)["player_week_points"]
+        .sum().round(2)
         .reset_index(name="total_points")
     )
     pts_full["position_finish_rank"] = (
-        pts_full.groupby(["year_code", "player_position"])["total_points"]
+        pts_full.groupby(["year_code", "player_position"], observed=True)["total_points"]
         .rank(ascending=False, method="min")
         .astype(int)
     )
@@ -123,41 +123,31 @@ def show_draft_board(st, teams_df, draft_roster_df, players_df, matchups_df):
         axis=1
     )
 
+    mark("finish_ranks")
+
     # --- Build cell HTML ---
     roster_full["cell_value"] = (
         "<span style='font-size:12px; font-weight:600; white-space:nowrap; display:inline-block;'>"
         + roster_full["pick_num"].astype(str) + ". "
         + roster_full["player_name"] + " ("
-        + roster_full["player_position"] + ")</span>"
+        + roster_full["player_position"].astype(str) + ")</span>"
         + "<br><span style='font-size:10px; color:#ffffff; white-space:nowrap;'>"
         + roster_full["rank_line"] + "</span>"
     )
 
-    # --- Season selector with placeholder ---
-    seasons = sorted(roster_full["year"].dropna().unique(), reverse=True)
-    season_options = ["Select a season..."] + [str(s) for s in seasons]
-    selected = st.selectbox("Select Year:", season_options, index=0)
-    if selected == "Select a season...":
-        st.info("Please select a season to view the draft board")
-        return
-
-    selected_season = int(selected)
-    season_df = roster_full[roster_full["year"] == selected_season].copy()
+    season_df = roster_full
 
     # --- Draft order from Round 1 (columns left→right) ---
-    round1 = season_df[season_df["round_num"] == 1].copy().sort_values("pick_num")
+    round1 = season_df[season_df["round_num"] == 1].sort_values("pick_num")
     owner_order = round1["owner_name"].tolist()
 
     # ===== NEW: per-owner header metrics (for selected season) =====
     # Regular season rank per owner (from teams_df)
-    t_year = teams_df[teams_df["year"] == selected_season].copy()
+    t_year = season_teams
     if "regular_season_ranking" in t_year.columns:
-        t_year["regular_season_ranking"] = pd.to_numeric(
-            t_year["regular_season_ranking"], errors="coerce"
-        )
         reg_rank_map = (
             t_year.dropna(subset=["owner_name"])
-                 .groupby("owner_name")["regular_season_ranking"]
+                 .groupby("owner_name", observed=True)["regular_season_ranking"]
                  .first()  # assume one team per owner; 'first' is fine
         )
     else:
@@ -166,7 +156,7 @@ def show_draft_board(st, teams_df, draft_roster_df, players_df, matchups_df):
     # Median actual finish rank per owner (median of all drafted players' position_finish_rank > 0)
     med_finish_map = (
         season_df.loc[season_df["position_finish_rank"] > 0]
-                 .groupby("owner_name")["position_finish_rank"]
+                 .groupby("owner_name", observed=True)["position_finish_rank"]
                  .median()
     )
 
@@ -175,7 +165,8 @@ def show_draft_board(st, teams_df, draft_roster_df, players_df, matchups_df):
         index="round_num",
         columns="owner_name",
         values="cell_value",
-        aggfunc=lambda x: " / ".join(x)  # guard for unexpected dup picks
+        aggfunc=lambda x: " / ".join(x),  # guard for unexpected dup picks
+        observed=True
     ).sort_index()
 
     draft_board = draft_board.reindex(columns=owner_order)
@@ -269,6 +260,8 @@ def show_draft_board(st, teams_df, draft_roster_df, players_df, matchups_df):
     </div>
     """
 
+    mark("board_html")
+
     # --- Legend (simple chips) ---
     legend_html = """
     <div style="display:flex; gap:10px; flex-wrap:wrap; align-items:center; margin:6px 0 12px;">
@@ -284,3 +277,5 @@ def show_draft_board(st, teams_df, draft_roster_df, players_df, matchups_df):
 
     st.markdown(legend_html, unsafe_allow_html=True)
     st.markdown(table_html, unsafe_allow_html=True)
+
+    mark("render")
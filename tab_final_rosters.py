@@ -10,10 +10,6 @@ def show_final_rosters(st, teams_df, final_roster_df):
         st.error("⚠️ No final roster data provided.")
         return
 
-    # Normalize
-    for df in [teams_df, final_roster_df]:
-        df.columns = df.columns.str.strip().str.lower()
-
     # Join with teams_df to add year/owner/team info
     if not {"team_key", "year", "owner_name", "team_name"}.issubset(teams_df.columns):
         st.error("⚠️ teams_df missing required columns (team_key, year, owner_name, team_name).")
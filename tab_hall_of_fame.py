@@ -1,4 +1,18 @@
-def show_hall_of_fame(st, teams_df, matchups_df, players_df):
+import pandas as pd
+
+from league_facts import GAME_RECORDS, build_player_weeks, build_records_index, build_team_weeks, record_games
+
+
+def show_hall_of_fame(st, teams_df, matchups_df, players_df, player_weeks=None, team_weeks=None,
+                      records_index=None):
+    # Pre-joined fact tables (league_facts.py); built here only when the caller has none
+    if player_weeks is None:
+        player_weeks = build_player_weeks(teams_df, matchups_df, players_df)
+    if team_weeks is None:
+        team_weeks = build_team_weeks(teams_df, matchups_df)
+    if records_index is None:
+        records_index = build_records_index(team_weeks)
+
     # --- CSS: per-card outlines + inline sub text + no fills ---
     st.markdown("""
         <style>
@@ -74,19 +88,14 @@ def show_hall_of_fame(st, teams_df, matchups_df, players_df):
     # -----------------------------
     # Data prep
     # -----------------------------
-    # Merge owner/year onto matchups
     teams_df = teams_df[teams_df['is_finished'] == 1].copy()
 
-    # restrict matchups to only those team_keys from finished teams
-    matchups_df = matchups_df[matchups_df['team_key'].isin(teams_df['team_key'])].copy()
+    # restrict the weekly fact tables (owner/year already attached) to finished teams
+    df = team_weeks[team_weeks['team_key'].isin(teams_df['team_key'])]
 
-    # restrict players to only those team_keys from finished teams
-    players_df = players_df[players_df['team_key'].isin(teams_df['team_key'])].copy()
+    # players only count in weeks their team was on the schedule
+    players_df = player_weeks[player_weeks['team_key'].isin(teams_df['team_key']) & player_weeks['has_matchup']]
 
-    df = matchups_df.merge(
-        teams_df[['team_key', 'owner_name', 'year']],
-        on='team_key', how='left'
-    )
     regular_df = df[df.get('is_playoffs', 0) == 0].copy()
 
     # Champs & Chumps table
@@ -147,7 +156,7 @@ def show_hall_of_fame(st, teams_df, matchups_df, players_df):
         (teams_df['is_finished'] == 1) & 
         (teams_df['regular_season_ranking'].notnull())
     ]
-    avg_rankings = ranking_df.groupby('owner_name').agg(
+    avg_rankings = ranking_df.groupby('owner_name', observed=True).agg(
         avg_rank=('regular_season_ranking', 'mean'),
         seasons=('year', 'nunique')
     )
@@ -171,7 +180,7 @@ def show_hall_of_fame(st, teams_df, matchups_df, players_df):
     win_df = win_df[win_df['total_games'] > 0]
     win_df['win_pct'] = win_df['wins'] / win_df['total_games']
 
-    owner_stats = win_df.groupby('owner_name').agg(
+    owner_stats = win_df.groupby('owner_name', observed=True).agg(
         wins=('wins', 'sum'),
         losses=('losses', 'sum'),
         seasons=('year', 'nunique') 
@@ -193,7 +202,7 @@ def show_hall_of_fame(st, teams_df, matchups_df, players_df):
         """, unsafe_allow_html=True)
 
     # Most Weekly High Scores
-    high_counts = regular_df[regular_df.get('high_score_flag', 0) == 1].groupby('owner_name').size() if not regular_df.empty else pd.Series(dtype=int)
+    high_counts = regular_df[regular_df.get('high_score_flag', 0) == 1].groupby('owner_name', observed=True).size() if not regular_df.empty else pd.Series(dtype=int)
     text_hi = "No data"
     if not high_counts.empty:
         mh = high_counts.max()
@@ -245,21 +254,6 @@ def show_hall_of_fame(st, teams_df, matchups_df, players_df):
             </div>
         """, unsafe_allow_html=True)
 
-    # Attach matchup flags & owner/year to players for player-based metrics
-    matchups_df = matchups_df.copy()
-    players_df = players_df.copy()
-    matchups_df['team_week_key'] = matchups_df['team_key'].astype(str) + '_' + matchups_df['week'].astype(str)
-    players_df['team_week_key'] = players_df['team_key'].astype(str) + '_' + players_df['week'].astype(str)
-
-    players_df = players_df.merge(
-        matchups_df[['team_week_key', 'is_playoffs']],
-        on='team_week_key', how='left'
-    )
-    players_df = players_df.merge(
-        teams_df[['team_key', 'owner_name', 'year']],
-        on='team_key', how='left'
-    )
-
     # Highest Scoring Starter
     regular_starters = players_df[
         (players_df.get('is_playoffs', 0) == 0) &
@@ -299,7 +293,7 @@ def show_hall_of_fame(st, teams_df, matchups_df, players_df):
         (teams_df['is_finished'] == 1) & 
         (teams_df['regular_season_ranking'].notnull())
     ]
-    avg_rankings = ranking_df.groupby('owner_name').agg(
+    avg_rankings = ranking_df.groupby('owner_name', observed=True).agg(
         avg_rank=('regular_season_ranking', 'mean'),
         seasons=('year', 'nunique')
     )
@@ -330,7 +324,7 @@ def show_hall_of_fame(st, teams_df, matchups_df, players_df):
     win_df = win_df[win_df['total_games'] > 0]
     win_df['win_pct'] = win_df['wins'] / win_df['total_games']
 
-    owner_stats = win_df.groupby('owner_name').agg(
+    owner_stats = win_df.groupby('owner_name', observed=True).agg(
         wins=('wins', 'sum'),
         losses=('losses', 'sum'),
         seasons=('year', 'nunique')
@@ -359,7 +353,7 @@ def show_hall_of_fame(st, teams_df, matchups_df, players_df):
         """, unsafe_allow_html=True)
 
     # Most Weekly Low Scores
-    low_counts = regular_df[regular_df.get('low_score_flag', 0) == 1].groupby('owner_name').size() if not regular_df.empty else pd.Series(dtype=int)
+    low_counts = regular_df[regular_df.get('low_score_flag', 0) == 1].groupby('owner_name', observed=True).size() if not regular_df.empty else pd.Series(dtype=int)
     text_lo = "No data"
     if not low_counts.empty:
         ml = low_counts.max()
@@ -400,7 +394,7 @@ def show_hall_of_fame(st, teams_df, matchups_df, players_df):
         (~players_df['selected_position'].isin(['BN', 'IR'])) &
         (players_df['player_week_points'] <= 0)
     ].copy()
-    zero_counts = bad_starts.groupby('owner_name').size() if not bad_starts.empty else pd.Series(dtype=int)
+    zero_counts = bad_starts.groupby('owner_name', observed=True).size() if not bad_starts.empty else pd.Series(dtype=int)
 
     if not zero_counts.empty:
         max_count = zero_counts.max()
@@ -450,3 +444,34 @@ def show_hall_of_fame(st, teams_df, matchups_df, players_df):
                 <div class="card-row"><span class="card-value">No data</span></div>
             </div>
         """, unsafe_allow_html=True)
+
+    # -----------------------------
+    # All-Time Top 25: one tab per game record, served from the records index
+    # -----------------------------
+    st.markdown(
+        '<div style="font-size:25px;font-weight:600;line-height:1.1;margin-top:15px;margin-bottom:2px;">All-Time Top 25</div>',
+        unsafe_allow_html=True
+    )
+    finished_keys = teams_df['team_key']
+    for tab, (label, (metric, end)) in zip(st.tabs(list(GAME_RECORDS)), GAME_RECORDS.items()):
+        games = record_games(records_index, metric, end)
+        games = games[games['team_key'].isin(finished_keys)].head(25)
+        with tab:
+            if games.empty:
+                st.info("No regular-season games found.")
+                continue
+            st.dataframe(
+                pd.DataFrame({
+                    "#": range(1, len(games) + 1),
+                    "Owner": games['owner_name'].astype(str).to_numpy(),
+                    "Year": games['year'].astype(int).to_numpy(),
+                    "Week": games['week'].astype(int).to_numpy(),
+                    "Opponent": games['opponent_owner_name'].astype(str).to_numpy(),
+                    "Points For": games['points_for'].round(2).to_numpy(),
+                    "Points Against": games['points_against'].round(2).to_numpy(),
+                    "Margin": games['margin'].round(2).to_numpy(),
+                }),
+                use_container_width=True,
+                hide_index=True,
+                height=35 * len(games) + 38,
+            )
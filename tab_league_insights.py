@@ -1,32 +1,19 @@
+import numpy as np
 import pandas as pd  # make sure this is at top of file
 
-def show_league_insights(st, go, teams_df, matchups_df):
+def show_league_insights(st, go, teams_df, matchups_df, position_ranks=None):
     st.markdown('<div style="font-size:20px;font-weight:600;margin-bottom:0;">League Trophy Count</div>', unsafe_allow_html=True)
 
     # -----------------------------
     # Global: restrict to finished seasons
     # -----------------------------
-    teams_df = teams_df.copy()
-    matchups_df = matchups_df.copy()
-
-    # Coerce minimal numerics we rely on
-    for c in ['year','wins','losses','regular_season_ranking','is_finished']:
-        if c in teams_df.columns:
-            teams_df[c] = pd.to_numeric(teams_df[c], errors='coerce')
-
-    for c in ['year','is_playoffs','high_score_flag','low_score_flag','week']:
-        if c in matchups_df.columns:
-            matchups_df[c] = pd.to_numeric(matchups_df[c], errors='coerce')
-
     # Keep only finished seasons in teams_df
     if 'is_finished' in teams_df.columns:
         teams_df = teams_df[teams_df['is_finished'].fillna(0) == 1].copy()
 
     # Cascade: only matchups for those finished-season teams
     if 'team_key' in matchups_df.columns and 'team_key' in teams_df.columns:
-        finished_team_keys = teams_df['team_key'].astype(str)
-        matchups_df['team_key'] = matchups_df['team_key'].astype(str)
-        matchups_df = matchups_df[matchups_df['team_key'].isin(finished_team_keys)].copy()
+        matchups_df = matchups_df[matchups_df['team_key'].isin(teams_df['team_key'])].copy()
 
     # Safety: if no finished seasons, short-circuit
     if teams_df.empty:
@@ -36,7 +23,7 @@ def show_league_insights(st, go, teams_df, matchups_df):
     # -----------------------------
     # Split dataset by 2017 rule
     # -----------------------------
-    teams_all = teams_df.copy()                     # finished seasons only
+    teams_all = teams_df                            # finished seasons only
     teams_no17 = teams_all[teams_all['year'] != 2017].copy()
 
     # ---------- Base ranking & win% (EXCLUDE 2017) ----------
@@ -44,11 +31,11 @@ def show_league_insights(st, go, teams_df, matchups_df):
         (teams_no17['regular_season_ranking'].notnull())
     ]
 
-    show_current = st.toggle("Show only current owners", value=True)
+    show_current = st.toggle("Show only current owners", value=True, key="league_current_owners")
     last_season = teams_all['year'].max()
     current_owners = teams_all[teams_all['year'] == last_season]['owner_name'].unique()
 
-    avg_rankings = ranking_df.groupby('owner_name', dropna=False).agg(
+    avg_rankings = ranking_df.groupby('owner_name', dropna=False, observed=True).agg(
         avg_rank=('regular_season_ranking', 'mean'),
         seasons_no17=('year', 'nunique')
     )
@@ -58,7 +45,7 @@ def show_league_insights(st, go, teams_df, matchups_df):
     win_df = win_df[win_df['total_games'] > 0].copy()
     win_df['win_pct'] = win_df['wins'] / win_df['total_games']
 
-    win_stats = win_df.groupby('owner_name', dropna=False).agg(
+    win_stats = win_df.groupby('owner_name', dropna=False, observed=True).agg(
         wins=('wins', 'sum'),
         losses=('losses', 'sum'),
         total_games=('total_games', 'sum'),
@@ -69,8 +56,8 @@ def show_league_insights(st, go, teams_df, matchups_df):
     insights_df = avg_rankings.merge(win_stats, left_index=True, right_index=True, how='left').reset_index()
 
     # ---------- Seasons counts (INCLUDE 2017 for Total Seasons ONLY) ----------
-    total_seasons_incl2017 = teams_all.groupby('owner_name', dropna=False)['year'].nunique().rename('Total Seasons')
-    seasons_no17_series = teams_no17.groupby('owner_name', dropna=False)['year'].nunique().rename('Seasons no2017')
+    total_seasons_incl2017 = teams_all.groupby('owner_name', dropna=False, observed=True)['year'].nunique().rename('Total Seasons')
+    seasons_no17_series = teams_no17.groupby('owner_name', dropna=False, observed=True)['year'].nunique().rename('Seasons no2017')
 
     insights_df = (insights_df
                    .merge(total_seasons_incl2017, on='owner_name', how='left')
@@ -102,10 +89,10 @@ def show_league_insights(st, go, teams_df, matchups_df):
     insights_df['Playoff Seasons'] = insights_df['owner_name'].apply(lambda x: playoff_counts_no17(x)[0])
     insights_df['Seasons (no 2017)'] = insights_df['owner_name'].apply(lambda x: playoff_counts_no17(x)[1])
 
-    with pd.option_context('mode.use_inf_as_na', True):
-        insights_df['Playoff Appearance %'] = (
-            (insights_df['Playoff Seasons'] / insights_df['Seasons (no 2017)']) * 100
-        ).round(1).fillna(0)
+    # No seasons (x/0 = inf) counts as 0%; pandas 3 dropped the mode.use_inf_as_na option
+    insights_df['Playoff Appearance %'] = (
+        (insights_df['Playoff Seasons'] / insights_df['Seasons (no 2017)']) * 100
+    ).round(1).replace([np.inf, -np.inf], np.nan).fillna(0)
 
     # Trophy counts (INCLUDE 2017, finished seasons only)
     insights_df['# League Champs'] = insights_df['owner_name'].apply(champ_count)
@@ -123,13 +110,13 @@ def show_league_insights(st, go, teams_df, matchups_df):
     insights_df['Power Ranking'] = insights_df['Power Ranking Score'].rank(method='min', ascending=False).astype(int)
 
     # ---------- Transaction averages (EXCLUDE 2017)
-    aggr_team_year = teams_no17.groupby(['owner_name', 'year'], dropna=False).agg(
+    aggr_team_year = teams_no17.groupby(['owner_name', 'year'], dropna=False, observed=True).agg(
         waiver_moves=('number_of_waiver_moves', 'sum'),
         trades=('number_of_trades', 'sum'),
         faab_used=('faab_balance_used', 'sum')
     ).reset_index()
 
-    per_owner_avgs = aggr_team_year.groupby('owner_name', dropna=False).agg(
+    per_owner_avgs = aggr_team_year.groupby('owner_name', dropna=False, observed=True).agg(
         **{'Avg Waiver Moves/Year': ('waiver_moves', 'mean'),
            'Avg Trades/Year': ('trades', 'mean'),
            'Avg FAAB Used/Year': ('faab_used', 'mean')}
@@ -153,12 +140,12 @@ def show_league_insights(st, go, teams_df, matchups_df):
 
     for col in ['year', 'is_playoffs', 'high_score_flag', 'low_score_flag']:
         if col in m.columns:
-            m[col] = pd.to_numeric(m[col], errors='coerce').fillna(0).astype(int)
+            m[col] = m[col].fillna(0).astype(int)
 
     if {'team_key','week'}.issubset(m.columns):
         m = (m
              .sort_values(['team_key','year','week'])
-             .groupby(['team_key','year','week'], as_index=False, dropna=False)
+             .groupby(['team_key','year','week'], as_index=False, dropna=False, observed=True)
              .agg({
                  'owner_name': 'first',
                  'is_playoffs': 'max',
@@ -167,13 +154,13 @@ def show_league_insights(st, go, teams_df, matchups_df):
              }))
 
     owner_year_flags = (m
-        .groupby(['owner_name', 'year'], dropna=False)
+        .groupby(['owner_name', 'year'], dropna=False, observed=True)
         .agg(high_scores=('high_score_flag', 'sum'),
              low_scores =('low_score_flag',  'sum'))
         .reset_index()
     )
 
-    owner_avg_flags = owner_year_flags.groupby('owner_name', dropna=False).agg(
+    owner_avg_flags = owner_year_flags.groupby('owner_name', dropna=False, observed=True).agg(
         **{'Avg High Scores/Year': ('high_scores', 'mean'),
            'Avg Low Scores/Year': ('low_scores', 'mean')}
     ).round(2).reset_index()
@@ -287,3 +274,43 @@ def show_league_insights(st, go, teams_df, matchups_df):
         },
         height=fit_height,
     )
+
+    # -----------------------------
+    # Career positional rank heatmap: each owner's season rank at every started
+    # slot (league_facts.build_position_ranks), averaged over finished seasons (excl 2017)
+    # -----------------------------
+    if position_ranks is None:
+        return
+    career = position_ranks[position_ranks['year'].isin(teams_no17['year'].unique())]
+    if show_current:
+        career = career[career['owner_name'].isin(current_owners)]
+    career = career.dropna(subset=['owner_name', 'rank'])
+    if career.empty:
+        return
+
+    career_rank = career.pivot_table(index='owner_name', columns='pos', values='rank', aggfunc='mean', observed=True)
+    career_rank = career_rank[[c for c in ["QB", "RB", "WR", "TE", "FLEX", "K", "DEF"] if c in career_rank.columns]]
+    power_order = dict(zip(final_df['Owner Name'], final_df.index))
+    career_rank = career_rank.loc[sorted(career_rank.index, key=lambda o: power_order.get(o, 1e9))].round(1)
+    seasons_played = career.groupby('owner_name', observed=True)['year'].nunique()
+
+    st.markdown(
+        '<div style="font-size:20px;font-weight:600;line-height:1.1;margin-top:15px;margin-bottom:2px;">'
+        'Career Positional Rank</div>',
+        unsafe_allow_html=True
+    )
+    fig_career = go.Figure(go.Heatmap(
+        z=career_rank.values,
+        x=list(career_rank.columns),
+        y=[f"{o} ({seasons_played.get(o, 0)})" for o in career_rank.index],
+        text=career_rank.values,
+        texttemplate="%{text:.1f}",
+        colorscale=[[0, "#2ca02c"], [0.5, "#ffffbf"], [1, "#d7191c"]],  # green → yellow → red
+        colorbar=dict(title="Avg Rank"),
+        hovertemplate="%{y}<br>%{x}: avg season rank %{z:.2f}<extra></extra>",
+    ))
+    fig_career.update_xaxes(side="top", tickangle=0, fixedrange=True)
+    fig_career.update_yaxes(autorange="reversed", fixedrange=True)
+    fig_career.update_layout(height=max(300, 30 * len(career_rank) + 60), margin=dict(l=8, r=0, t=4, b=8))
+    st.caption("Average of each season's rank (1 = best) at the slot; seasons played in parentheses.")
+    st.plotly_chart(fig_career, use_container_width=True, config={"displayModeBar": False})
@@ -2,86 +2,37 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
-from streamlit.components.v1 import html as st_html
 
-
-def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
-    # -----------------------------
-    # Normalize columns & aliases
-    # -----------------------------
-    for df in (teams_df, matchups_df, players_df):
-        df.columns = df.columns.str.strip().str.lower()
-
-    # === Replace the single alias_map with two maps ===
-    team_alias_map = {
-        'teamkey': 'team_key',
-        'owner': 'owner_name',
-        'league_result_final': 'league_result',
-        'regular_season_rank': 'regular_season_ranking',
-        'points_for': 'points_for_total',            # <- totals live in teams_df
-        'points_against': 'points_against_total',    # <- totals live in teams_df
-        'waiver_moves': 'number_of_waiver_moves',
-        'trades': 'number_of_trades',
-        'url': 'team_url',
-        'draft_report_card': 'draft_grade',
-        'season': 'year',
-        'isfinished': 'is_finished'
-    }
-    matchup_alias_map = {
-        'teamkey': 'team_key',
-        'opponentteamkey': 'opponent_team_key',
-        'owner': 'owner_name',
-        'league_result_final': 'league_result',
-        'regular_season_rank': 'regular_season_ranking',
-        # IMPORTANT: do NOT rename weekly points here
-        'url': 'matchup_url',
-        'season': 'year'
-    }
-
-    # Apply them separately
-    teams_df    = teams_df.rename(columns={k:v for k,v in team_alias_map.items() if k in teams_df.columns})
-    matchups_df = matchups_df.rename(columns={k:v for k,v in matchup_alias_map.items() if k in matchups_df.columns})
-
-    # Light coercions
-    for df in (teams_df, matchups_df):
-        if 'team_key' in df.columns: df['team_key'] = df['team_key'].astype(str).str.strip()
-        if 'opponent_team_key' in df.columns: df['opponent_team_key'] = df['opponent_team_key'].astype(str).str.strip()
-        if 'year' in df.columns: df['year'] = pd.to_numeric(df['year'], errors='coerce').astype('Int64')
-        if 'owner_name' in df.columns: df['owner_name'] = df['owner_name'].astype(str).str.strip()
-
-    # Minimal numeric coercions we use later
-    for c in ['regular_season_ranking','wins','losses','points_for_total','points_against_total',
-              'number_of_waiver_moves','number_of_trades','is_finished']:
-        if c in teams_df.columns:
-            teams_df[c] = pd.to_numeric(teams_df[c], errors='coerce')
-
-    for c in ['is_playoffs','high_score_flag','low_score_flag','week','year']:
-        if c in matchups_df.columns:
-            matchups_df[c] = pd.to_numeric(matchups_df[c], errors='coerce')
-
-    # Players coercions (light)
-    if 'team_key' in players_df.columns:
-        players_df['team_key'] = players_df['team_key'].astype(str).str.strip()
-    for c in ['week','player_week_points','year']:
-        if c in players_df.columns:
-            players_df[c] = pd.to_numeric(players_df[c], errors='coerce')
+from league_facts import (
+    GAME_RECORDS, build_owner_index, build_player_weeks, build_positional_edge, build_records_index,
+    build_team_weeks, record_games, rows,
+)
+from view_model import components_html
+
+
+def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df, player_weeks=None, team_weeks=None,
+                        owner_index=None, positional_edge=None, records_index=None):
+    # Frames arrive canonical (names, keys, dtypes) from data_schema.py
+    # Pre-joined fact tables (league_facts.py); built here only when the caller has none
+    if player_weeks is None:
+        player_weeks = build_player_weeks(teams_df, matchups_df, players_df)
+    if team_weeks is None:
+        team_weeks = build_team_weeks(teams_df, matchups_df)
+    if owner_index is None:
+        owner_index = build_owner_index(teams_df, team_weeks, player_weeks)
+    if positional_edge is None:
+        positional_edge = build_positional_edge(player_weeks)
+    if records_index is None:
+        records_index = build_records_index(team_weeks)
 
     # =================================================
     # GLOBAL FILTER: restrict to finished seasons only
     # =================================================
     if 'is_finished' in teams_df.columns:
-        teams_df = teams_df[teams_df['is_finished'].fillna(0) == 1].copy()
-
-    # Cascade filter to matchups/players using team_key
-    if not teams_df.empty and 'team_key' in teams_df.columns:
-        finished_keys = teams_df['team_key'].astype(str).unique()
+        teams_df = teams_df[teams_df['is_finished'].fillna(0) == 1]
 
-        if 'team_key' in matchups_df.columns:
-            matchups_df['team_key'] = matchups_df['team_key'].astype(str)
-            matchups_df = matchups_df[matchups_df['team_key'].isin(finished_keys)].copy()
-
-        if 'team_key' in players_df.columns:
-            players_df = players_df[players_df['team_key'].isin(finished_keys)].copy()
+    # Season totals live in teams_df; this tab calls them *_total
+    teams_df = teams_df.rename(columns={'points_for': 'points_for_total', 'points_against': 'points_against_total'})
 
     # Safety: if nothing left, exit early
     if teams_df.empty:
@@ -96,7 +47,8 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
     selected_owner_label = st.selectbox(
         "Select Owner:",
         owner_options,
-        index=0
+        index=0,
+        key="owner_history_select"
     )
     if selected_owner_label == "Select an owner...":
         st.info("Please select an owner to continue.")
@@ -104,15 +56,20 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
 
     owner = selected_owner_label
 
+    # This owner's weekly rows from the owner partition, cascaded to finished seasons by team_key
+    finished_keys = teams_df['team_key'].unique()
+    owner_tw = rows(owner_index, "team_weeks", owner)
+    owner_tw = owner_tw[owner_tw['team_key'].isin(finished_keys)]
+    owner_pw = rows(owner_index, "player_weeks", owner)
+    owner_pw = owner_pw[owner_pw['team_key'].isin(finished_keys)]
+
     # Optional slices (keep if you use them later)
-    teams_owner_all = teams_df[teams_df["owner_name"] == owner].copy()                # includes 2017 (within finished seasons)
-    teams_owner = teams_owner_all[teams_owner_all["year"] != 2017].copy()             # excludes 2017 for other visuals
+    teams_owner_all = teams_df[teams_df["owner_name"] == owner]                       # includes 2017 (within finished seasons)
+    teams_owner = teams_owner_all[teams_owner_all["year"] != 2017]                    # excludes 2017 for other visuals
 
     # -----------------------------
     # Cards
     # -----------------------------
-    from streamlit.components.v1 import html as st_html
-
     get_count = lambda res: int(teams_owner_all[teams_owner_all['league_result'].astype(str).str.lower() == res].shape[0])
     champs = get_count('winner')
     runnerups = get_count('runner-up')
@@ -227,7 +184,7 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
         </style>
         <div class="cards">{cards_html}</div>
         """
-        st_html(html, height=60 * len(rows))
+        components_html(st, html, height=60 * len(rows))
 
     champs_s      = _fmt_int(champs)
     runnerups_s   = _fmt_int(runnerups)
@@ -330,23 +287,19 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
     )
 
     # detect weekly points column
-    POINTS_COL = 'points for' if 'points for' in matchups_df.columns else (
-                 'points_for' if 'points_for' in matchups_df.columns else None)
+    POINTS_COL = 'points for' if 'points for' in owner_tw.columns else (
+                 'points_for' if 'points_for' in owner_tw.columns else None)
     if POINTS_COL is None:
-        raise KeyError(f"Weekly points column not found in matchups_df. Have: {list(matchups_df.columns)}")
+        raise KeyError(f"Weekly points column not found in matchups_df. Have: {list(owner_tw.columns)}")
 
-    # join matchups -> owner + year (already finished-only)
-    points_all = matchups_df.merge(
-        teams_df[['team_key','owner_name','year']].drop_duplicates(),
-        on='team_key', how='left'
-    )
+    # team-weeks carry owner + year (already finished-only)
+    points_all = owner_tw
 
     # regular season only
     if 'is_playoffs' in points_all.columns:
         points_all = points_all[points_all['is_playoffs'].fillna(0) == 0]
 
-    # clean numeric & filter to selected owner
-    points_all[POINTS_COL] = pd.to_numeric(points_all[POINTS_COL], errors='coerce')
+    # filter to selected owner
     po = points_all[points_all['owner_name'] == owner].dropna(subset=[POINTS_COL, 'year']).copy()
 
     # build clean year string and remove 2017
@@ -379,16 +332,8 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
     # -----------------------------
     # Rivalry “heat map” (horizontal bar of Win% vs opponents)
     # -----------------------------
-    # Build matchups with owner/opponent (finished-only)
-    t_map = teams_df[['team_key','year','owner_name']].drop_duplicates()
-    m_self = matchups_df.merge(t_map, on='team_key', how='left')
-
-    # Map opponent owner (finished-only)
-    t_map_opp = teams_df[['team_key','year','owner_name']].drop_duplicates().rename(columns={
-        'team_key': 'opponent_team_key',
-        'owner_name': 'opponent_owner_name'
-    })
-    m_full = m_self.merge(t_map_opp, on=['opponent_team_key','year'], how='left')
+    # Team-weeks carry owner and opponent owner (finished-only)
+    m_full = owner_tw
 
     # Filter to selected owner, regular season, and valid week_result
     mh = m_full[(m_full['owner_name'] == owner)].copy()
@@ -398,7 +343,7 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
     mh = mh[mh['week_result'].isin(['win','loss'])]
     mh['win'] = (mh['week_result'] == 'win').astype(int)
 
-    vs = (mh.groupby('opponent_owner_name', dropna=False)
+    vs = (mh.groupby('opponent_owner_name', dropna=False, observed=True)
             .agg(games=('win','count'), wins=('win','sum'))
             .reset_index())
 
@@ -433,6 +378,78 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
         st.markdown('<div style="font-size:20px;font-weight:600;margin-top:10px;margin-bottom:0px;line-height:1;">Head-to-Head Rivalry Win Rate</div>', unsafe_allow_html=True)
         st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
 
+    # -----------------------------
+    # Positional edge by year: avg weekly points per started slot vs the rest of the
+    # league (leave-one-out), one line per position (excl 2017)
+    # -----------------------------
+    edge_years = set(teams_owner['year'].dropna().astype(int))
+    oe = positional_edge[(positional_edge['owner_name'] == owner) & positional_edge['year'].isin(edge_years)]
+    oe = oe.dropna(subset=['edge'])
+
+    if not oe.empty:
+        POS_COLOR = {
+            "QB":"#d62728","RB":"#2ca02c","WR":"#1f77b4","TE":"#ff7f0e",
+            "FLEX":"#7f7f7f","K":"#9467bd","DEF":"#8c564b"
+        }
+        edge_ticks = [str(y) for y in sorted(oe['year'].astype(int).unique())]
+
+        fig_edge = go.Figure()
+        for pos in [p for p in POS_COLOR if p in set(oe['pos'])]:
+            pe = oe[oe['pos'] == pos].sort_values('year')
+            fig_edge.add_trace(go.Scatter(
+                x=pe['year'].astype(int).astype(str),
+                y=pe['edge'],
+                mode='lines+markers',
+                name=pos,
+                line=dict(width=2, color=POS_COLOR[pos]),
+                marker=dict(size=6),
+                hovertemplate=f'{pos}<br>Year: %{{x}}<br>Edge: %{{y:+.2f}} pts/wk<extra></extra>'
+            ))
+        fig_edge.add_hline(y=0, line_width=1, line_color="#888")
+        fig_edge.update_xaxes(
+            type='category',
+            categoryorder='array',
+            categoryarray=edge_ticks,
+            fixedrange=True,
+            showline=True,
+            linecolor="#444",
+            linewidth=1
+        )
+        fig_edge.update_yaxes(title_text="Pts/Wk vs League", fixedrange=True, gridcolor="#444", zeroline=False)
+        fig_edge.update_layout(
+            height=300,
+            margin=dict(l=8, r=8, t=0, b=8),
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0)
+        )
+        st.markdown('<div style="font-size:20px;font-weight:600;margin-top:10px;margin-bottom:0px;line-height:1;">Positional Edge by Year</div>', unsafe_allow_html=True)
+        st.plotly_chart(fig_edge, use_container_width=True, config={'displayModeBar': False})
+
+    # -----------------------------
+    # Owner records: this owner's top 10 games per record (records index, finished seasons)
+    # -----------------------------
+    st.markdown('<div style="font-size:20px;font-weight:600;margin-top:10px;margin-bottom:0px;line-height:1;">Owner Records</div>', unsafe_allow_html=True)
+    for tab, (label, (metric, end)) in zip(st.tabs(list(GAME_RECORDS)), GAME_RECORDS.items()):
+        games = record_games(records_index, metric, end, owner=owner)
+        games = games[games['team_key'].isin(finished_keys)].head(10)
+        with tab:
+            if games.empty:
+                st.info("No qualifying games.")
+                continue
+            st.dataframe(
+                pd.DataFrame({
+                    "#": range(1, len(games) + 1),
+                    "Year": games['year'].astype(int).to_numpy(),
+                    "Week": games['week'].astype(int).to_numpy(),
+                    "Opponent": games['opponent_owner_name'].astype(str).to_numpy(),
+                    "Points For": games['points_for'].round(2).to_numpy(),
+                    "Points Against": games['points_against'].round(2).to_numpy(),
+                    "Margin": games['margin'].round(2).to_numpy(),
+                }),
+                use_container_width=True,
+                hide_index=True,
+                height=35 * len(games) + 38,
+            )
+
     # =========================================================
     # ALL TIME PLAYERS (Owner-level; regular season starters)
     # =========================================================
@@ -442,172 +459,116 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
         st.info("Players data not provided — skipping 'All Time Players'.")
     else:
         need_cols_players = {"team_key","week","player_week_points","selected_position","player_position"}
-        pcols_lower = set(players_df.columns.str.lower())
-        if not need_cols_players.issubset(pcols_lower):
-            missing = ", ".join(sorted(need_cols_players - pcols_lower))
+        if not need_cols_players.issubset(players_df.columns):
+            missing = ", ".join(sorted(need_cols_players - set(players_df.columns)))
             st.info(f"Players table missing columns: {missing}. Cannot compute All Time Players.")
         else:
-            # ---- normalize inputs (already normalized above) ----
-            tdf = teams_df.copy()
-            mdf = matchups_df.copy()
-            pdf = players_df.copy()
-
-            # owner team/year map
-            t_owner = (
-                tdf.loc[tdf["owner_name"] == owner, ["team_key", "year"]]
-                   .dropna(subset=["team_key"])
-                   .drop_duplicates()
-                   .copy()
-            )
-            if t_owner.empty:
-                st.info("No teams found for this owner.")
+            # This owner's started players in scheduled regular-season weeks (year pre-joined)
+            pw = owner_pw
+            pmo = pw[pw["has_matchup"] & (pw["is_playoffs"] == 0) & pw["is_started"]]
+            if pmo.empty:
+                st.info("No started-player rows found for this owner in the regular season.")
             else:
-                t_owner["team_key"] = t_owner["team_key"].astype(str)
+                pmo = pmo.rename(columns={"position": "player_position_norm"})
 
-                # matchups: attach year from teams (ensuring finished-only), RS only
-                m = mdf.copy()
-                if "team_key" not in m.columns or "week" not in m.columns:
-                    st.info("matchups_df missing required columns (team_key/week).")
+                # choose player name column
+                player_name_col = next((c for c in ["player_name","player_key"] if c in pmo.columns), None)
+                if player_name_col is None:
+                    st.info("No player name/key column found; cannot compute All Time Players.")
                 else:
-                    m["team_key"] = m["team_key"].astype(str)
-                    m["week"] = pd.to_numeric(m["week"], errors="coerce").astype("Int64")
-                    m = m.merge(t_owner, on="team_key", how="inner")  # only this owner's teams (has year now)
-
-                    if "is_playoffs" not in m.columns:
-                        m["is_playoffs"] = 0
-                    m["is_playoffs"] = pd.to_numeric(m["is_playoffs"], errors="coerce").fillna(0).astype(int)
-
-                    m_owner = m[(m["is_playoffs"] == 0) & m["team_key"].notna() & m["week"].notna()].copy()
-                    if m_owner.empty:
-                        st.info("No regular-season matchups found for this owner.")
-                    else:
-                        # players: keep only rows that match the owner's scheduled weeks (adds year)
-                        pdf["team_key"] = pdf["team_key"].astype(str)
-                        pmo = pdf.merge(
-                            m_owner[["team_key", "week", "year"]],
-                            on=["team_key", "week"],
-                            how="inner",
-                            validate="m:1"
+                    pmo["player_name_display"] = pmo[player_name_col].astype(str)
+
+                    # ---------- aggregate to single-season totals per player ----------
+                    season_totals = (
+                        pmo.groupby(["player_position_norm","player_name_display","player_key","year"], dropna=False, observed=True)["player_week_points"]
+                           .sum().round(2)
+                           .reset_index()
+                           .rename(columns={"player_week_points":"points"})
+                    )
+                    season_totals["player_name"] = season_totals["player_name_display"].astype(str)
+                    season_totals["year"] = season_totals["year"].astype("Int64")
+
+                    POS_ORDER = ["QB","RB","WR","TE","K","DEF"]
+                    tabs = st.tabs(["First Team All Pro"] + POS_ORDER)
+
+                    def render_top5(df_in):
+                        df = df_in.sort_values("points", ascending=False).head(5).copy()
+                        view = df[["player_name","year","points"]].rename(columns={
+                            "player_name": "Player Name",
+                            "year": "Year Owned",
+                            "points": "Points"
+                        })
+                        n_rows = len(view)
+                        fit_height = min(500, 40 + n_rows*34 + 10)
+                        st.dataframe(
+                            view,
+                            use_container_width=True,
+                            hide_index=True,
+                            column_config={
+                                "Player Name": st.column_config.TextColumn("Player Name", pinned="left"),
+                                "Year Owned": st.column_config.NumberColumn("Year Owned", format="%d"),
+                                "Points": st.column_config.NumberColumn("Points", format="%d"),
+                            },
+                            height=fit_height,
                         )
 
-                        # starters only
-                        def _is_started(slot):
-                            s = (str(slot).strip().upper() if slot is not None else "")
-                            return s not in ("BN", "IR")
-                        pmo = pmo[pmo["selected_position"].apply(_is_started)].copy()
-
-                        if pmo.empty:
-                            st.info("No started-player rows found for this owner in the regular season.")
+                    # ---- First Team All Pro tab (QB, RB, RB, WR, WR, TE, K, DEF) ----
+                    with tabs[0]:
+                        def top_n(pos, n):
+                            tmp = season_totals[season_totals["player_position_norm"] == pos].copy()
+                            if tmp.empty:
+                                return tmp
+                            tmp = tmp.sort_values("points", ascending=False).head(n)
+                            tmp["Pos"] = pos
+                            return tmp
+
+                        # Build in exact order (and amounts): QB(1), RB(2), WR(2), TE(1), K(1), DEF(1)
+                        blocks = [
+                            top_n("QB", 1),
+                            top_n("RB", 2),
+                            top_n("WR", 2),
+                            top_n("TE", 1),
+                            top_n("K",  1),
+                            top_n("DEF",1),
+                        ]
+                        blocks = [b for b in blocks if b is not None and not b.empty]
+
+                        if not blocks:
+                            st.info("No data available to determine First Team All Pro.")
                         else:
-                            # numeric points
-                            pmo["player_week_points"] = pd.to_numeric(pmo["player_week_points"], errors="coerce").fillna(0.0)
-
-                            # position normalization
-                            def _norm_pos(p):
-                                s = str(p).strip().upper() if p is not None else ""
-                                return "DEF" if s in ("DST","D/ST","DEFENSE") else s
-                            pmo["player_position_norm"] = pmo["player_position"].map(_norm_pos)
-
-                            # choose player name column
-                            player_name_col = next((c for c in ["player_name","name","full_name","player_full_name","player_key"] if c in pmo.columns), None)
-                            if player_name_col is None:
-                                st.info("No player name/key column found; cannot compute All Time Players.")
+                            ftp = pd.concat(blocks, ignore_index=True)
+
+                            # Include Pos as first column
+                            view = ftp[["Pos", "player_name", "year", "points"]].rename(columns={
+                                "player_name": "Player Name",
+                                "year": "Year Owned",
+                                "points": "Points"
+                            })
+
+                            n_rows = len(view)
+                            fit_height = min(500, 40 + n_rows * 34 + 10)
+                            st.dataframe(
+                                view,
+                                use_container_width=True,
+                                hide_index=True,
+                                column_config={
+                                    "Pos": st.column_config.TextColumn("Pos", pinned="left"),
+                                    "Player Name": st.column_config.TextColumn("Player Name"),
+                                    "Year Owned": st.column_config.NumberColumn("Year Owned", format="%d"),
+                                    "Points": st.column_config.NumberColumn("Points", format="%d"),
+                                },
+                                height=fit_height,
+                            )
+
+
+                    # ---- Position tabs (TOP 5) ----
+                    for i, pos in enumerate(POS_ORDER, start=1):
+                        with tabs[i]:
+                            pos_tbl = season_totals[season_totals["player_position_norm"] == pos].copy()
+                            if pos_tbl.empty:
+                                st.info(f"No data for {pos}.")
                             else:
-                                pmo["player_name_display"] = pmo[player_name_col].astype(str)
-                                if "player_key" in pmo.columns:
-                                    pmo["player_key"] = pmo["player_key"].astype(str)
-
-                                # ---------- aggregate to single-season totals per player ----------
-                                season_totals = (
-                                    pmo.groupby(["player_position_norm","player_name_display","player_key","year"], dropna=False)["player_week_points"]
-                                       .sum()
-                                       .reset_index()
-                                       .rename(columns={"player_week_points":"points"})
-                                )
-                                season_totals["player_name"] = season_totals["player_name_display"].astype(str)
-                                season_totals["year"] = season_totals["year"].astype("Int64")
-
-                                POS_ORDER = ["QB","RB","WR","TE","K","DEF"]
-                                tabs = st.tabs(["First Team All Pro"] + POS_ORDER)
-
-                                def render_top5(df_in):
-                                    df = df_in.sort_values("points", ascending=False).head(5).copy()
-                                    view = df[["player_name","year","points"]].rename(columns={
-                                        "player_name": "Player Name",
-                                        "year": "Year Owned",
-                                        "points": "Points"
-                                    })
-                                    n_rows = len(view)
-                                    fit_height = min(500, 40 + n_rows*34 + 10)
-                                    st.dataframe(
-                                        view,
-                                        use_container_width=True,
-                                        hide_index=True,
-                                        column_config={
-                                            "Player Name": st.column_config.TextColumn("Player Name", pinned="left"),
-                                            "Year Owned": st.column_config.NumberColumn("Year Owned", format="%d"),
-                                            "Points": st.column_config.NumberColumn("Points", format="%d"),
-                                        },
-                                        height=fit_height,
-                                    )
-
-                                # ---- First Team All Pro tab (QB, RB, RB, WR, WR, TE, K, DEF) ----
-                                with tabs[0]:
-                                    def top_n(pos, n):
-                                        tmp = season_totals[season_totals["player_position_norm"] == pos].copy()
-                                        if tmp.empty:
-                                            return tmp
-                                        tmp = tmp.sort_values("points", ascending=False).head(n)
-                                        tmp["Pos"] = pos
-                                        return tmp
-
-                                    # Build in exact order (and amounts): QB(1), RB(2), WR(2), TE(1), K(1), DEF(1)
-                                    blocks = [
-                                        top_n("QB", 1),
-                                        top_n("RB", 2),
-                                        top_n("WR", 2),
-                                        top_n("TE", 1),
-                                        top_n("K",  1),
-                                        top_n("DEF",1),
-                                    ]
-                                    blocks = [b for b in blocks if b is not None and not b.empty]
-
-                                    if not blocks:
-                                        st.info("No data available to determine First Team All Pro.")
-                                    else:
-                                        ftp = pd.concat(blocks, ignore_index=True)
-
-                                        # Include Pos as first column
-                                        view = ftp[["Pos", "player_name", "year", "points"]].rename(columns={
-                                            "player_name": "Player Name",
-                                            "year": "Year Owned",
-                                            "points": "Points"
-                                        })
-
-                                        n_rows = len(view)
-                                        fit_height = min(500, 40 + n_rows * 34 + 10)
-                                        st.dataframe(
-                                            view,
-                                            use_container_width=True,
-                                            hide_index=True,
-                                            column_config={
-                                                "Pos": st.column_config.TextColumn("Pos", pinned="left"),
-                                                "Player Name": st.column_config.TextColumn("Player Name"),
-                                                "Year Owned": st.column_config.NumberColumn("Year Owned", format="%d"),
-                                                "Points": st.column_config.NumberColumn("Points", format="%d"),
-                                            },
-                                            height=fit_height,
-                                        )
-
-
-                                # ---- Position tabs (TOP 5) ----
-                                for i, pos in enumerate(POS_ORDER, start=1):
-                                    with tabs[i]:
-                                        pos_tbl = season_totals[season_totals["player_position_norm"] == pos].copy()
-                                        if pos_tbl.empty:
-                                            st.info(f"No data for {pos}.")
-                                        else:
-                                            render_top5(pos_tbl)
+                                render_top5(pos_tbl)
 
     # Team Summary (dataframe w/ pinned first col + link)
     # ----------------------------------------------------------------
@@ -617,7 +578,7 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
     matchups_flags_df = matchups_flags_df[matchups_flags_df['is_playoffs'] == 0].copy()
     # 3) Sum by team_key
     flag_sums = (
-        matchups_flags_df.groupby('team_key', as_index=False)
+        matchups_flags_df.groupby('team_key', as_index=False, observed=True)
         .agg(high_scores=('high_score_flag','sum'),
              low_scores =('low_score_flag','sum'))
     )
@@ -631,9 +592,7 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
     # 5) LEFT JOIN on team_key
     summary = base_summary.merge(flag_sums, on='team_key', how='left')
 
-    # Ensure numeric, then compute points diff
-    summary['points_for_total'] = pd.to_numeric(summary['points_for_total'], errors='coerce')
-    summary['points_against_total'] = pd.to_numeric(summary['points_against_total'], errors='coerce')
+    # Compute points diff
     summary['points_diff'] = (summary['points_for_total'] - summary['points_against_total']).fillna(0).astype(int)
 
     # 6) force ints (exclude FAAB so we can render it as text)
@@ -642,7 +601,7 @@ def show_owner_insights(st, go_unused, teams_df, matchups_df, players_df):
         'number_of_waiver_moves','number_of_trades','high_scores','low_scores'
     ]:
         if c in summary.columns:
-            summary[c] = pd.to_numeric(summary[c], errors='coerce').fillna(0).astype(int)
+            summary[c] = summary[c].fillna(0).astype(int)
 
     # 7) rename & order (insert FAAB Used after Waiver Moves)
     display = summary.rename(columns={
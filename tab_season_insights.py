@@ -3,22 +3,41 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
-from streamlit.components.v1 import html as st_html
 
-def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster_df=None):
+from league_facts import (
+    GAME_RECORDS, STANDING_COLUMNS, build_player_weeks, build_position_ranks, build_positional_edge,
+    build_records_index, build_season_index, build_standings, build_standings_weeks, build_team_weeks,
+    record_games, rows, starter_slot_weeks,
+)
+from perf import section_marks
+from view_model import components_html
+
+def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster_df=None,
+                         player_weeks=None, team_weeks=None, season_index=None, records_index=None):
+    mark = section_marks("season")
     has_draft = draft_roster_df is not None
 
-    # -----------------------------
-    # Normalize columns
-    # -----------------------------
-    teams = teams_df.copy()
-    matchups = matchups_df.copy()
-    players = players_df.copy()
-    for df in (teams, matchups, players):
-        df.columns = df.columns.str.strip().str.lower()
+    # Frames arrive canonical (names, keys, dtypes) from data_schema.py
+    teams, matchups, players = teams_df, matchups_df, players_df
+    # Pre-joined fact tables (league_facts.py); built here only when the caller has none
+    if player_weeks is None:
+        player_weeks = build_player_weeks(teams_df, matchups_df, players_df, draft_roster_df)
+    if team_weeks is None:
+        team_weeks = build_team_weeks(teams_df, matchups_df)
+    if season_index is None:
+        # standings and the positional tables are read by season from the index too
+        slot_weeks = starter_slot_weeks(player_weeks)
+        season_index = build_season_index(
+            teams_df, team_weeks, player_weeks,
+            standings=build_standings(teams_df, build_standings_weeks(team_weeks)),
+            positional_edge=build_positional_edge(player_weeks, slot_weeks),
+            position_ranks=build_position_ranks(player_weeks, slot_weeks),
+        )
+    if records_index is None:
+        records_index = build_records_index(team_weeks)
 
-    def _pick(df, options):
-        return next((c for c in options if c in df.columns), None)
+    def _col(df, name):
+        return name if name in df.columns else None
 
     # Require team_key
     if "team_key" not in teams.columns:
@@ -26,89 +45,16 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
         return
 
     # Column picks (teams table)
-    year_col   = _pick(teams, ["year", "season"])
-    owner_col  = _pick(teams, ["owner_name", "owner", "manager"])
-    team_col   = _pick(teams, ["team_name", "team"])
+    year_col   = _col(teams, "year")
+    owner_col  = _col(teams, "owner_name")
+    team_col   = _col(teams, "team_name")
 
-    wins_col   = _pick(teams, ["wins", "regular_season_wins", "reg_wins"])
-    losses_col = _pick(teams, ["losses", "regular_season_losses", "reg_losses"])
-    pf_col     = _pick(teams, ["points_for_total", "points_for", "regular_season_points_for", "pf_total", "total_pf"])
-    pa_col     = _pick(teams, ["points_against_total", "points_against", "regular_season_points_against", "pa_total", "total_pa"])
+    # W/L/PF/PA come from the standings table (sheet values, gaps filled from matchups)
+    wins_col, losses_col, pf_col, pa_col = "wins", "losses", "points_for", "points_against"
 
-    waiver_col   = _pick(teams, ["number_of_waiver_moves", "waiver_moves"])
-    trades_col   = _pick(teams, ["number_of_trades", "trades"])
-    faab_used_col = "faab_balance_used" if "faab_balance_used" in teams.columns else None
-
-    # -----------------------------
-    # Repair wins/losses/pf/pa from matchups if needed (regular season only)
-    # -----------------------------
-    need_from_m = (wins_col is None) or (losses_col is None) or (pf_col is None) or (pa_col is None)
-    if need_from_m:
-        need = {"team_key", "week", "points_for", "points_against"}
-        if not need.issubset(matchups.columns):
-            missing = ", ".join(sorted(need - set(matchups.columns)))
-            st.error(f"Season Insights: teams_df is missing W/L/PF/PA and matchups_df lacks columns to compute them ({missing}).")
-            return
-
-        m = matchups.copy()
-        if "year" not in m.columns:
-            if "year" not in teams.columns:
-                st.error("Season Insights: no 'year' column in teams_df or matchups_df; cannot group by season.")
-                return
-            t_year = teams[["team_key", "year"]].dropna().drop_duplicates()
-            m = m.merge(t_year, on="team_key", how="left", validate="m:1")
-
-        if "is_playoffs" in m.columns:
-            m["is_playoffs"] = pd.to_numeric(m["is_playoffs"], errors="coerce").fillna(0).astype(int)
-            m = m[m["is_playoffs"] == 0]
-
-        m["points_for"] = pd.to_numeric(m["points_for"], errors="coerce").fillna(0.0)
-        m["points_against"] = pd.to_numeric(m["points_against"], errors="coerce").fillna(0.0)
-
-        if "week_result" in m.columns:
-            res = m["week_result"].astype(str).str.strip().str.lower()
-            win_mask  = res.eq("win")
-            loss_mask = res.eq("loss")
-        else:
-            win_mask  = m["points_for"] > m["points_against"]
-            loss_mask = m["points_for"] < m["points_against"]
-
-        m["win"]  = win_mask.astype(int)
-        m["loss"] = loss_mask.astype(int)
-
-        agg = (m.groupby(["team_key", "year"], dropna=False)
-                 .agg(wins=("win", "sum"),
-                      losses=("loss", "sum"),
-                      points_for_total=("points_for", "sum"),
-                      points_against_total=("points_against", "sum"))
-                 .reset_index())
-
-        teams["team_key"] = teams["team_key"].astype(str)
-        agg["team_key"]   = agg["team_key"].astype(str)
-
-        if year_col is None:
-            year_col = "year"
-            if "year" not in teams.columns:
-                st.error("Season Insights: 'year' not in teams_df; needed to merge season aggregates.")
-                return
-
-        teams = teams.merge(agg, on=["team_key", "year"], how="left", suffixes=("", "_calc"))
-
-        if wins_col   is None: wins_col   = "wins_calc"
-        if losses_col is None: losses_col = "losses_calc"
-        if pf_col     is None: pf_col     = "points_for_total_calc"
-        if pa_col     is None: pa_col     = "points_against_total_calc"
-
-        for base, calc in [("wins", "wins_calc"), ("losses","losses_calc"),
-                           ("points_for_total", "points_for_total_calc"),
-                           ("points_against_total","points_against_total_calc")]:
-            if base in teams.columns and calc in teams.columns:
-                teams[base] = teams[base].fillna(teams[calc])
-
-        for colname in [wins_col, losses_col, pf_col, pa_col]:
-            if colname not in teams.columns:
-                st.error(f"Season Insights: failed to compute missing column '{colname}'.")
-                return
+    waiver_col   = _col(teams, "number_of_waiver_moves")
+    trades_col   = _col(teams, "number_of_trades")
+    faab_used_col = _col(teams, "faab_balance_used")
 
     # Confirm owner/year
     if year_col is None or year_col not in teams.columns:
@@ -118,11 +64,6 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
         st.error("Season Insights: Could not resolve an 'owner_name' column in teams_df.")
         return
 
-    # Coerce numerics (safe)
-    for c in [year_col, wins_col, losses_col, pf_col, pa_col, waiver_col, trades_col, faab_used_col]:
-        if c and c in teams.columns:
-            teams[c] = pd.to_numeric(teams[c], errors="coerce")
-
     # -----------------------------
     # Year slicer (default latest)
     # -----------------------------
@@ -132,17 +73,34 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
         return
 
     selected_year = st.selectbox("Season:", options=years, index=len(years)-1, key="season_insights_year")
-    season = teams[teams[year_col] == selected_year].copy()
+    season_teams = rows(season_index, "teams", selected_year)
+    season_standings = rows(season_index, "standings", selected_year).drop(columns=["year"])
+    season_teams = (
+        season_teams.drop(columns=[c for c in STANDING_COLUMNS if c in season_teams.columns])
+                    .merge(season_standings, on="team_key", how="left")
+    )
+    # FAAB isn't in the load schema; the other numeric columns arrive typed
+    if faab_used_col:
+        season_teams = season_teams.assign(**{faab_used_col: pd.to_numeric(season_teams[faab_used_col], errors="coerce")})
+    season = season_teams
     if season.empty:
         st.info("No data for the selected season.")
         return
 
+    # Regular-season weeks of this season (scheduled weeks only for players)
+    season_tw = rows(season_index, "team_weeks", selected_year)
+    season_tw = season_tw[season_tw["is_playoffs"] == 0]
+    season_pw = rows(season_index, "player_weeks", selected_year)
+    season_pw = season_pw[(season_pw["is_playoffs"] == 0) & season_pw["has_matchup"]]
+
+    mark("setup")
+
     # =============== Season Result ===============
-    is_finished_col = next((c for c in ["is_finished", "finished", "season_finished"] if c in teams.columns), None)
-    league_res_col  = next((c for c in ["league_result", "league_result_final", "final_result"] if c in teams.columns), None)
+    is_finished_col = _col(teams, "is_finished")
+    league_res_col  = _col(teams, "league_result")
     owner_disp_col  = owner_col
 
-    _season_raw = teams[teams[year_col] == selected_year].copy()
+    _season_raw = season_teams
 
     def _norm_res(s: str) -> str:
         t = (s or "").strip().lower()
@@ -224,60 +182,53 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
           </div>
         </div>
         """
-        st_html(html, height=90)
+        components_html(st, html, height=90)
+
+    mark("season_result")
 
     # -----------------------------
     # Season Standings table
     # -----------------------------
+    # Shared season rows: derive new frames with .assign()/.merge(), never write into them
     w = season[wins_col].fillna(0).astype(int)
     l = season[losses_col].fillna(0).astype(int)
-    season["Record"] = w.astype(str) + "-" + l.astype(str)
-
-    season["Points For"]     = pd.to_numeric(season[pf_col], errors="coerce").fillna(0).astype(int)
-    season["Points Against"] = pd.to_numeric(season[pa_col], errors="coerce").fillna(0).astype(int) if pa_col else 0
-    season["Waiver Moves"]   = pd.to_numeric(season[waiver_col], errors="coerce").fillna(0).astype(int) if waiver_col else 0
-    season["Trades"]         = pd.to_numeric(season[trades_col], errors="coerce").fillna(0).astype(int) if trades_col else 0
 
     if faab_used_col:
         faab_clean = season[faab_used_col].astype(str).str.replace(r"[^0-9\.\-]", "", regex=True)
-        season["FAAB Balance"] = pd.to_numeric(faab_clean, errors="coerce").round(0).fillna(0).astype(int)
+        faab = pd.to_numeric(faab_clean, errors="coerce").round(0).fillna(0).astype(int)
     else:
-        season["FAAB Balance"] = 0
+        faab = 0
+
+    season = season.assign(**{
+        "Record":         w.astype(str) + "-" + l.astype(str),
+        "Points For":     season[pf_col].fillna(0).astype(int),
+        "Points Against": season[pa_col].fillna(0).astype(int) if pa_col else 0,
+        "Waiver Moves":   season[waiver_col].fillna(0).astype(int) if waiver_col else 0,
+        "Trades":         season[trades_col].fillna(0).astype(int) if trades_col else 0,
+        "FAAB Balance":   faab,
+    })
 
     # # High/Low Scores (regular season only)
     need_flags = {"team_key","week","high_score_flag","low_score_flag"}
     if not need_flags.issubset(matchups.columns):
-        season["_high_scores"] = 0
-        season["_low_scores"]  = 0
+        season = season.assign(_high_scores=0, _low_scores=0)
     else:
-        m2 = matchups.copy()
-        if "year" not in m2.columns:
-            ty = teams[["team_key", year_col]].dropna().drop_duplicates().rename(columns={year_col: "year"})
-            m2 = m2.merge(ty, on="team_key", how="left", validate="m:1")
-        m2 = m2[m2["year"] == selected_year].copy()
-        if "is_playoffs" in m2.columns:
-            m2["is_playoffs"] = pd.to_numeric(m2["is_playoffs"], errors="coerce").fillna(0).astype(int)
-            m2 = m2[m2["is_playoffs"] == 0]
-        m2["team_key"] = m2["team_key"].astype(str)
-        m2["high_score_flag"] = pd.to_numeric(m2["high_score_flag"], errors="coerce").fillna(0).astype(int)
-        m2["low_score_flag"]  = pd.to_numeric(m2["low_score_flag"],  errors="coerce").fillna(0).astype(int)
         counts = (
-            m2.groupby("team_key", dropna=False)[["high_score_flag","low_score_flag"]]
+            season_tw.groupby("team_key", dropna=False, observed=True)[["high_score_flag","low_score_flag"]]
               .sum().reset_index()
               .rename(columns={"high_score_flag": "_high_scores", "low_score_flag": "_low_scores"})
         )
-        season["team_key"] = season["team_key"].astype(str)
-        season = season.merge(counts, on="team_key", how="left")
-        season["_high_scores"] = season["_high_scores"].fillna(0).astype(int)
-        season["_low_scores"]  = season["_low_scores"].fillna(0).astype(int)
+        season = season.assign(team_key=season["team_key"].astype(str)).merge(counts, on="team_key", how="left")
+        season = season.assign(
+            _high_scores=season["_high_scores"].fillna(0).astype(int),
+            _low_scores=season["_low_scores"].fillna(0).astype(int),
+        )
 
     season = season.sort_values(by=[wins_col, pf_col], ascending=[False, False]).reset_index(drop=True)
-    season["Rank"] = range(1, len(season) + 1)
-
-    if team_col is None:
-        season["_team_display"] = "-"
-    else:
-        season["_team_display"] = season[team_col].astype(str).replace({"": "-"}).fillna("-")
+    season = season.assign(
+        Rank=range(1, len(season) + 1),
+        _team_display="-" if team_col is None else season[team_col].astype(str).replace({"": "-"}).fillna("-"),
+    )
 
     season = season.rename(columns={
         owner_col: "Owner",
@@ -291,7 +242,7 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
         "Points For", "Points Against",
         "# High Scores", "# Low Scores",
         "Waiver Moves", "Trades", "FAAB Balance"
-    ]].copy()
+    ]]
 
     st.markdown(
         '<div style="font-size:20px;font-weight:600;margin-top:0px; margin-bottom:2px;">Season Standings</div>',
@@ -321,6 +272,8 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
     # Owner -> overall Rank (for labels/sorting)
     owner_rank_map = dict(zip(final_df["Owner"], final_df["Rank"]))
 
+    mark("standings")
+
     # -----------------------------
     # Started Position Group Ranks — Heatmap (1 = best)
     # -----------------------------
@@ -333,77 +286,17 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
         st.info("Missing 'team_key' in teams or matchups; cannot compute position ranks.")
         return
 
-    _teams_key_year = teams[["team_key", year_col]].dropna().drop_duplicates().rename(columns={year_col: "year"})
-
-    _m = matchups.merge(_teams_key_year, on="team_key", how="left", validate="m:1")
-    _m = _m[_m["year"] == selected_year].copy()
-    if "is_playoffs" in _m.columns:
-        _m["is_playoffs"] = pd.to_numeric(_m["is_playoffs"], errors="coerce").fillna(0).astype(int)
-        _m = _m[_m["is_playoffs"] == 0]
-    if "week" not in _m.columns:
-        st.info("Missing 'week' in matchups; cannot compute position ranks.")
-        return
-    _m["week"] = pd.to_numeric(_m["week"], errors="coerce")
-
-    owner_map = (
-        teams[teams[year_col] == selected_year][["team_key", owner_col]]
-        .dropna(subset=["team_key"]).drop_duplicates().assign(team_key=lambda d: d["team_key"].astype(str))
-        .rename(columns={owner_col: "owner_name"})
-    )
-
-    if "team_key" not in players.columns or "week" not in players.columns:
-        st.info("Missing 'team_key' or 'week' in players; cannot compute position ranks.")
-        return
-
-    _t_y = teams[teams[year_col] == selected_year].drop_duplicates(subset=["team_key"])[["team_key", year_col]].rename(columns={year_col: "year"})
-    _p = players.merge(_t_y, on="team_key", how="left", validate="m:1")
-    _p = _p[_p["year"].notna()].copy()
-    _p["year"] = _p["year"].astype(int)
-    _pm = _p.merge(_m[["team_key", "week", "year"]], on=["team_key", "week", "year"], how="inner")
-
-    if not {"selected_position", "player_week_points", "team_key", "week"}.issubset(_pm.columns):
+    if not {"selected_position", "player_week_points", "week"}.issubset(season_pw.columns):
         st.info("Missing required columns to compute position ranks.")
         return
 
-    def _is_started(slot):
-        s = str(slot).strip().upper() if slot is not None else ""
-        return s not in ("BN", "IR")
-
-    _pm = _pm[_pm["selected_position"].apply(_is_started)].copy()
-    _pm["player_week_points"] = pd.to_numeric(_pm["player_week_points"], errors="coerce").fillna(0.0)
-    _pm["team_key"] = _pm["team_key"].astype(str)
-
-    BASE = {"QB", "RB", "WR", "TE", "K", "DEF"}
-    def _map_slot(s: str) -> str:
-        s = (s or "").strip().upper()
-        if s == "DST": return "DEF"
-        return s if s in BASE else "FLEX"
-    _pm["pos"] = _pm["selected_position"].map(_map_slot)
-
-    # Avg within TEAM × WEEK × POS (two RBs started → avg their points)
-    twpos = (
-        _pm.groupby(["team_key", "week", "pos"], as_index=False)["player_week_points"]
-           .mean()
-           .rename(columns={"player_week_points": "weekly_avg"})
-    )
-    if twpos.empty:
+    # This season's slice of the all-seasons rank table (league_facts.build_position_ranks):
+    # starters averaged per team × week × slot, then per owner, dense-ranked within each slot
+    owner_pos = rows(season_index, "position_ranks", selected_year)
+    if owner_pos.empty:
         st.info("No starter data found to compute position ranks.")
         return
-
-    twpos = twpos.merge(owner_map, on="team_key", how="left")
-
-    owner_pos = (
-        twpos.groupby(["owner_name", "pos"], dropna=False)["weekly_avg"]
-             .mean()
-             .reset_index()
-             .rename(columns={"weekly_avg": "owner_pos_avg"})
-    )
-
-    owner_pos["rank_in_pos"] = (
-        owner_pos.groupby("pos")["owner_pos_avg"]
-                 .rank(method="dense", ascending=False)
-                 .astype(int)
-    )
+    owner_pos = owner_pos.assign(rank_in_pos=owner_pos["rank"].astype(int))
 
     desired_order = ["QB", "RB", "WR", "TE", "FLEX", "K", "DEF"]
     heat_rank = owner_pos.pivot(index="owner_name", columns="pos", values="rank_in_pos")
@@ -432,78 +325,17 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
     fig_rank.update_yaxes(title=None, ticktext=y_labels_rank, tickvals=list(range(len(y_labels_rank))))
     st.plotly_chart(fig_rank, use_container_width=True, config={"displayModeBar": False})
 
+    mark("rank_heatmap")
+
     # -----------------------------
-    # Leave-One-Out positional diffs helper
+    # Leave-One-Out positional diffs: this season's slice of the all-seasons table
+    # (league_facts.build_positional_edge)
     # -----------------------------
-    def _compute_positional_diffs_LOO(teams, matchups, players, selected_year, year_col, owner_col):
-        mk = matchups.copy()
-        if "year" not in mk.columns:
-            ty = teams[["team_key", year_col]].dropna().drop_duplicates().rename(columns={year_col: "year"})
-            mk = mk.merge(ty, on="team_key", how="left", validate="m:1")
-
-        mk = mk[["team_key","week","year","is_playoffs"]].copy()
-        mk["team_key"] = mk["team_key"].astype(str)
-        mk["year"]     = pd.to_numeric(mk["year"], errors="coerce")
-        mk = mk[mk["year"] == selected_year]
-        if "is_playoffs" in mk.columns:
-            mk["is_playoffs"] = pd.to_numeric(mk["is_playoffs"], errors="coerce").fillna(0).astype(int)
-            mk = mk[mk["is_playoffs"] == 0]
-
-        pp = players.copy()
-        pp["team_key"] = pp["team_key"].astype(str)
-        pp = pp.merge(mk, on=["team_key","week"], how="inner")
-
-        pp = pp[~pp["selected_position"].astype(str).str.upper().isin(["BN","IR"])].copy()
-        pp["player_week_points"] = pd.to_numeric(pp["player_week_points"], errors="coerce").fillna(0.0)
-
-        def _map_slot2(s: str) -> str:
-            s = (s or "").strip().upper()
-            if s == "DST": return "DEF"
-            return s if s in {"QB","RB","WR","TE","K","DEF"} else "FLEX"
-        pp["pos"] = pp["selected_position"].map(_map_slot2)
-
-        twpos_avg = (
-            pp.groupby(["team_key","week","pos"], as_index=False)["player_week_points"]
-              .mean()
-              .rename(columns={"player_week_points":"weekly_avg"})
-        )
-
-        owner_map_df = (
-            teams[teams[year_col] == selected_year][["team_key", owner_col]]
-            .dropna(subset=["team_key"]).drop_duplicates()
-            .rename(columns={owner_col: "owner_name"})
-        )
-        owner_map_df["team_key"] = owner_map_df["team_key"].astype(str)
-        twpos_avg = twpos_avg.merge(owner_map_df, on="team_key", how="left")
-
-        if twpos_avg.empty or twpos_avg["owner_name"].isna().all():
-            return None
-
-        base = twpos_avg.copy()
-        grp = base.groupby(["week","pos"])["weekly_avg"]
-        base["sum_all"] = grp.transform("sum")
-        base["cnt_all"] = grp.transform("count")
-        den = (base["cnt_all"] - 1).replace(0, np.nan)
-        base["loo_avg"] = np.where(
-            base["cnt_all"] > 1,
-            (base["sum_all"] - base["weekly_avg"]) / den,
-            base["weekly_avg"]
-        )
-        base["diff"] = base["weekly_avg"] - base["loo_avg"]
-
-        owner_pos_diff = (
-            base.groupby(["owner_name","pos"], dropna=False)["diff"]
-                .mean()
-                .reset_index()
-        )
-
-        BASE_POS = ["QB","RB","WR","TE","FLEX","K","DEF"]
-        heat_diff = owner_pos_diff.pivot(index="owner_name", columns="pos", values="diff").fillna(0.0)
-        cols_present = [c for c in BASE_POS if c in heat_diff.columns]
-        heat_diff = heat_diff[cols_present]
-        return heat_diff
-
-    heat_diff = _compute_positional_diffs_LOO(teams, matchups, players, selected_year, year_col, owner_col)
+    season_edge = rows(season_index, "positional_edge", selected_year)
+    heat_diff = None
+    if not season_edge["owner_name"].isna().all():
+        heat_diff = season_edge.pivot(index="owner_name", columns="pos", values="edge").fillna(0.0)
+        heat_diff = heat_diff[[c for c in ["QB","RB","WR","TE","FLEX","K","DEF"] if c in heat_diff.columns]]
 
     # ============================================
     # Owner Tabs (positions on y-axis) — uses LOO diffs
@@ -581,48 +413,22 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
 
                 st.plotly_chart(fig_owner, use_container_width=True, config={"displayModeBar": False})
 
+    mark("loo_diffs")
+
     # =============================
     # Consistency vs Output — Avg Weekly Points (x) vs Std Dev (y)
     # =============================
 
-    def _pick(df, options):
-        return next((c for c in options if c in df.columns), None)
-
     need_match = {"team_key","week","points_for"}
     if not need_match.issubset(matchups.columns):
         st.info(f"Cannot build consistency scatter — missing columns: {', '.join(sorted(need_match - set(matchups.columns)))}")
     else:
-        # Start from matchups; make sure year exists
-        m = matchups.copy()
-        if "year" not in m.columns:
-            ty = (teams[["team_key", year_col]]
-                  .dropna().drop_duplicates()
-                  .rename(columns={year_col: "year"}))
-            m = m.merge(ty, on="team_key", how="left", validate="m:1")
-
-        # Season + regular season only
-        m = m[m["year"] == selected_year].copy()
-        if "is_playoffs" in m.columns:
-            m["is_playoffs"] = pd.to_numeric(m["is_playoffs"], errors="coerce").fillna(0).astype(int)
-            m = m[m["is_playoffs"] == 0]
-
-        # Coerce numerics
-        m["points_for"] = pd.to_numeric(m["points_for"], errors="coerce").fillna(0.0)
-        m["week"] = pd.to_numeric(m["week"], errors="coerce").astype("Int64")
-        m["team_key"] = m["team_key"].astype(str)
-
-        # Owner for this season
-        owner_map = (
-            teams[teams[year_col] == selected_year][["team_key", owner_col]]
-            .dropna(subset=["team_key"]).drop_duplicates()
-            .rename(columns={owner_col: "owner_name"})
-        )
-        owner_map["team_key"] = owner_map["team_key"].astype(str)
-        m = m.merge(owner_map, on="team_key", how="left")
+        # Season + regular season only (owner already attached)
+        m = season_tw
 
         # Aggregate weekly points per owner (sum in case a manager had multiple team_keys in a season)
         weekly_owner = (
-            m.groupby(["owner_name","week"], dropna=False)["points_for"]
+            m.groupby(["owner_name","week"], dropna=False, observed=True)["points_for"]
              .sum()
              .reset_index()
              .dropna(subset=["owner_name","week"])
@@ -633,7 +439,7 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
         else:
             # Stats per owner
             stats = (weekly_owner
-                     .groupby("owner_name", dropna=False)["points_for"]
+                     .groupby("owner_name", dropna=False, observed=True)["points_for"]
                      .agg(mean="mean", std="std", median="median", n="count", min="min", max="max")
                      .reset_index())
 
@@ -770,15 +576,13 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
 
 
 
+    mark("consistency")
+
     # ============================================
     # 100% Horizontal Stacked Bar:
     # % of Team Scoring from Drafted vs Non-Drafted Starters (Regular Season)
     # ============================================
 
-    # ---- helpers ----
-    def _pick(df, options):
-        return next((c for c in options if c in df.columns), None)
-
     # required cols
     need_players = {"team_key","week","player_week_points","selected_position","player_key"}
     need_match   = {"team_key","week"}
@@ -786,77 +590,19 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
         missing = sorted((need_players - set(players.columns)) | (need_match - set(matchups.columns)))
         st.info(f"Cannot compute drafted vs non-drafted breakdown — missing: {', '.join(missing)}")
     else:
-        # --- Build schedule (year & is_playoffs) onto players
-        mk = matchups.copy()
-        if "year" not in mk.columns:
-            ty = teams[["team_key", year_col]].dropna().drop_duplicates().rename(columns={year_col: "year"})
-            mk = mk.merge(ty, on="team_key", how="left", validate="m:1")
-
-        mk = mk[["team_key","week","year","is_playoffs"]].copy()
-        mk["team_key"] = mk["team_key"].astype(str)
-
-        pp = players.copy()
-        pp["team_key"] = pp["team_key"].astype(str)
-        pp = pp.merge(mk, on=["team_key","week"], how="left")
-
-        # season + regular season + starters only
-        pp = pp[pp["year"] == selected_year].copy()
-        pp["is_playoffs"] = pd.to_numeric(pp["is_playoffs"], errors="coerce").fillna(0).astype(int)
-        pp = pp[pp["is_playoffs"] == 0]
-        pp = pp[~pp["selected_position"].astype(str).str.upper().isin(["BN","IR"])]
-        pp["player_week_points"] = pd.to_numeric(pp["player_week_points"], errors="coerce").fillna(0.0)
-
-        # --- Owner map for this season
-        owner_map_df = (
-            teams[teams[year_col] == selected_year][["team_key", owner_col]]
-            .dropna(subset=["team_key"]).drop_duplicates()
-            .rename(columns={owner_col: "owner_name"})
-        )
-        owner_map_df["team_key"] = owner_map_df["team_key"].astype(str)
-        pp = pp.merge(owner_map_df, on="team_key", how="left")
-
-        # --- Drafted set per team for this season
-        d = draft_roster_df.copy()
-        d.columns = d.columns.str.strip().str.lower()
-        pp.columns = pp.columns.str.strip().str.lower()
+        # season + regular season + starters only (owner already attached)
+        pp = season_pw[season_pw["is_started"]]
 
-        dkey = _pick(d, ["player_key","player_id"])
-        if dkey is None:
-            st.info("draft_roster_df needs a player_key/player_id column to determine drafted players.")
+        # Drafted = on this team's draft roster; flagged once per load (league_facts.py)
+        if "is_drafted" not in pp.columns:
+            st.info("draft_roster_df needs a player_key column to determine drafted players.")
         else:
-            # filter draft list for this season if it has a year column
-            if "year" in d.columns:
-                d_season = d[d["year"] == selected_year].copy()
-            else:
-                d_season = d.copy()
-
-            # normalize types for join/membership tests
-            d_season["team_key"]  = d_season["team_key"].astype(str)
-            d_season[dkey]        = d_season[dkey].astype(str)
-            pp["player_key"]      = pp["player_key"].astype(str)
-
-            # Build a (team_key -> set(player_key)) map of drafted players
-            drafted_map = (
-                d_season.groupby("team_key")[dkey]
-                        .apply(lambda s: set(s.dropna().astype(str).unique()))
-                        .to_dict()
-            )
-
-            # Flag drafted vs non-drafted at time of scoring
-            def _is_drafted(row):
-                t = row["team_key"]
-                pid = row["player_key"]
-                drafted_set = drafted_map.get(t, set())
-                return pid in drafted_set
-
-            pp["drafted_flag"] = pp.apply(_is_drafted, axis=1)
-
             # --- Aggregate scoring by owner × drafted_flag
             owner_flag_totals = (
-                pp.groupby(["owner_name","drafted_flag"], dropna=False)["player_week_points"]
+                pp.groupby(["owner_name","is_drafted"], dropna=False, observed=True)["player_week_points"]
                   .sum()
                   .reset_index()
-                  .rename(columns={"player_week_points":"pts"})
+                  .rename(columns={"player_week_points":"pts", "is_drafted":"drafted_flag"})
             )
 
             if owner_flag_totals.empty:
@@ -943,6 +689,8 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
                 )
                 st.plotly_chart(fig100, use_container_width=True, config={"displayModeBar": False})
     
+    mark("drafted_vs_non")
+
     # =============================
     # Top 10 Players per Position (starters-only, regular season) — Tabs
     # =============================
@@ -957,54 +705,14 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
         missing = ", ".join(sorted(need_cols_players - set(players.columns)))
         st.info(f"Players table missing columns: {missing}. Cannot compute top players.")
     else:
-        # Stamp YEAR onto matchups via teams; filter selected year + regular season
-        _teams_key_year = teams[["team_key", year_col]].dropna().drop_duplicates().rename(columns={year_col: "year"})
-        _m = matchups.merge(_teams_key_year, on="team_key", how="left", validate="m:1")
-        _m = _m[_m["year"] == selected_year].copy()
-        if "is_playoffs" in _m.columns:
-            _m["is_playoffs"] = pd.to_numeric(_m["is_playoffs"], errors="coerce").fillna(0).astype(int)
-            _m = _m[_m["is_playoffs"] == 0]
-        if "week" not in _m.columns:
-            st.info("Missing 'week' in matchups; cannot compute top players.")
+        # Started players in this season's scheduled regular-season weeks (owner attached)
+        _pm = season_pw[season_pw["is_started"]].rename(columns={"position": "player_position_norm"})
+        if _pm.empty:
+            st.info("No started-player scoring found for top-player computation.")
         else:
-            _m["week"] = pd.to_numeric(_m["week"], errors="coerce").astype("Int64")
-
-            # Map team_key -> owner for selected year
-            _owner_map = (
-                teams[teams[year_col] == selected_year][["team_key", owner_col]]
-                .dropna(subset=["team_key"]).drop_duplicates()
-                .rename(columns={owner_col: "owner_name"})
-            )
-            _owner_map["team_key"] = _owner_map["team_key"].astype(str)
-
-            # Join players to scheduled weeks for this season
-            _t_y = teams[teams[year_col] == selected_year].drop_duplicates(subset=["team_key"])[["team_key", year_col]].rename(columns={year_col: "year"})
-            _p = players.merge(_t_y, on="team_key", how="left", validate="m:1")
-            _p = _p[_p["year"].notna()].copy()
-            _p["year"] = _p["year"].astype(int)
-
-            _pm = _p.merge(_m[["team_key","week","year"]], on=["team_key","week","year"], how="inner")
-
-            # Starters only (exclude BN/IR), numeric points
-            def _is_started(slot):
-                s = str(slot).strip().upper() if slot is not None else ""
-                return s not in ("BN","IR")
-            _pm = _pm[_pm["selected_position"].apply(_is_started)].copy()
-
-            _pm["player_week_points"] = pd.to_numeric(_pm["player_week_points"], errors="coerce").fillna(0.0)
-            _pm["team_key"] = _pm["team_key"].astype(str)
-
-            # Normalize player_position groups (DST -> DEF)
-            def _norm_pos(p):
-                s = str(p).strip().upper() if p is not None else ""
-                return "DEF" if s == "DST" else s
-            _pm["player_position_norm"] = _pm["player_position"].map(_norm_pos)
-
-            # Attach owner name
-            _pm = _pm.merge(_owner_map, on="team_key", how="left")
 
             # Choose a name column for players
-            player_name_col = next((c for c in ["player_name","name","full_name","player_full_name","player_key"] if c in _pm.columns), None)
+            player_name_col = _col(_pm, "player_name") or _col(_pm, "player_key")
             if player_name_col is None:
                 st.info("No player name/key column found; cannot compute top players.")
             else:
@@ -1015,11 +723,10 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
                 if draft_roster_df is None:
                     undrafted_reason = "No draft roster available for this league/season."
                 else:
-                    d = draft_roster_df.copy()
-                    d.columns = d.columns.str.strip().str.lower()
-                    dkey = "player_key" if "player_key" in d.columns else ("player_id" if "player_id" in d.columns else None)
+                    d = draft_roster_df
+                    dkey = _col(d, "player_key")
                     if dkey is None:
-                        undrafted_reason = "draft_roster_df is missing player_key/player_id."
+                        undrafted_reason = "draft_roster_df is missing player_key."
                     else:
                         # Restrict to selected season if year present
                         if "year" in d.columns:
@@ -1035,8 +742,8 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
                 # --------- Aggregate per-position (existing tabs) ----------
                 POS_ORDER = ["QB","RB","WR","TE","K","DEF"]
                 agg = (
-                    _pm.groupby(["player_position_norm","player_name_display","owner_name"], dropna=False)["player_week_points"]
-                       .sum()
+                    _pm.groupby(["player_position_norm","player_name_display","owner_name"], dropna=False, observed=True)["player_week_points"]
+                       .sum().round(2)
                        .reset_index()
                        .rename(columns={"player_week_points": "total_points"})
                 )
@@ -1094,8 +801,8 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
                             else:
                                 # Aggregate across ALL positions
                                 und = (
-                                    undrafted_pm.groupby(["player_name_display","owner_name"], dropna=False)["player_week_points"]
-                                                .sum()
+                                    undrafted_pm.groupby(["player_name_display","owner_name"], dropna=False, observed=True)["player_week_points"]
+                                                .sum().round(2)
                                                 .reset_index()
                                                 .rename(columns={"player_week_points": "total_points"})
                                 )
@@ -1129,6 +836,8 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
                                         height=fit_height,
                                     )
     
+    mark("top_players")
+
     # =============================
     # Top Performances — Tabs: Started Players, Benched Players, Teams
     # =============================
@@ -1143,42 +852,9 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
     tabs = st.tabs(["Started Players", "Benched Players", "Teams"])
 
     # ---------- Helpers ----------
-    def _pick(df, options):
-        return next((c for c in options if c in df.columns), None)
-
     def _fit_height(n_rows, row_px=34, header_px=40, padding_px=16, max_px=1200):
         return min(max_px, header_px + n_rows * row_px + padding_px)
 
-    # Map team_key -> owner for selected year
-    _owner_map = (
-        teams[teams[year_col] == selected_year][["team_key", owner_col]]
-        .dropna(subset=["team_key"]).drop_duplicates()
-        .rename(columns={owner_col: "owner_name"})
-    )
-    _owner_map["team_key"] = _owner_map["team_key"].astype(str)
-
-    # Common base join (players + schedule for selected season, regular season only)
-    def _base_player_weeks(players_df, matchups_df):
-        mk = matchups_df.copy()
-        if "year" not in mk.columns:
-            ty = teams[["team_key", year_col]].dropna().drop_duplicates().rename(columns={year_col: "year"})
-            mk = mk.merge(ty, on="team_key", how="left", validate="m:1")
-        mk = mk[["team_key","week","year","is_playoffs"]].copy()
-        mk["team_key"] = mk["team_key"].astype(str)
-
-        pp = players_df.copy()
-        pp["team_key"] = pp["team_key"].astype(str)
-        pp = pp.merge(mk, on=["team_key","week"], how="left")
-
-        # Filter selected season, regular season only
-        pp = pp[pp["year"] == selected_year].copy()
-        pp["is_playoffs"] = pd.to_numeric(pp["is_playoffs"], errors="coerce").fillna(0).astype(int)
-        pp = pp[pp["is_playoffs"] == 0]
-
-        # Points + owner
-        pp["player_week_points"] = pd.to_numeric(pp["player_week_points"], errors="coerce").fillna(0.0)
-        pp = pp.merge(_owner_map, on="team_key", how="left")
-        return pp
 
     # ---------- Tab 1: Started Players (top individual weekly performances) ----------
     with tabs[0]:
@@ -1187,18 +863,18 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
             missing = ", ".join(sorted(need_cols_players - set(players.columns)))
             st.info(f"Players table missing columns: {missing}. Cannot compute player weekly performances.")
         else:
-            pp = _base_player_weeks(players, matchups)
             # Starters only (exclude BN/IR)
-            pp = pp[~pp["selected_position"].astype(str).str.upper().isin(["BN","IR"])]
+            pp = season_pw[season_pw["is_started"]]
 
             # Choose a player-name column
-            pname = _pick(pp, ["player_name","name","full_name","player_full_name","player_key"])
+            pname = _col(pp, "player_name") or _col(pp, "player_key")
             if pname is None:
                 st.info("No player name/key column found in players.")
             else:
                 pp["_player_week"] = pp[pname].astype(str).fillna("-") + " (Wk " + pp["week"].astype("Int64").astype(str) + ")"
                 pos_tbl = (
                     pp[["_player_week","owner_name","player_week_points","week"]]
+                    .fillna({"player_week_points": 0.0})
                     .sort_values("player_week_points", ascending=False)
                     .head(TOP_N)
                     .copy()
@@ -1235,17 +911,17 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
             missing = ", ".join(sorted(need_cols_players - set(players.columns)))
             st.info(f"Players table missing columns: {missing}. Cannot compute benched performances.")
         else:
-            pp = _base_player_weeks(players, matchups)
             # Benched only
-            pp = pp[pp["selected_position"].astype(str).str.upper().eq("BN")]
+            pp = season_pw[season_pw["slot"] == "BN"]
 
-            pname = _pick(pp, ["player_name","name","full_name","player_full_name","player_key"])
+            pname = _col(pp, "player_name") or _col(pp, "player_key")
             if pname is None:
                 st.info("No player name/key column found in players.")
             else:
                 pp["_player_week"] = pp[pname].astype(str).fillna("-") + " (Wk " + pp["week"].astype("Int64").astype(str) + ")"
                 pos_tbl = (
                     pp[["_player_week","owner_name","player_week_points","week"]]
+                    .fillna({"player_week_points": 0.0})
                     .sort_values("player_week_points", ascending=False)
                     .head(TOP_N)
                     .copy()
@@ -1282,25 +958,8 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
             missing = ", ".join(sorted(need_cols_matchups - set(matchups.columns)))
             st.info(f"Matchups table missing columns: {missing}. Cannot compute team weekly performances.")
         else:
-            m2 = matchups.copy()
-
-            # Ensure year on matchups
-            if "year" not in m2.columns:
-                ty = teams[["team_key", year_col]].dropna().drop_duplicates().rename(columns={year_col: "year"})
-                m2 = m2.merge(ty, on="team_key", how="left", validate="m:1")
-
-            # Filter season + regular season
-            m2 = m2[m2["year"] == selected_year].copy()
-            if "is_playoffs" in m2.columns:
-                m2["is_playoffs"] = pd.to_numeric(m2["is_playoffs"], errors="coerce").fillna(0).astype(int)
-                m2 = m2[m2["is_playoffs"] == 0]
-
-            # Coerce numerics
-            m2["points_for"] = pd.to_numeric(m2["points_for"], errors="coerce").fillna(0.0)
-            m2["team_key"] = m2["team_key"].astype(str)
-
-            # Attach owner
-            m2 = m2.merge(_owner_map, on="team_key", how="left")
+            # Season + regular season, owner attached
+            m2 = season_tw.assign(points_for=season_tw["points_for"].fillna(0.0))
 
             # Build display
             wk_tbl = (
@@ -1333,6 +992,8 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
                     height=_fit_height(len(view)),
                 )
 
+    mark("top_performances")
+
     # ============================================
     # GAME OUTCOME CARDS — High/Low + Biggest/Closest/Luckiest/Unluckiest
     # ============================================
@@ -1442,52 +1103,6 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
     if not need_m.issubset(matchups.columns):
         st.info(f"Matchups missing columns: {', '.join(sorted(need_m - set(matchups.columns)))}")
     else:
-        # -------- Build & filter season dataframe m --------
-        m = matchups.copy()
-
-        # attach year via teams if not present
-        if "year" not in m.columns:
-            t_year = teams[["team_key", year_col]].dropna().drop_duplicates().rename(columns={year_col:"year"})
-            m = m.merge(t_year, on="team_key", how="left", validate="m:1")
-
-        # filter to selected season & regular season only
-        m = m[m["year"] == selected_year].copy()
-        if "is_playoffs" in m.columns:
-            m["is_playoffs"] = pd.to_numeric(m["is_playoffs"], errors="coerce").fillna(0).astype(int)
-            m = m[m["is_playoffs"] == 0]
-
-        # numerics
-        for c in ["points_for","points_against","week"]:
-            m[c] = pd.to_numeric(m[c], errors="coerce")
-
-        # team/owner info (this season)
-        t_info = (
-            teams[teams[year_col] == selected_year][["team_key","owner_name","team_name"]]
-            .dropna(subset=["team_key"]).copy()
-        )
-        t_info["team_key"] = t_info["team_key"].astype(str)
-        m["team_key"] = m["team_key"].astype(str)
-        m["opponent_team_key"] = m["opponent_team_key"].astype(str)
-
-        # join this side as 'owner'/'team'
-        m = m.merge(
-            t_info.rename(columns={"owner_name":"owner","team_name":"team"}),
-            on="team_key", how="left"
-        )
-
-        # join OPPONENT info via opponent_team_key
-        opp_info = t_info.rename(columns={
-            "team_key":  "opponent_team_key",
-            "owner_name":"opponent_owner_from_teams",
-            "team_name": "opponent_team_name"
-        })
-        m = m.merge(opp_info, on="opponent_team_key", how="left")
-
-        # compute margin & result
-        m["margin"] = m["points_for"] - m["points_against"]
-        m["result"] = np.where(m["margin"] > 0, "win",
-                        np.where(m["margin"] < 0, "loss", "tie"))
-
         # ---------- Helpers ----------
         def _anno(icon_hint: str) -> str:
             """Right-aligned ⓘ with popover; no 'What's this?' text."""
@@ -1518,88 +1133,32 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
             </div>
             """
 
-        # ---------- Build each card ----------
-        wins = m[m["result"] == "win"].copy()
-
-        # Highest Team Score (any result)
-        if not m.empty and m["points_for"].notna().any():
-            hi = m.loc[m["points_for"].idxmax()]
-            highest_html = _card(
-                hi.get("owner"), hi.get("opponent_owner_from_teams"), hi.get("week"),
-                hi.get("points_for"), hi.get("points_against"),
-                "Highest Team Score", "🚀",
-                "The single highest weekly points scored by any team (regular season only)"
-            )
-        else:
-            highest_html = _card(None, None, None, 0, 0, "Highest Team Score", "🚀",
-                                 "No team-week scoring found.")
-
-        # Lowest Team Score (any result)
-        if not m.empty and m["points_for"].notna().any():
-            lo = m.loc[m["points_for"].idxmin()]
-            lowest_html = _card(
-                lo.get("owner"), lo.get("opponent_owner_from_teams"), lo.get("week"),
-                lo.get("points_for"), lo.get("points_against"),
-                "Lowest Team Score", "🧊",
-                "The single lowest weekly points scored by any team (regular season only)"
-            )
-        else:
-            lowest_html = _card(None, None, None, 0, 0, "Lowest Team Score", "🧊",
-                                "No team-week scoring found.")
-
-        # Biggest Win (largest positive margin)
-        if not wins.empty:
-            bw = wins.loc[wins["margin"].idxmax()]
-            biggest_html = _card(
-                bw["owner"], bw["opponent_owner_from_teams"], bw["week"],
-                bw["points_for"], bw["points_against"],
-                "Biggest Win", "📏",
-                "The win with the biggest points margin (points for − points against)"
-            )
-        else:
-            biggest_html = _card(None, None, None, 0, 0, "Biggest Win", "📏",
-                                 "No qualifying wins found.")
-
-        # Closest Win (smallest positive margin)
-        cw = wins[wins["margin"] > 0]
-        if not cw.empty:
-            row = cw.loc[cw["margin"].idxmin()]
-            closest_html = _card(
-                row["owner"], row["opponent_owner_from_teams"], row["week"],
-                row["points_for"], row["points_against"],
-                "Closest Win", "🤏",
-                "The win with the smallest points margin (points for − points against)"
-            )
-        else:
-            closest_html = _card(None, None, None, 0, 0, "Closest Win", "🤏",
-                                 "No qualifying wins found.")
-
-        # Luckiest Win (lowest PF among wins)
-        if not wins.empty:
-            lw = wins.loc[wins["points_for"].idxmin()]
-            luckiest_html = _card(
-                lw["owner"], lw["opponent_owner_from_teams"], lw["week"],
-                lw["points_for"], lw["points_against"],
-                "Luckiest Win", "🍀",
-                "The win with the fewest points scored by a winner all season."
-            )
-        else:
-            luckiest_html = _card(None, None, None, 0, 0, "Luckiest Win", "🍀",
-                                  "No wins recorded in the selected regular season.")
-
-        # Unluckiest Loss (highest PF among losses)
-        losses = m[m["result"] == "loss"].copy()
-        if not losses.empty:
-            ul = losses.loc[losses["points_for"].idxmax()]
-            unluckiest_html = _card(
-                ul["owner"], ul["opponent_owner_from_teams"], ul["week"],
-                ul["points_for"], ul["points_against"],
-                "Unluckiest Loss", "☔",
-                "The loss with the most points scored by a loser all season."
-            )
-        else:
-            unluckiest_html = _card(None, None, None, 0, 0, "Unluckiest Loss", "☔",
-                                    "No losses recorded in the selected regular season.")
+        # ---------- Build each card: this season's #1 game from the records index ----------
+        CARDS = [
+            ("Highest Team Score", "🚀", "The single highest weekly points scored by any team (regular season only)",
+             "No team-week scoring found."),
+            ("Lowest Team Score", "🧊", "The single lowest weekly points scored by any team (regular season only)",
+             "No team-week scoring found."),
+            ("Biggest Win", "📏", "The win with the biggest points margin (points for − points against)",
+             "No qualifying wins found."),
+            ("Closest Win", "🤏", "The win with the smallest points margin (points for − points against)",
+             "No qualifying wins found."),
+            ("Luckiest Win", "🍀", "The win with the fewest points scored by a winner all season.",
+             "No wins recorded in the selected regular season."),
+            ("Unluckiest Loss", "☔", "The loss with the most points scored by a loser all season.",
+             "No losses recorded in the selected regular season."),
+        ]
+        cards = {}
+        for label, emoji, hint, empty_hint in CARDS:
+            metric, end = GAME_RECORDS[label]
+            top = record_games(records_index, metric, end, season=selected_year, k=1)
+            if top.empty:
+                cards[label] = _card(None, None, None, 0, 0, label, emoji, empty_hint)
+            else:
+                g = top.iloc[0]
+                cards[label] = _card(g.get("owner_name"), g.get("opponent_owner_name"), g.get("week"),
+                                     g.get("points_for"), g.get("points_against"), label, emoji, hint)
+        highest_html, lowest_html, biggest_html, closest_html, luckiest_html, unluckiest_html = cards.values()
 
         # ---------- Render (3 columns × 2 rows, in your requested order) ----------
         st.markdown(
@@ -1616,3 +1175,5 @@ def show_season_insights(st, go, teams_df, matchups_df, players_df, draft_roster
         with row2[0]: st.markdown(closest_html,    unsafe_allow_html=True)
         with row2[1]: st.markdown(luckiest_html,   unsafe_allow_html=True)
         with row2[2]: st.markdown(unluckiest_html, unsafe_allow_html=True)
+
+    mark("outcome_cards")
@@ -2,31 +2,25 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 
-def show_team_insights(st, go, teams_df, matchups_df, players_df):
-    # -----------------------------
-    # Normalize & light coercions
-    # -----------------------------
-    teams = teams_df.copy()
-    matchups = matchups_df.copy()
-    players = players_df.copy()
-
-    for df in (teams, matchups, players):
-        df.columns = df.columns.str.strip().str.lower()
-
-    # coerce numerics (only if present)
-    for c in ["year","regular_season_ranking","wins","losses",
-              "points_for_total","points_against_total",
-              "number_of_waiver_moves","number_of_trades"]:
-        if c in teams.columns:
-            teams[c] = pd.to_numeric(teams[c], errors="coerce")
-
-    for c in ["year","week","is_playoffs","points_for","points_against"]:
-        if c in matchups.columns:
-            matchups[c] = pd.to_numeric(matchups[c], errors="coerce")
-
-    for c in ["week","player_week_points"]:
-        if c in players.columns:
-            players[c] = pd.to_numeric(players[c], errors="coerce")
+from league_facts import build_owner_index, build_player_weeks, build_season_index, build_team_weeks, rows
+from perf import section_marks
+from view_model import components_html
+
+def show_team_insights(st, go, teams_df, matchups_df, players_df, player_weeks=None, team_weeks=None,
+                       season_index=None, owner_index=None):
+    mark = section_marks("team")
+    # Frames arrive canonical (names, keys, dtypes) from data_schema.py
+    teams, matchups, players = teams_df, matchups_df, players_df
+    # Pre-joined fact tables (league_facts.py); built here only when the caller has none
+    if player_weeks is None:
+        player_weeks = build_player_weeks(teams_df, matchups_df, players_df)
+    if team_weeks is None:
+        team_weeks = build_team_weeks(teams_df, matchups_df)
+    # Per-season / per-owner partitions of the same tables
+    if season_index is None:
+        season_index = build_season_index(teams_df, team_weeks, player_weeks)
+    if owner_index is None:
+        owner_index = build_owner_index(teams_df, team_weeks, player_weeks)
 
     # -----------------------------
     # Owner & Year selectors (with placeholders)
@@ -42,12 +36,12 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
         return
 
     owner = selected_owner_label
+    owner_teams = rows(owner_index, "teams", owner)
 
     # --- Year selector (filtered by owner, exclude 2017) ---
     if "year" in teams.columns:
         owner_years = (
-            teams.loc[teams["owner_name"] == owner, "year"]
-            .pipe(pd.to_numeric, errors="coerce")
+            owner_teams["year"]
             .dropna()
             .astype(int)
             .unique()
@@ -77,15 +71,11 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
     year = int(selected_year_label)
 
 
-    # Optional slices (keep if you use them later)
-    teams_owner_all = teams[teams["owner_name"] == owner].copy()                # includes 2017
-    teams_owner     = teams_owner_all[teams_owner_all["year"] != 2017].copy()   # excludes 2017
-
     # -----------------------------
     # DF EDITS
     # -----------------------------
     team_row = (
-        teams[(teams["owner_name"] == owner) & (teams["year"] == year)]
+        owner_teams[owner_teams["year"] == year]
         .sort_values("team_key")
         .head(1)
     )
@@ -99,8 +89,8 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
     card_rank               = g("regular_season_ranking")
     wins                    = g("wins")
     losses                  = g("losses")
-    points_for_total        = g("points_for_total")
-    points_against_total    = g("points_against_total")
+    points_for_total        = g("points_for")
+    points_against_total    = g("points_against")
     number_of_waiver_moves  = g("number_of_waiver_moves")
     number_of_trades        = g("number_of_trades")
     team_key                = g("team_key")
@@ -121,15 +111,15 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
 
     pf_rank_val = np.nan
     pa_rank_val = np.nan
-    if "team_key" in teams.columns and "points_for_total" in teams.columns and "points_against_total" in teams.columns:
-        year_df = teams[teams["year"] == year].copy()
-        year_df["points_for_total"] = pd.to_numeric(year_df["points_for_total"], errors="coerce")
-        year_df["points_against_total"] = pd.to_numeric(year_df["points_against_total"], errors="coerce")
+    if "team_key" in teams.columns and "points_for" in teams.columns and "points_against" in teams.columns:
+        year_df = rows(season_index, "teams", year)
 
         # Rank descending so 1 = most points (PF) and 1 = most against (PA).
         # If you prefer PA where 1 = fewest against, change ascending=True below for pa_rank.
-        year_df["pf_rank"] = year_df["points_for_total"].rank(ascending=False, method="min")
-        year_df["pa_rank"] = year_df["points_against_total"].rank(ascending=False, method="min")  # flip to ascending=True if desired
+        year_df = year_df.assign(
+            pf_rank=year_df["points_for"].rank(ascending=False, method="min"),
+            pa_rank=year_df["points_against"].rank(ascending=False, method="min"),  # flip to ascending=True if desired
+        )
 
         rmap_pf = dict(zip(year_df["team_key"], year_df["pf_rank"]))
         rmap_pa = dict(zip(year_df["team_key"], year_df["pa_rank"]))
@@ -225,9 +215,9 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
     </script>
     """, unsafe_allow_html=True)
 
-    # ---------- CARD SECTION (3 rows x 3 cards) ----------
-    from streamlit.components.v1 import html as st_html
+    mark("setup")
 
+    # ---------- CARD SECTION (3 rows x 3 cards) ----------
     def _fmt_int(v):
         try:
             x = pd.to_numeric(v, errors="coerce")
@@ -367,7 +357,7 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
         <div class="cards">{cards_html}</div>
         """
 
-        st_html(html, height=70 * len(rows))
+        components_html(st, html, height=70 * len(rows))
 
     render_cards_block([
         [("Record", record), ("Reg Season Rank", reg_rank), ("League Result", league_result_clean)],
@@ -375,16 +365,12 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
         [("Waiver Moves", _fmt_int(number_of_waiver_moves)), ("FAAB Used", faab_used), ("Trades", _fmt_int(number_of_trades))],
     ])
 
+    mark("cards")
+
     # =============================
     # NEXT VISUAL: Weekly Team Stacks by Player + League Avg Line
     # =============================
 
-    def is_started(selected_position):
-        if selected_position is None:
-            return False
-        s = str(selected_position).strip().upper()
-        return s not in ("BN","IR")   # per your rule
-
     POS_COLORS = {
         "WR":"#1f77b4",  # Blue
         "RB":"#2ca02c",  # Green
@@ -393,55 +379,24 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
         "K":"#9467bd",   # Purple
         "DEF":"#8c564b", "DST":"#8c564b"
     }
-    def norm_pos(p):
-        s = str(p).upper() if p is not None else ""
-        return "DEF" if s == "DST" else s
-
-    # ---- Stamp YEAR onto matchups via teams (team_key -> year), filter regular season
-    teams_key_year = teams[["team_key","year"]].dropna().drop_duplicates()
-    m_y = matchups.merge(teams_key_year, on="team_key", how="left", validate="m:1")
-    m_y = m_y[m_y["year"] == year].copy()
-
-    if "is_playoffs" in m_y.columns:
-        m_regular = m_y[m_y["is_playoffs"] == 0].copy()
-    else:
-        m_regular = m_y.copy()
-
+    # ---- This season's regular-season weeks (year/owner come pre-joined)
+    season_tw = rows(season_index, "team_weeks", year)
+    season_pw = rows(season_index, "player_weeks", year)
+    m_regular = season_tw[season_tw["is_playoffs"] == 0]
     if "week" not in m_regular.columns:
         st.info("Missing 'week' in matchups; cannot plot weekly chart.")
         st.stop()
-    m_regular["week"] = pd.to_numeric(m_regular["week"], errors="coerce")
-
     # Weeks continuity (render zeros for byes/missing)
     weeks = sorted(m_regular["week"].dropna().astype(int).unique().tolist())
 
-    # ---- Stamp YEAR onto players via teams (team_key -> year), join to regular-season matchups
-    t1_y = teams[teams["year"] == year].drop_duplicates(subset=["team_key"])[["team_key","year"]]
-    p1 = players.merge(t1_y, on="team_key", how="left", validate="m:1")
-    p1 = p1[p1["year"].notna()].copy()
-    p1["year"] = p1["year"].astype(int)
-
-    pm = p1.merge(
-        m_regular[["team_key","week","year"]],
-        on=["team_key","week","year"],
-        how="inner"  # only scheduled weeks
-    )
-
-    # Started only (BN/IR excluded)
-    if "selected_position" not in pm.columns:
-        st.info("Missing 'selected_position' in players; cannot build weekly stacks.")
-        st.stop()
-    pm = pm[pm["selected_position"].apply(is_started)].copy()
-
-    # Ensure necessary columns exist
-    if "player_week_points" not in pm.columns:
-        st.info("Missing 'player_week_points' in players; cannot build weekly stacks.")
+    # ---- Started players in scheduled regular-season weeks (BN/IR excluded)
+    if not {"is_started", "player_week_points"}.issubset(season_pw.columns):
+        st.info("Missing 'selected_position' or 'player_week_points' in players; cannot build weekly stacks.")
         st.stop()
+    pm = season_pw[(season_pw["is_playoffs"] == 0) & season_pw["has_matchup"] & season_pw["is_started"]]
     if "player_name" not in pm.columns:
         # Fallback to player_key if name is missing
-        pm["player_name"] = pm.get("player_key").astype(str)
-
-    pm["player_week_points"] = pd.to_numeric(pm["player_week_points"], errors="coerce").fillna(0.0)
+        pm = pm.assign(player_name=pm["player_key"].astype(str))
 
     # ---- Filter to this team
     team_key_str = str(team_key)
@@ -451,7 +406,7 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
         st.stop()
 
     # Determine each player's PRIMARY position (mode across started weeks)
-    team_started["player_position_norm"] = team_started["player_position"].map(norm_pos)
+    team_started["player_position_norm"] = team_started["position"]
     primary_pos_by_player = (
         team_started
         .dropna(subset=["player_name"])
@@ -532,8 +487,8 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
     team_wk["week_result"] = team_wk["week_result"].astype(str).str.strip().str.lower()
     for flag in ("high_score_flag","low_score_flag"):
         if flag in team_wk.columns:
-            team_wk[flag] = pd.to_numeric(team_wk[flag], errors="coerce").fillna(0).astype(int)
-    team_wk["points_for"] = pd.to_numeric(team_wk["points_for"], errors="coerce").fillna(0.0)
+            team_wk[flag] = team_wk[flag].fillna(0).astype(int)
+    team_wk["points_for"] = team_wk["points_for"].fillna(0.0)
 
     def wl_style(r):
         if r == "win":  return "W", "#2ca02c"   # green
@@ -670,6 +625,8 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
 
     st.plotly_chart(fig_week, use_container_width=True, config={'displayModeBar': False})
 
+    mark("weekly_stack")
+
     # =============================
     # TREEMAP: Season Points by Player (started only, regular season)
     # =============================
@@ -685,7 +642,7 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
         if "player_week_points" not in df.columns:
             st.info("Missing 'player_week_points'; cannot build treemap.")
         else:
-            df["player_week_points"] = pd.to_numeric(df["player_week_points"], errors="coerce").fillna(0.0)
+            df["player_week_points"] = df["player_week_points"].fillna(0.0)
 
             # Player name fallback
             if "player_name" not in df.columns or df["player_name"].isna().all():
@@ -761,6 +718,8 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
                 fig_tree.update_layout(margin=dict(l=8, r=8, t=0, b=8))
                 st.plotly_chart(fig_tree, use_container_width=True, config={"displayModeBar": False})
 
+    mark("treemap")
+
     # =============================
     # BAR CHART ONLY (Neutral, no error bars): Weekly Position Scoring vs League
     # =============================
@@ -769,30 +728,19 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
         miss = sorted(required - set(pm.columns))
         st.info(f"Missing columns for bar chart: {', '.join(miss)}")
     else:
-        dfb = pm.copy()
-        dfb["selected_position"]  = dfb["selected_position"].astype(str).str.upper()
-        dfb["player_week_points"] = pd.to_numeric(dfb["player_week_points"], errors="coerce").fillna(0.0)
-        dfb["team_key"]           = dfb["team_key"].astype(str)
-        dfb["week"]               = pd.to_numeric(dfb["week"], errors="coerce").astype("Int64")
-
-        # Map slots -> position groups; DST->DEF; any non-pure slot -> FLEX
-        BASE = {"QB","RB","WR","TE","K","DEF"}
-        def map_slot(s: str) -> str:
-            s = (s or "").strip().upper()
-            if s == "DST": return "DEF"
-            return s if s in BASE else "FLEX"
-        dfb["pos"] = dfb["selected_position"].map(map_slot)
+        # Slot groups come pre-mapped (DST->DEF; any non-pure slot -> FLEX)
+        dfb = pm.assign(pos=pm["slot"].astype(str), player_week_points=pm["player_week_points"].fillna(0.0))
 
         # Average per TEAM × WEEK × POS (avg of starters that week)
         twpos_avg = (
-            dfb.groupby(["team_key","week","pos"], as_index=False)["player_week_points"]
+            dfb.groupby(["team_key","week","pos"], as_index=False, observed=True)["player_week_points"]
                .mean()
                .rename(columns={"player_week_points":"weekly_avg"})
         )
 
         # Meta for hover
         meta = (
-            teams[teams["year"] == year][["team_key","team_name","owner_name"]]
+            rows(season_index, "teams", year)[["team_key","team_name","owner_name"]]
             .dropna(subset=["team_key"]).drop_duplicates(subset=["team_key"])
             .assign(team_key=lambda d: d["team_key"].astype(str))
         )
@@ -929,40 +877,18 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
                 key=f"bar_pos_vs_league_{year}_{str(team_key)}_contrast_noerr"
             )
 
+    mark("position_bars")
+
     # =============================
     # MATCHUPS TABLE (neutral background, Opponent as "Team (Owner)")
     # =============================
-    from streamlit.components.v1 import html as st_html
+    # 2) Team-weeks already carry this team's and the opponent's year/team/owner
+    tw = season_tw.rename(columns={"opponent_owner_name": "opponent_owner_from_teams"})
 
-    # 1) Normalize working copies
-    m = matchups_df.copy()
-    t = teams_df.copy()
-    p = players_df.copy()
-
-    for df in (m, t, p):
-        df.columns = df.columns.str.strip().str.lower()
-
-    # 2) team_key -> (year, team_name, owner_name)
-    team_info = t[["team_key", "year", "team_name", "owner_name"]].drop_duplicates()
-
-    # 3) Join THIS team info (get year/team/owner)
-    m1 = m.merge(team_info, on="team_key", how="left", validate="m:1", suffixes=("", "_team"))
-
-    # 4) Join OPPONENT info via opponent_team_key
-    opp_info = team_info.rename(columns={
-        "team_key":  "opponent_team_key",
-        "team_name": "opponent_team_name",
-        "owner_name":"opponent_owner_from_teams",
-        "year":      "opponent_year"
-    })
-    m2 = m1.merge(opp_info, on="opponent_team_key", how="left", validate="m:1")
-
-    # 5) Filter to selected season + current team
     # 5) Filter to selected season + current team + only regular season (is_playoffs = 0)
-    m2 = m2[
-        (m2["year"] == year) &
-        (m2["team_key"].astype(str) == str(team_key)) &
-        (m2["is_playoffs"].fillna(0).astype(int) == 0)   # 👈 NEW FILTER
+    m2 = tw[
+        (tw["team_key"] == str(team_key)) &
+        (tw["is_playoffs"] == 0)
     ].copy()
 
 
@@ -977,32 +903,21 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
 
     m2["Opponent"] = m2.apply(_pick_opponent, axis=1)
 
-    # 7) Coerce numerics + compute points diff if needed
-    for c in ["points_for", "points_against", "points_difference", "week"]:
-        if c in m2.columns:
-            m2[c] = pd.to_numeric(m2[c], errors="coerce")
-
+    # 7) Compute points diff if needed
     if "points_difference" not in m2.columns or m2["points_difference"].isna().any():
         m2["points_difference"] = (m2["points_for"] - m2["points_against"])
 
     # 7.5) ✨ TOP PLAYER SPLIT: name + integer points in separate columns
-    # ---- Normalize players_df & filter to RS + valid positions
-    if "is_playoffs" in p.columns:
-        p = p[p["is_playoffs"].fillna(0).astype(int) == 0]
-    if "selected_position" in p.columns:
-        p = p[~p["selected_position"].astype(str).str.upper().isin(["BN","IR"])]
+    # ---- This team's started players
+    p = season_pw[season_pw["team_key"] == str(team_key)]
+    if "is_started" in p.columns:
+        p = p[p["is_started"]]
 
-    # Coerce numerics
-    for c in ["week", "player_week_points"]:
-        if c in p.columns:
-            p[c] = pd.to_numeric(p[c], errors="coerce")
-
-    # Choose a player-name column defensively
-    name_col = next((c for c in ["player_name","name","full_name","player_full_name"] if c in p.columns), None)
+    name_col = "player_name" if "player_name" in p.columns else None
 
     if name_col and {"team_key","week","player_week_points"}.issubset(p.columns):
         # idx of max per (team_key, week)
-        idx = p.groupby(["team_key","week"])["player_week_points"].idxmax()
+        idx = p.groupby(["team_key","week"], observed=True)["player_week_points"].idxmax()
         top = p.loc[idx, ["team_key","week", name_col, "player_week_points"]].copy()
         top.rename(columns={name_col: "Top Player"}, inplace=True)
 
@@ -1102,3 +1017,5 @@ def show_team_insights(st, go, teams_df, matchups_df, players_df):
         },
         height=fit_height,  # 👈 fits all records on screen (page scroll only)
     )
+
+    mark("matchup_table")
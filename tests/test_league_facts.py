@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from data_loader import prepare_tables
+from league_facts import add_fact_tables, add_partitions, record_games, rows
+from synthetic_league import generate_league
+
+
+@pytest.fixture(scope="module")
+def league():
+    return generate_league(n_owners=6, n_seasons=2, seed=3)
+
+
+def _facts(raw):
+    return add_fact_tables(prepare_tables({name: df.copy() for name, df in raw.items()}))
+
+
+def test_blank_playoff_flags_count_as_regular_season(league):
+    blanked = dict(league)
+    m = league["matchups"]
+    blanked["matchups"] = m.assign(is_playoffs=m["is_playoffs"].astype(float).where(m["is_playoffs"] == 1))
+
+    facts, blank = _facts(league), _facts(blanked)
+
+    assert blank["team_weeks"]["is_playoffs"].notna().all()
+    assert (blank["team_weeks"]["is_playoffs"] == 0).sum() == (facts["team_weeks"]["is_playoffs"] == 0).sum()
+    pd.testing.assert_frame_equal(blank["standings"], facts["standings"])
+    pd.testing.assert_frame_equal(blank["standings_weeks"], facts["standings_weeks"])
+    pd.testing.assert_frame_equal(
+        record_games(blank["records_index"], "score", "top"),
+        record_games(facts["records_index"], "score", "top"),
+    )
+
+
+
+def test_blank_player_points_stay_blank(league):
+    p = league["players"]
+    points = p["player_week_points"].where(p.index % 7 != 0)
+    blank = _facts({**league, "players": p.assign(player_week_points=points)})
+    zeroed = _facts({**league, "players": p.assign(player_week_points=points.fillna(0.0))})
+    pw = blank["player_weeks"]
+
+    # A starter without a score is not a zero-point start
+    assert pw["player_week_points"].isna().sum() == points.isna().sum()
+    goose_eggs = pw["is_started"] & (pw["player_week_points"] <= 0)
+    assert goose_eggs.sum() < (zeroed["player_weeks"]["is_started"] & (zeroed["player_weeks"]["player_week_points"] <= 0)).sum()
+    # Averages count them as 0
+    pd.testing.assert_frame_equal(blank["position_ranks"], zeroed["position_ranks"])
+    pd.testing.assert_frame_equal(blank["positional_edge"], zeroed["positional_edge"])
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_season_index_serves_the_derived_tables(league, lazy):
+    tables = add_partitions(_facts(league), lazy=lazy)
+    for name in ("standings", "positional_edge", "position_ranks"):
+        df = tables[name]
+        for year in df["year"].unique():
+            pd.testing.assert_frame_equal(rows(tables["season_index"], name, int(year)), df[df["year"] == year])
+        assert rows(tables["season_index"], name, 1900).empty
@@ -0,0 +1,79 @@
+import json
+import pickle
+
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+from pandas.io.formats.style import Styler
+
+from bench_tabs import scenarios, synthetic_tables
+from headless_st import HeadlessSt, StopRender, render_page
+from view_cache import ViewCache
+from view_model import PAGES, build_view, show_page
+
+# Each page rendered three ways must emit the same calls: the tab run directly on
+# st, through its view model (show_page), and from a cached view that went through
+# pickle the way precompute's worker processes hand views back.
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return synthetic_tables(6, 3, seed=1)
+
+
+def _unset(spec):
+    # A figure property set to None serializes as null (or {}) until the figure is pickled
+    if isinstance(spec, dict):
+        spec = {k: _unset(v) for k, v in spec.items()}
+        return {k: v for k, v in spec.items() if v is not None and v != {}}
+    if isinstance(spec, list):
+        return [_unset(v) for v in spec]
+    return spec
+
+
+def _plain(x):
+    if isinstance(x, go.Figure):
+        return _unset(json.loads(x.to_json()))
+    if isinstance(x, Styler):
+        return x.to_html()
+    if isinstance(x, (pd.DataFrame, pd.Series)):
+        return x.to_json(orient="split", date_format="iso")
+    if isinstance(x, (list, tuple)):
+        return [_plain(v) for v in x]
+    if isinstance(x, dict):
+        return {k: _plain(v) for k, v in x.items()}
+    return x
+
+
+def _calls(st):
+    return [_plain(call) for call in st.calls]
+
+
+def _direct(page, selections, tables):
+    st = HeadlessSt(selections)
+    try:
+        PAGES[page](st, tables)
+    except StopRender:
+        st._rec("stop")
+    return _calls(st)
+
+
+def _cached(page, selections, tables):
+    cache = ViewCache(build=lambda *a: pickle.loads(pickle.dumps(build_view(*a))))
+    st = HeadlessSt(selections)
+    try:
+        show_page(st, page, tables, build=cache.get)
+    except StopRender:
+        st._rec("stop")
+    return _calls(st)
+
+
+@pytest.mark.parametrize("page", list(PAGES))
+def test_view_renders_like_the_tab(page, tables):
+    for selections in [sel for p, sel in scenarios(tables, [page])][:2]:
+        direct = _direct(page, selections, tables)
+        assert direct
+        st = HeadlessSt(selections)
+        render_page(page, st, tables)
+        assert _calls(st) == direct
+        assert _cached(page, selections, tables) == direct
@@ -0,0 +1,65 @@
+import pytest
+
+from headless_st import HeadlessSt, render_page
+from view_model import PAGES, UnsupportedCall, ViewBuilder, build_view, render_view
+
+
+def _page(monkeypatch, fn):
+    monkeypatch.setitem(PAGES, "test", fn)
+    return "test"
+
+
+def test_unsupported_calls_fail_loudly():
+    ui = ViewBuilder()
+    with pytest.raises(UnsupportedCall, match="st.text_input"):
+        ui.text_input("Name")
+    with pytest.raises(UnsupportedCall):
+        hasattr(ui.columns(2)[0], "date_input")
+
+
+@pytest.mark.parametrize("call, default, chosen, invalid", [
+    (lambda ui: ui.radio("R", ["a", "b"], key="w"), "a", "b", "c"),
+    (lambda ui: ui.multiselect("M", ["a", "b", "c"], default=["a"], key="w"), ["a"], ["b", "c"], ["z"]),
+    (lambda ui: ui.slider("S", min_value=1, max_value=10, value=3, key="w"), 3, 7, 11),
+    (lambda ui: ui.number_input("N", min_value=0, max_value=5, key="w"), 0, 4, -1),
+    (lambda ui: ui.button("B", key="w"), False, True, "yes"),
+])
+def test_widgets_answer_selections_and_replay(monkeypatch, call, default, chosen, invalid):
+    page = _page(monkeypatch, lambda ui, d: ui.markdown(repr(call(ui))))
+    assert build_view(page, {})["selections"] == {"w": default}
+    assert build_view(page, {}, {"w": invalid})["selections"] == {"w": default}
+    view = build_view(page, {}, {"w": chosen})
+    assert view["ops"][-1] == ("element", "markdown", (repr(chosen),), {})
+
+    st = HeadlessSt({"w": chosen})
+    assert render_view(st, view) is None
+    assert st.calls[-1] == ("markdown", (), repr(chosen))
+
+
+def _tabbed_pick(ui, d):
+    tab, = ui.tabs(["Picks"])
+    with tab:
+        choice = ui.selectbox("Pick", ["Select one...", "x", "y"], key="pick")
+        ui.markdown(f"picked {choice}")
+
+
+def test_nested_widget_change_reruns_the_page(monkeypatch):
+    page = _page(monkeypatch, _tabbed_pick)
+    # HeadlessSt skips the placeholder the view was built with, inside a tab
+    st = HeadlessSt()
+    render_page(page, st, {})
+    assert [c for c in st.calls if c[0] == "markdown"] == [("markdown", ("tab:Picks",), "picked x")]
+
+    direct = HeadlessSt()
+    _tabbed_pick(direct, {})
+    assert st.calls == direct.calls
+
+
+def test_nested_widget_reruns_once_per_answer(monkeypatch):
+    page = _page(monkeypatch, _tabbed_pick)
+    # An answer the view never accepts: one rerun, then the page is left as rendered
+    st = HeadlessSt({"pick": "z"})
+    runs = []
+    render_page(page, st, {}, build=lambda *a: runs.append(1) or build_view(*a))
+    assert len(runs) == 2
+    assert [c for c in st.calls if c[0] == "markdown"] == [("markdown", ("tab:Picks",), "picked Select one...")]
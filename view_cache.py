@@ -0,0 +1,123 @@
+import os
+import threading
+from collections import OrderedDict
+
+from data_loader import data_version
+from view_model import build_view
+
+# -----------------------------
+# Cross-session view-model cache
+# -----------------------------
+# Views (view_model.build_view) depend only on the data and the page's widget
+# selections, so one computed view serves every session asking for the same
+# thing. Entries are keyed by (data version, page, selections) and evicted least
+# recently used first:
+#
+#   view = VIEW_CACHE.get("season", tables, st.session_state)
+#   show_page(st, "season", tables, build=VIEW_CACHE.get)
+#   VIEW_CACHE.stats()  ->  {"entries": 12, "hits": 340, "misses": 12, "evictions": 0, ...}
+#
+# Concurrent requests for a view nobody has built yet wait for the first one
+# instead of all computing it.
+
+# Page -> widget keys its view depends on; "{owner_select}" is filled from the earlier keys
+SELECTION_KEYS = {
+    "season": ("season_insights_year",),
+    "team": ("owner_select", "year_for_{owner_select}"),
+    "owner": ("owner_history_select",),
+    "league": ("league_current_owners",),
+    "hall_of_fame": (),
+    "draft": ("draft_board_year",),
+}
+
+# Views kept (0 turns the cache off). A 12-owner, 9-season league has about 140 views.
+VIEW_CACHE_SIZE = int(os.environ.get("LEAGUE_VIEW_CACHE_SIZE", "512"))
+
+
+def selection_key(page, selections):
+    """The (key, value) pairs of `selections` (e.g. st.session_state) that page's view depends on."""
+    values = {}
+    for template in SELECTION_KEYS[page]:
+        key = template.format_map(values)
+        values[key] = selections.get(key)
+    return tuple(values.items())
+
+
+def tables_version(tables):
+    # Tables without content hashes (e.g. loaded by the bench) are told apart by identity
+    return data_version(tables) or f"id-{id(tables)}"
+
+
+class ViewCache:
+    """Thread-safe LRU of built views with hit/miss/eviction counters."""
+
+    def __init__(self, max_entries=VIEW_CACHE_SIZE, build=build_view):
+        self.max_entries = max_entries
+        self._build = build
+        self._entries = OrderedDict()
+        self._building = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def key(self, page, tables, selections):
+        return tables_version(tables), page, selection_key(page, selections)
+
+    def get(self, page, tables, selections=None):
+        """The view for these selections, built (once, even under concurrent requests) on a miss."""
+        selections = {} if selections is None else selections
+        if self.max_entries <= 0:
+            return self._build(page, tables, selections)
+        key = self.key(page, tables, selections)
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key]
+                pending = self._building.get(key)
+                if pending is None:
+                    pending = self._building[key] = threading.Event()
+                    self.misses += 1
+                    break
+            pending.wait()  # someone else is building it; then look again
+        try:
+            view = self._build(page, tables, selections)
+            self.put(page, tables, selections, view)
+            return view
+        finally:
+            with self._lock:
+                del self._building[key]
+            pending.set()
+
+    def put(self, page, tables, selections, view):
+        """Store a view under the selections asked for and the ones it resolved to (defaults filled in)."""
+        keys = {self.key(page, tables, selections), self.key(page, tables, view["selections"])}
+        with self._lock:
+            for key in keys:
+                self._entries[key] = view
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else None,
+        }
+
+
+# One cache per process, shared by every session
+VIEW_CACHE = ViewCache()
@@ -0,0 +1,340 @@
+import time
+from contextlib import contextmanager
+
+import plotly.graph_objects as go
+import streamlit
+import streamlit.components.v1 as components
+
+from perf import add_section
+
+# -----------------------------
+# Page view models: compute once, render anywhere
+# -----------------------------
+# A page is split in two:
+#
+#   view = build_view("season", tables, {"season_insights_year": 2024})   # pure: data + selections
+#   render_view(st, view)                                                  # only st.* calls
+#
+# build_view runs the tab against a ViewBuilder instead of st. The builder answers
+# widgets from the selections (by widget key) and records what the page would show:
+# tables, figures, HTML cards and messages, in order and nested in their tabs/columns.
+# The view holds plain data (DataFrames, plotly figures, strings), so it can be
+# cached, pickled to another process or rendered many times; rendering does no
+# pandas work.
+#
+# view = {"page": ..., "selections": {widget key: value used}, "ops": [...], "stopped": bool}
+#   ("element", method, args, kwargs)                   st.markdown(...), st.plotly_chart(...), ...
+#   ("widget", method, args, kwargs, key, value)        st.selectbox(...) and the value the view used
+#   ("block", method, args, kwargs, [ops per child])    st.tabs/columns/expander/container
+
+
+class StopView(Exception):
+    """Raised by ViewBuilder.stop(); the view ends there (render_view then calls st.stop())."""
+
+
+class UnsupportedCall(NotImplementedError):
+    """A page called an st function the ViewBuilder doesn't model (yet)."""
+
+
+ELEMENTS = (
+    "markdown", "plotly_chart", "dataframe", "table", "html", "write", "metric",
+    "title", "header", "subheader", "caption", "info", "success", "warning", "error",
+    "components_html",
+)
+
+
+class ViewBuilder:
+    """Stands in for st while a page computes its view."""
+
+    column_config = streamlit.column_config
+
+    def __init__(self, selections=None):
+        self.selections = selections if selections is not None else {}
+        self.ops = []
+        self.widgets = {}
+        self._target = self.ops
+
+    def _emit(self, op):
+        self._target.append(op)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in ELEMENTS:
+            # Not an AttributeError: hasattr()/getattr(st, name, None) mustn't quietly skip it
+            raise UnsupportedCall(f"st.{name} isn't modelled by view_model.ViewBuilder; add it there first")
+
+        def element(*args, **kwargs):
+            self._emit(("element", name, args, kwargs))
+        return element
+
+    # Widgets: the selection for the key when it is a valid choice, else the widget default
+    def _widget(self, kind, key, default, valid, args, kwargs):
+        value = default
+        if key in self.selections and valid(self.selections[key]):
+            value = self.selections[key]
+        self.widgets[key] = value
+        self._emit(("widget", kind, args, {**kwargs, "key": key}, key, value))
+        return value
+
+    def selectbox(self, label, options, index=0, key=None, **kwargs):
+        options = list(options)
+        default = options[index] if options and index is not None else None
+        return self._widget("selectbox", key or label, default, options.__contains__,
+                            (label, options), {"index": index, **kwargs})
+
+    def radio(self, label, options, index=0, key=None, **kwargs):
+        options = list(options)
+        default = options[index] if options and index is not None else None
+        return self._widget("radio", key or label, default, options.__contains__,
+                            (label, options), {"index": index, **kwargs})
+
+    def multiselect(self, label, options, default=None, key=None, **kwargs):
+        options = list(options)
+        default = list(default or [])
+        return self._widget("multiselect", key or label, default,
+                            lambda v: isinstance(v, list) and all(x in options for x in v),
+                            (label, options), {"default": default, **kwargs})
+
+    def slider(self, label, min_value=None, max_value=None, value=None, step=None, key=None, **kwargs):
+        default = min_value if value is None else value
+        return self._widget("slider", key or label, default, _within(min_value, max_value), (label,),
+                            {"min_value": min_value, "max_value": max_value, "value": value, "step": step, **kwargs})
+
+    def number_input(self, label, min_value=None, max_value=None, value="min", step=None, key=None, **kwargs):
+        default = (0.0 if min_value is None else min_value) if value == "min" else value
+        return self._widget("number_input", key or label, default, _within(min_value, max_value), (label,),
+                            {"min_value": min_value, "max_value": max_value, "value": value, "step": step, **kwargs})
+
+    def button(self, label, key=None, **kwargs):
+        return self._widget("button", key or label, False, (True, False).__contains__, (label,), kwargs)
+
+    def toggle(self, label, value=False, key=None, **kwargs):
+        return self._widget("toggle", key or label, value, (True, False).__contains__, (label,), {"value": value, **kwargs})
+
+    def checkbox(self, label, value=False, key=None, **kwargs):
+        return self._widget("checkbox", key or label, value, (True, False).__contains__, (label,), {"value": value, **kwargs})
+
+    def stop(self):
+        raise StopView()
+
+    # Layout
+    def _block(self, kind, n, args, kwargs):
+        slots = [_Slot(self) for _ in range(n)]
+        self._emit(("block", kind, args, kwargs, [s.ops for s in slots]))
+        return slots
+
+    def tabs(self, labels, **kwargs):
+        labels = list(labels)
+        return self._block("tabs", len(labels), (labels,), kwargs)
+
+    def columns(self, spec, **kwargs):
+        return self._block("columns", spec if isinstance(spec, int) else len(spec), (spec,), kwargs)
+
+    def expander(self, label, **kwargs):
+        return self._block("expander", 1, (label,), kwargs)[0]
+
+    def container(self, **kwargs):
+        return self._block("container", 1, (), kwargs)[0]
+
+    @contextmanager
+    def spinner(self, text="", **kwargs):
+        yield
+
+
+def _within(low, high):
+    """Validity test for a slider/number_input answer: a number (or range) inside the bounds."""
+    def valid(v):
+        values = v if isinstance(v, (tuple, list)) else (v,)
+        try:
+            return all((low is None or x >= low) and (high is None or x <= high) for x in values)
+        except TypeError:
+            return False
+    return valid
+
+
+class _Slot:
+    """One tab/column/expander of a ViewBuilder; `with slot:` and `slot.markdown(...)` both record into it."""
+
+    def __init__(self, builder):
+        self._builder = builder
+        self.ops = []
+        self._outer = []
+
+    def __enter__(self):
+        self._outer.append(self._builder._target)
+        self._builder._target = self.ops
+        return self
+
+    def __exit__(self, *exc):
+        self._builder._target = self._outer.pop()
+
+    def __getattr__(self, attr):
+        target = getattr(self._builder, attr)
+        if not callable(target):
+            return target
+
+        def call(*args, **kwargs):
+            with self:
+                return target(*args, **kwargs)
+        return call
+
+
+def components_html(st, body, **kwargs):
+    """streamlit.components.v1.html for tabs: recorded instead when st records it
+    (a ViewBuilder, or the headless harness when a tab is run on it directly)."""
+    _emit(st, "components_html", (body,), kwargs)
+
+
+# -----------------------------
+# Pages: fn(builder, tables) runs a tab the way main.py used to call it
+# -----------------------------
+def _season(ui, d):
+    from tab_season_insights import show_season_insights
+    show_season_insights(ui, go, d["teams"], d["matchups"], d["players"], d["draft_roster"],
+                         player_weeks=d["player_weeks"], team_weeks=d["team_weeks"],
+                         season_index=d["season_index"], records_index=d.get("records_index"))
+
+
+def _team(ui, d):
+    from tab_team_insights import show_team_insights
+    show_team_insights(ui, go, d["teams"], d["matchups"], d["players"],
+                       player_weeks=d["player_weeks"], team_weeks=d["team_weeks"],
+                       season_index=d["season_index"], owner_index=d["owner_index"])
+
+
+def _owner(ui, d):
+    from tab_owner_insights import show_owner_insights
+    show_owner_insights(ui, go, d["teams"], d["matchups"], d["players"],
+                        player_weeks=d["player_weeks"], team_weeks=d["team_weeks"],
+                        owner_index=d["owner_index"], positional_edge=d.get("positional_edge"),
+                        records_index=d.get("records_index"))
+
+
+def _league(ui, d):
+    from tab_league_insights import show_league_insights
+    show_league_insights(ui, go, d["teams"], d["matchups"], position_ranks=d.get("position_ranks"))
+
+
+def _hall_of_fame(ui, d):
+    from tab_hall_of_fame import show_hall_of_fame
+    show_hall_of_fame(ui, d["teams"], d["matchups"], d["players"],
+                      player_weeks=d["player_weeks"], team_weeks=d["team_weeks"],
+                      records_index=d.get("records_index"))
+
+
+def _draft(ui, d):
+    from tab_draft_board import show_draft_board
+    show_draft_board(ui, d["teams"], d["draft_roster"], d["players"], d["matchups"],
+                     player_weeks=d["player_weeks"], season_index=d["season_index"])
+
+
+# Page name -> fn(builder, tables)
+PAGES = {
+    "season": _season,
+    "team": _team,
+    "owner": _owner,
+    "league": _league,
+    "hall_of_fame": _hall_of_fame,
+    "draft": _draft,
+}
+
+
+def build_view(page, tables, selections=None):
+    """The view model of one page for the given widget selections ({key: value}); no st calls."""
+    ui = ViewBuilder(selections)
+    stopped = False
+    try:
+        PAGES[page](ui, tables)
+    except StopView:
+        stopped = True
+    return {"page": page, "selections": ui.widgets, "ops": ui.ops, "stopped": stopped}
+
+
+# -----------------------------
+# Rendering
+# -----------------------------
+def _emit(st, method, args, kwargs):
+    if method == "components_html":
+        try:
+            emit = st.components_html  # the headless harness records it
+        except Exception:
+            emit = components.html
+        return emit(*args, **kwargs)
+    return getattr(st, method)(*args, **kwargs)
+
+
+def _replay(st, ops, start=0, top=True):
+    """Emit ops[start:]; returns (path, key, value) for the first widget that answered
+    differently from the view (the view is then out of date), else None. path is the
+    widget's op index, after the block and child indices of the containers it is in.
+
+    A top-level widget stops the replay there. One inside a block doesn't: the rest of
+    the view is still emitted, and later top-level answers are no longer checked."""
+    changed = None
+    for i in range(start, len(ops)):
+        op = ops[i]
+        kind, method, args, kwargs = op[:4]
+        if kind == "element":
+            _emit(st, method, args, kwargs)
+        elif kind == "widget":
+            value = getattr(st, method)(*args, **kwargs)
+            if value != op[5] and changed is None:
+                if top:
+                    return (i,), op[4], value
+                changed = (i,), op[4], value
+        else:
+            containers = getattr(st, method)(*args, **kwargs)
+            if method in ("expander", "container"):
+                containers = [containers]
+            for c, (container, child_ops) in enumerate(zip(containers, op[4])):
+                with container:
+                    inner = _replay(container, child_ops, top=False)
+                if inner is not None and changed is None:
+                    changed = (i, c, *inner[0]), inner[1], inner[2]
+    return changed
+
+
+def render_view(st, view, start=0):
+    """Emit a built view on st. Returns None, or (path, key, value) when a widget
+    came back with another value than the view was built for; see show_page."""
+    changed = _replay(st, view["ops"], start)
+    if changed is None and view["stopped"]:
+        st.stop()
+    return changed
+
+
+# session_state entry: the nested widget answer show_page last reran the script for
+RERUN_KEY = "_view_model_rerun"
+
+
+def show_page(st, page, tables, build=build_view):
+    """Build and render a page for the current widget state of st.
+
+    Widgets normally answer what session_state already holds, which is what the
+    view was built for. If one doesn't (first visit, a stale key), the view is
+    rebuilt for that answer and rendering carries on after the widget. A widget
+    inside a tab/column/expander can't be continued from (its containers are
+    already on screen), so the script is rerun; session_state has its answer by then.
+    That happens once per answer: if the rebuilt view still disagrees, the page is
+    left as rendered rather than rerun forever.
+    """
+    selections = getattr(st, "session_state", {})
+    index = 0
+    while True:
+        start = time.perf_counter()
+        view = build(page, tables, selections)
+        add_section(page, "build view", start, time.perf_counter() - start)
+        start = time.perf_counter()
+        changed = render_view(st, view, index)
+        add_section(page, "render view", start, time.perf_counter() - start)
+        if changed is None:
+            return view
+        path, key, value = changed
+        if len(path) > 1:
+            if st.session_state.get(RERUN_KEY) == (page, key, value):
+                return view
+            st.session_state[RERUN_KEY] = (page, key, value)
+            st.rerun()
+        selections = {**view["selections"], key: value}
+        index = path[0] + 1